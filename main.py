@@ -13,13 +13,6 @@ Pipeline stages will be wired in Phase 9.
 import logging
 import sys
 
-from cer_scraper.config import EmailSettings, PipelineSettings, ScraperSettings
-from cer_scraper.db import (
-    get_engine,
-    get_session_factory,
-    get_unprocessed_filings,
-    init_db,
-)
 from cer_scraper.logging import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -27,6 +20,16 @@ logger = logging.getLogger(__name__)
 
 def main() -> None:
     """Run the CER REGDOCS Filing Monitor pipeline."""
+    # Heavy imports (pydantic-settings, SQLAlchemy ORM) are deferred to here
+    # so importing this module -- or a future --help path -- stays fast.
+    from cer_scraper.config import EmailSettings, PipelineSettings, ScraperSettings
+    from cer_scraper.db import (
+        count_unprocessed_filings,
+        get_engine,
+        get_session_factory,
+        init_db,
+    )
+
     # 1. Load pipeline config first -- needed for logging and database paths
     pipeline = PipelineSettings()
 
@@ -64,7 +67,12 @@ def main() -> None:
     )
 
     # 4. Initialize database
-    engine = get_engine(pipeline.db_path)
+    engine = get_engine(
+        pipeline.db_path,
+        pool_size=pipeline.db_pool_size,
+        max_overflow=pipeline.db_max_overflow,
+        busy_timeout_seconds=pipeline.db_busy_timeout_seconds,
+    )
     init_db(engine)
     session_factory = get_session_factory(engine)
 
@@ -72,12 +80,12 @@ def main() -> None:
 
     # 5. Report readiness
     with session_factory() as session:
-        unprocessed = get_unprocessed_filings(
+        unprocessed = count_unprocessed_filings(
             session, max_retries=pipeline.max_retry_count
         )
         logger.info(
             "Application ready -- %s unprocessed filing(s) in queue",
-            len(unprocessed),
+            unprocessed,
         )
 
     # --- Pipeline stages will be wired here in Phase 9 ---
@@ -14,21 +14,38 @@ Public API:
 
 from __future__ import annotations
 
-import json
+import datetime
+import glob
+import hashlib
+import io
+import itertools
 import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from pathlib import Path
 
-from cer_scraper.analyzer.service import analyze_filing_text
+import frontmatter
+import yaml
+
+from cer_scraper.analyzer.service import analyze_filing_text, get_prompt_version
 from cer_scraper.analyzer.types import AnalysisResult
 from cer_scraper.config.settings import AnalysisSettings
+from cer_scraper.db.compression import compress_analysis_json
+from cer_scraper.db.engine import expire_on_commit_disabled
 from cer_scraper.db.models import Filing
-from cer_scraper.db.state import get_filings_for_analysis, mark_step_complete
+from cer_scraper.db.state import (
+    get_filings_for_analysis,
+    mark_step_complete,
+    skip_filings_without_text,
+)
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["analyze_filings", "AnalysisBatchResult"]
 
+# Number of filings whose status updates share a single commit
+COMMIT_BATCH_SIZE = 10
+
 
 @dataclass
 class AnalysisBatchResult:
@@ -42,46 +59,97 @@ class AnalysisBatchResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _read_document_text(doc) -> str | None:
+    """Return a document's extracted markdown body.
+
+    The extractor stores text only in the ``.md`` file written next to the
+    PDF; rows from older databases may still carry it in ``extracted_text``.
+
+    Args:
+        doc: Document ORM object.
+
+    Returns:
+        The markdown body without its frontmatter, or None if the file is
+        missing, unreadable, or has a malformed frontmatter header.
+    """
+    if doc.extracted_text:
+        return doc.extracted_text
+    if not doc.local_path:
+        return None
+    md_path = os.path.splitext(doc.local_path)[0] + ".md"
+    try:
+        return frontmatter.load(md_path).content
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning("Cannot read extracted text %s: %s", md_path, e)
+        return None
+
+
 def assemble_filing_text(
     documents: list,
-) -> tuple[str, int, int]:
+) -> tuple[str, int, int, int]:
     """Concatenate extracted document texts with delimiter headers.
 
     Iterates over a filing's Document ORM objects.  For each document with
-    ``extraction_status == "success"`` and non-empty ``extracted_text``,
-    builds a delimited section::
+    ``extraction_status == "success"`` and non-empty extracted text (read
+    from its ``.md`` file), builds a delimited section::
 
         --- Document 1: report.pdf (42 pages) ---
 
         <extracted text>
 
+    A document whose text is identical to an earlier one (reprinted cover
+    letters, duplicated attachments) gets only its header, noting which
+    document it repeats, so the same text is not sent to the LLM twice.
     Documents without successful extraction are counted as missing.
 
     Args:
         documents: List of Document ORM objects (eagerly loaded).
 
     Returns:
-        Tuple of (combined_text, included_count, missing_count).
+        Tuple of (combined_text, included_count, missing_count,
+        duplicate_count).  Duplicates are included in ``included_count``.
     """
-    parts: list[str] = []
+    # Write straight into one buffer so each document's text is copied once,
+    # rather than into a per-document f-string and again by a final join.
+    buf = io.StringIO()
     included = 0
     missing = 0
+    duplicates = 0
+    # Keyed by the text itself: dict lookup hashes it once and compares
+    # contents on a hash match, so only exact duplicates are dropped.
+    seen: dict[str, int] = {}
 
     for idx, doc in enumerate(documents, start=1):
-        if doc.extraction_status == "success" and doc.extracted_text:
+        text = (
+            _read_document_text(doc)
+            if doc.extraction_status == "success"
+            else None
+        )
+        if text:
             filename = doc.filename or "unknown.pdf"
             pages = doc.page_count or "?"
-            header = f"--- Document {idx}: {filename} ({pages} pages) ---"
-            parts.append(f"{header}\n\n{doc.extracted_text}")
+            if included:
+                buf.write("\n\n")
             included += 1
+
+            first_idx = seen.setdefault(text, idx)
+            if first_idx != idx:
+                buf.write(
+                    f"--- Document {idx}: {filename} ({pages} pages) ---\n\n"
+                    f"(duplicate of Document {first_idx}, content omitted)"
+                )
+                duplicates += 1
+                continue
+
+            buf.write(f"--- Document {idx}: {filename} ({pages} pages) ---\n\n")
+            buf.write(text)
         else:
             missing += 1
 
-    combined = "\n\n".join(parts)
-    return (combined, included, missing)
+    return (buf.getvalue(), included, missing, duplicates)
 
 
-def _save_analysis_json(filing_dir: Path, analysis_json: dict) -> None:
+def _save_analysis_json(filing_dir: str, analysis_bytes: bytes) -> None:
     """Write analysis JSON to the filing's directory on disk.
 
     Saves ``analysis.json`` alongside the downloaded documents.  This
@@ -89,110 +157,322 @@ def _save_analysis_json(filing_dir: Path, analysis_json: dict) -> None:
 
     Args:
         filing_dir: Path to the filing's document directory.
-        analysis_json: Validated analysis output dict.
+        analysis_bytes: Validated analysis output, already serialized to
+            compact UTF-8 JSON (the same bytes stored in the database).
     """
-    output_path = filing_dir / "analysis.json"
-    output_path.write_text(
-        json.dumps(analysis_json, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    output_path = os.path.join(filing_dir, "analysis.json")
+    with open(output_path, "wb") as f:
+        f.write(analysis_bytes)
     logger.info("Saved analysis JSON to %s", output_path)
 
 
-def _get_filing_dir(filing: Filing) -> Path | None:
+def _analysis_cache_key(text: str, settings: AnalysisSettings) -> str:
+    """Key a filing's analysis by everything that shapes the prompt output.
+
+    Covers the combined document text, the prompt template version, the
+    model, and the analysis date (the prompt asks Claude to classify dates
+    as past/upcoming relative to it).
+
+    Args:
+        text: Combined document text sent to Claude.
+        settings: Analysis configuration.
+
+    Returns:
+        32-hex-character BLAKE2b digest.
+    """
+    h = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    h.update(
+        "\0".join(
+            (
+                get_prompt_version(settings),
+                settings.model,
+                datetime.date.today().isoformat(),
+            )
+        ).encode()
+    )
+    return h.hexdigest()
+
+
+def _load_cached_analysis(filing_dir: str, cache_key: str) -> bytes | None:
+    """Return a previously saved analysis for *cache_key*, if present.
+
+    Args:
+        filing_dir: Path to the filing's document directory.
+        cache_key: Key from :func:`_analysis_cache_key`.
+
+    Returns:
+        The cached analysis JSON bytes, or None on a miss.
+    """
+    cache_path = os.path.join(filing_dir, f"analysis.{cache_key}.json")
+    try:
+        with open(cache_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _save_cached_analysis(
+    filing_dir: str, cache_key: str, analysis_bytes: bytes
+) -> None:
+    """Save an analysis under its cache key, replacing older cache entries.
+
+    Args:
+        filing_dir: Path to the filing's document directory.
+        cache_key: Key from :func:`_analysis_cache_key`.
+        analysis_bytes: Serialized analysis JSON.
+    """
+    cache_name = f"analysis.{cache_key}.json"
+    pattern = os.path.join(glob.escape(filing_dir), "analysis.*.json")
+    for stale in glob.glob(pattern):
+        if os.path.basename(stale) != cache_name:
+            os.remove(stale)
+    with open(os.path.join(filing_dir, cache_name), "wb") as f:
+        f.write(analysis_bytes)
+
+
+def _get_filing_dir(filing: Filing) -> str | None:
     """Determine the filing's document directory from its downloaded files.
 
     Looks for the first document with a ``local_path`` and returns its
     parent directory.  Returns None if no document has a local path.
+    A plain string is returned (no ``Path`` allocation); it is only joined
+    with a filename when ``analysis.json`` is actually written.
 
     Args:
         filing: Filing ORM object with eagerly loaded documents.
 
     Returns:
-        Path to the filing directory, or None.
+        Filing directory path string, or None.
     """
     for doc in filing.documents:
         if doc.local_path:
-            return Path(doc.local_path).parent
+            return os.path.dirname(doc.local_path)
     return None
 
 
+@dataclass(frozen=True)
+class _FilingSnapshot:
+    """Plain-data copy of everything a worker needs to analyze a filing.
+
+    Built on the main thread so worker threads never touch ORM objects.
+    """
+
+    filing_id: str
+    filing_date: str
+    applicant: str
+    filing_type: str
+    filing_dir: str | None
+    document_count: int
+    combined_text: str
+    included_count: int
+    missing_count: int
+    duplicate_count: int
+
+
+@dataclass
+class _FilingOutcome:
+    """Result of analyzing one filing, ready to be persisted."""
+
+    success: bool
+    error: str | None = None
+    was_skipped: bool = False
+    cost_usd: float = 0.0
+    analysis_bytes: bytes | None = None
+
+
+def _snapshot_filing(filing: Filing) -> _FilingSnapshot:
+    """Copy a filing's analysis inputs out of the ORM object.
+
+    Args:
+        filing: Filing ORM object with eagerly loaded documents.
+
+    Returns:
+        Detached snapshot safe to hand to a worker thread.
+    """
+    combined_text, included_count, missing_count, duplicate_count = (
+        assemble_filing_text(filing.documents)
+    )
+    return _FilingSnapshot(
+        filing_id=filing.filing_id,
+        filing_date=str(filing.date or ""),
+        applicant=filing.applicant or "",
+        filing_type=filing.filing_type or "",
+        filing_dir=_get_filing_dir(filing),
+        document_count=len(filing.documents),
+        combined_text=combined_text,
+        included_count=included_count,
+        missing_count=missing_count,
+        duplicate_count=duplicate_count,
+    )
+
+
 def _analyze_single_filing(
-    session,
-    filing: Filing,
+    snapshot: _FilingSnapshot,
     settings: AnalysisSettings,
-) -> tuple[bool, str | None, bool, float]:
-    """Analyze a single filing and persist the result.
+) -> _FilingOutcome:
+    """Analyze a single filing and save its analysis.json.
 
-    Assembles document text, calls the analysis service, saves results
-    to disk and database.
+    Runs on a worker thread: it calls the analysis service and writes to
+    disk, but performs no database access.  The caller persists the
+    returned outcome.
 
     Args:
-        session: Active SQLAlchemy session.
-        filing: Filing ORM object with eagerly loaded documents.
+        snapshot: Detached filing data from :func:`_snapshot_filing`.
         settings: Analysis configuration.
 
     Returns:
-        Tuple of (success, error_message, was_skipped, cost_usd).
+        _FilingOutcome with success/skip flags, error, cost, and the
+        serialized analysis JSON on success.
     """
-    combined_text, included_count, missing_count = assemble_filing_text(
-        filing.documents
-    )
+    if snapshot.duplicate_count:
+        logger.info(
+            "Filing %s: omitted text of %d duplicate documents",
+            snapshot.filing_id,
+            snapshot.duplicate_count,
+        )
 
-    # No extracted documents -- vacuous success, skip
-    if included_count == 0:
+    # No extracted documents -- vacuous success, skip.  The query already
+    # excludes such filings; this guards callers that pass their own.
+    if snapshot.included_count == 0:
         logger.info(
             "Filing %s has no extracted documents, skipping analysis",
-            filing.filing_id,
+            snapshot.filing_id,
         )
-        return (True, None, True, 0.0)
+        return _FilingOutcome(success=True, was_skipped=True)
+
+    # A retry with unchanged inputs reuses the earlier result instead of
+    # paying for another Claude CLI call.
+    cache_key = None
+    if snapshot.filing_dir:
+        cache_key = _analysis_cache_key(snapshot.combined_text, settings)
+        cached = _load_cached_analysis(snapshot.filing_dir, cache_key)
+        if cached is not None:
+            logger.info(
+                "Filing %s: reusing cached analysis (inputs unchanged)",
+                snapshot.filing_id,
+            )
+            return _FilingOutcome(success=True, analysis_bytes=cached)
 
     # Invoke Claude CLI analysis
     result: AnalysisResult = analyze_filing_text(
-        filing_id=filing.filing_id,
-        filing_date=str(filing.date or ""),
-        applicant=filing.applicant or "",
-        filing_type=filing.filing_type or "",
-        document_text=combined_text,
-        num_documents=included_count,
-        num_missing=missing_count,
+        filing_id=snapshot.filing_id,
+        filing_date=snapshot.filing_date,
+        applicant=snapshot.applicant,
+        filing_type=snapshot.filing_type,
+        document_text=snapshot.combined_text,
+        num_documents=snapshot.included_count,
+        num_missing=snapshot.missing_count,
         settings=settings,
     )
 
     cost = result.cost_usd or 0.0
 
     if result.success:
+        # Serialize once, straight to JSON in pydantic-core; the same
+        # compact bytes go to disk and database
+        analysis_bytes = result.analysis.model_dump_json().encode()
+
         # Persist to disk (best-effort -- disk failure should not fail analysis)
-        filing_dir = _get_filing_dir(filing)
-        if filing_dir and result.analysis_json:
+        if snapshot.filing_dir:
             try:
-                _save_analysis_json(filing_dir, result.analysis_json)
+                _save_analysis_json(snapshot.filing_dir, analysis_bytes)
+                if cache_key is not None:
+                    _save_cached_analysis(
+                        snapshot.filing_dir, cache_key, analysis_bytes
+                    )
             except OSError:
                 logger.warning(
                     "Filing %s: failed to save analysis.json to disk",
-                    filing.filing_id,
+                    snapshot.filing_id,
                     exc_info=True,
                 )
 
-        # Persist to database
-        filing.analysis_json = json.dumps(
-            result.analysis_json, ensure_ascii=False
+        return _FilingOutcome(
+            success=True, cost_usd=cost, analysis_bytes=analysis_bytes
         )
-        return (True, None, False, cost)
 
     # Insufficient text -- skip, not failure
     if result.error == "insufficient_text":
+        return _FilingOutcome(success=True, was_skipped=True, cost_usd=cost)
+
+    # Actual failure -- logged by the caller once the status is recorded
+    return _FilingOutcome(success=False, error=result.error, cost_usd=cost)
+
+
+def _record_outcome(
+    session,
+    filing: Filing,
+    outcome: _FilingOutcome,
+    batch: AnalysisBatchResult,
+) -> None:
+    """Persist one filing's outcome and fold it into the batch totals.
+
+    Runs on the main thread.  The writes happen inside a savepoint, so an
+    exception rolls back only this filing, not the rest of the uncommitted
+    batch.
+
+    Args:
+        session: Active SQLAlchemy session.
+        filing: Filing ORM object the outcome belongs to.
+        outcome: Result returned by :func:`_analyze_single_filing`.
+        batch: Batch statistics to update.
+    """
+    with session.begin_nested():
+        if outcome.success:
+            if outcome.analysis_bytes is not None:
+                filing.analysis_json = compress_analysis_json(
+                    outcome.analysis_bytes
+                )
+            mark_step_complete(
+                session,
+                filing.filing_id,
+                "analyzed",
+                "success",
+                commit=False,
+                filing=filing,
+            )
+        else:
+            error = outcome.error or "Analysis failed"
+            mark_step_complete(
+                session,
+                filing.filing_id,
+                "analyzed",
+                "failed",
+                error=error,
+                commit=False,
+                filing=filing,
+            )
+
+    batch.total_cost_usd += outcome.cost_usd
+
+    # One record per filing, emitted once its status is set
+    if outcome.success and outcome.was_skipped:
+        # Vacuous success -- no documents or insufficient text
+        batch.filings_skipped += 1
         logger.info(
-            "Filing %s: insufficient text for analysis, skipping",
+            "Filing %s analysis skipped (vacuous success, %d documents)",
             filing.filing_id,
+            len(filing.documents),
         )
-        return (True, None, True, cost)
 
-    # Actual failure
-    logger.warning(
-        "Filing %s analysis failed: %s", filing.filing_id, result.error
-    )
-    return (False, result.error, False, cost)
+    elif outcome.success:
+        batch.filings_succeeded += 1
+        logger.info(
+            "Filing %s analysis complete (%d documents, $%.4f)",
+            filing.filing_id,
+            len(filing.documents),
+            outcome.cost_usd,
+        )
+
+    else:
+        batch.filings_failed += 1
+        batch.errors.append(f"Filing {filing.filing_id}: {error}")
+        logger.warning(
+            "Filing %s analysis failed (%d documents): %s",
+            filing.filing_id,
+            len(filing.documents),
+            error,
+        )
 
 
 def analyze_filings(
@@ -202,8 +482,13 @@ def analyze_filings(
     """Analyze all filings pending LLM analysis.
 
     Queries filings that have been extracted but not yet analyzed, then
-    processes each one independently.  Per-filing error isolation ensures
-    one filing failure does not block others.
+    processes each one independently.  Up to ``analysis_settings.max_workers``
+    Claude CLI calls run concurrently on worker threads; the session is
+    only used on the calling thread, where each result is persisted as it
+    arrives.  Per-filing error isolation ensures one filing failure does not
+    block others: each filing's writes run inside a savepoint, and status
+    updates are committed every ``COMMIT_BATCH_SIZE`` filings and once more
+    at the end.
 
     Args:
         session: Active SQLAlchemy session.
@@ -216,96 +501,103 @@ def analyze_filings(
     max_retries = 3
 
     try:
-        filings = get_filings_for_analysis(session, max_retries)
-
-        if not filings:
+        # Filings with no extracted text are a vacuous success -- mark them
+        # in one UPDATE rather than loading and iterating each one.
+        skipped = skip_filings_without_text(session, max_retries)
+        if skipped:
+            batch.filings_attempted += skipped
+            batch.filings_skipped += skipped
+            logger.info(
+                "Skipped %d filings with no extracted documents", skipped
+            )
+
+        # Filings are streamed in chunks; peek so an empty queue returns
+        # before the worker pool is started.
+        pending_filings = get_filings_for_analysis(session, max_retries)
+        first = next(pending_filings, None)
+        if first is None:
             logger.info("No filings pending analysis")
             return batch
-
-        logger.info("Found %d filings pending analysis", len(filings))
-
-        for filing in filings:
-            batch.filings_attempted += 1
-
-            try:
-                logger.info(
-                    "Analyzing filing %s (%d documents)",
-                    filing.filing_id,
-                    len(filing.documents),
-                )
-
-                success, error_msg, was_skipped, cost = (
-                    _analyze_single_filing(
-                        session, filing, analysis_settings
-                    )
-                )
-                batch.total_cost_usd += cost
-
-                if success and was_skipped:
-                    # Vacuous success -- no documents or insufficient text
-                    mark_step_complete(
-                        session, filing.filing_id, "analyzed", "success"
-                    )
-                    session.commit()
-                    batch.filings_skipped += 1
-                    logger.info(
-                        "Filing %s analysis skipped (vacuous success)",
-                        filing.filing_id,
-                    )
-
-                elif success:
-                    mark_step_complete(
-                        session, filing.filing_id, "analyzed", "success"
-                    )
-                    session.commit()
-                    batch.filings_succeeded += 1
-                    logger.info(
-                        "Filing %s analysis complete",
-                        filing.filing_id,
-                    )
-
-                else:
-                    error = error_msg or "Analysis failed"
-                    mark_step_complete(
-                        session,
-                        filing.filing_id,
-                        "analyzed",
-                        "failed",
-                        error=error,
-                    )
-                    session.commit()
-                    batch.filings_failed += 1
-                    batch.errors.append(
-                        f"Filing {filing.filing_id}: {error}"
-                    )
-                    logger.warning(
-                        "Filing %s analysis failed: %s",
-                        filing.filing_id,
-                        error,
-                    )
-
-            except Exception:
-                logger.exception(
-                    "Unexpected error analyzing filing %s", filing.filing_id
-                )
-                try:
-                    session.rollback()
-                    mark_step_complete(
-                        session,
-                        filing.filing_id,
-                        "analyzed",
-                        "failed",
-                        error="Unexpected error",
-                    )
-                except Exception:
-                    logger.exception(
-                        "Failed to update status for filing %s",
-                        filing.filing_id,
-                    )
-                batch.filings_failed += 1
-                batch.errors.append(
-                    f"Filing {filing.filing_id}: unexpected error"
-                )
+        pending_filings = itertools.chain((first,), pending_filings)
+
+        max_workers = max(1, analysis_settings.max_workers)
+        in_flight: dict[Future[_FilingOutcome], Filing] = {}
+        completed = 0
+
+        # Documents were eagerly loaded above; keep them loaded across the
+        # batch commits instead of lazily re-querying each filing.
+        with (
+            expire_on_commit_disabled(session),
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="analyzer"
+            ) as executor,
+        ):
+
+            def submit_next() -> None:
+                # Snapshots are built lazily so only the filings in flight
+                # hold a second copy of their combined text.
+                for filing in pending_filings:
+                    batch.filings_attempted += 1
+                    try:
+                        snapshot = _snapshot_filing(filing)
+                    except Exception:
+                        logger.exception(
+                            "Unexpected error preparing filing %s",
+                            filing.filing_id,
+                        )
+                        future: Future[_FilingOutcome] = Future()
+                        future.set_result(
+                            _FilingOutcome(success=False, error="Unexpected error")
+                        )
+                    else:
+                        future = executor.submit(
+                            _analyze_single_filing, snapshot, analysis_settings
+                        )
+                    in_flight[future] = filing
+                    return
+
+            for _ in range(max_workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    filing = in_flight.pop(future)
+                    submit_next()
+
+                    try:
+                        _record_outcome(session, filing, future.result(), batch)
+                    except Exception:
+                        logger.exception(
+                            "Unexpected error analyzing filing %s",
+                            filing.filing_id,
+                        )
+                        try:
+                            mark_step_complete(
+                                session,
+                                filing.filing_id,
+                                "analyzed",
+                                "failed",
+                                error="Unexpected error",
+                                commit=False,
+                                filing=filing,
+                            )
+                        except Exception:
+                            logger.exception(
+                                "Failed to update status for filing %s",
+                                filing.filing_id,
+                            )
+                        batch.filings_failed += 1
+                        batch.errors.append(
+                            f"Filing {filing.filing_id}: unexpected error"
+                        )
+
+                    # Amortize commit/fsync cost over several filings
+                    completed += 1
+                    if completed % COMMIT_BATCH_SIZE == 0:
+                        session.commit()
+
+            session.commit()
 
     except Exception:
         logger.exception("Fatal error in analysis orchestrator")
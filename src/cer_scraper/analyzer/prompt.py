@@ -8,32 +8,43 @@ filing data and document text.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
+import re
 from pathlib import Path
+from typing import Final
 
 logger = logging.getLogger(__name__)
 
+# str.format syntax in the template: escaped braces and ``{name}`` fields
+_FORMAT_TOKEN_RE = re.compile(r"\{\{|\}\}|\{(\w+)\}")
 
-def load_prompt_template(template_path: Path) -> tuple[str, str]:
-    """Load prompt template from disk and compute its version hash.
+# Placeholder whose value is streamed separately rather than substituted
+_DOCUMENT_TEXT_FIELD = "document_text"
 
-    Args:
-        template_path: Absolute or relative path to the template file.
+# Compiled template: (literal_text, field_name) pairs, where field_name is
+# the placeholder following the literal (None for the trailing literal).
+_Segments = tuple[tuple[str, str | None], ...]
 
-    Returns:
-        Tuple of (template_content, version_hash) where version_hash is
-        the first 12 hex characters of the SHA-256 digest.
 
-    Raises:
-        FileNotFoundError: If the template file does not exist.
-    """
-    if not template_path.exists():
-        msg = f"Prompt template not found: {template_path}"
-        raise FileNotFoundError(msg)
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[str, str]:
+    """Read and hash a template file, memoized on its stat signature.
 
+    The ``mtime_ns`` and ``size`` arguments are part of the cache key only,
+    so an edited template produces a fresh entry while an unchanged one is
+    served from memory for the rest of the batch.
+    """
+    template_path = Path(path_str)
     content = template_path.read_text(encoding="utf-8")
-    version_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    # Traceability tag only -- no cryptographic strength needed.  BLAKE2b
+    # with a 6-byte digest yields 12 hex chars without a truncated SHA-256.
+    version_hash = hashlib.blake2b(
+        content.encode("utf-8"), digest_size=6
+    ).hexdigest()
     logger.info(
         "Loaded prompt template: %s (version %s, %d chars)",
         template_path.name,
@@ -43,18 +54,34 @@ def load_prompt_template(template_path: Path) -> tuple[str, str]:
     return content, version_hash
 
 
-def get_json_schema_description() -> str:
-    """Return a human-readable JSON schema description for Claude.
+def load_prompt_template(template_path: Path) -> tuple[str, str]:
+    """Load prompt template from disk and compute its version hash.
 
-    The description matches the AnalysisOutput Pydantic model fields
-    exactly, including CER-specific taxonomy, entity types, and role
-    options.  Formatted as a readable JSON example with inline comments
-    rather than formal JSON Schema spec -- optimised for LLM consumption.
+    Results are cached by ``(path, mtime_ns, size)`` so repeated calls
+    within a batch skip the file read and hash unless the template changed.
+
+    Args:
+        template_path: Absolute or relative path to the template file.
 
     Returns:
-        Multi-line string describing the expected JSON output structure.
+        Tuple of (template_content, version_hash) where version_hash is
+        a 12-hex-character BLAKE2b digest of the template content.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
     """
-    return """\
+    try:
+        stat = template_path.stat()
+    except FileNotFoundError:
+        msg = f"Prompt template not found: {template_path}"
+        raise FileNotFoundError(msg) from None
+
+    return _load_cached(str(template_path), stat.st_mtime_ns, stat.st_size)
+
+
+# Human-readable schema description embedded in every prompt.  Built once
+# at import time; get_json_schema_description() returns this object.
+_JSON_SCHEMA_DESCRIPTION: Final[str] = """\
 {
   "summary": "2-3 sentence plain-language overview of the filing.",
 
@@ -119,6 +146,143 @@ def get_json_schema_description() -> str:
 }"""
 
 
+@functools.lru_cache(maxsize=8)
+def _compile_template(template: str) -> _Segments:
+    """Parse a ``str.format``-style template into literal/placeholder pairs.
+
+    The template is scanned once per distinct template string; filling it
+    afterwards is a plain join, with no rescan of the template text and no
+    interpretation of braces inside substituted values.
+
+    Args:
+        template: Raw template string with ``{variable}`` placeholders.
+
+    Returns:
+        Tuple of ``(literal_text, field_name)`` segments.  ``{{`` and
+        ``}}`` are unescaped into the literal text; the last segment's
+        field name is None.
+    """
+    segments: list[tuple[str, str | None]] = []
+    literal: list[str] = []
+    pos = 0
+    for match in _FORMAT_TOKEN_RE.finditer(template):
+        literal.append(template[pos : match.start()])
+        pos = match.end()
+        name = match.group(1)
+        if name is None:
+            literal.append(match.group(0)[0])  # Escaped brace
+        else:
+            segments.append(("".join(literal), name))
+            literal = []
+    literal.append(template[pos:])
+    segments.append(("".join(literal), None))
+    return tuple(segments)
+
+
+@functools.lru_cache(maxsize=8)
+def _split_template(template: str) -> tuple[_Segments, _Segments]:
+    """Split a compiled template around its ``{document_text}`` placeholder.
+
+    Args:
+        template: Raw template string with ``{variable}`` placeholders.
+
+    Returns:
+        Tuple of (head, tail) segments preceding and following the
+        document text.
+
+    Raises:
+        ValueError: If ``{document_text}`` does not appear exactly once.
+    """
+    segments = _compile_template(template)
+    positions = [
+        i for i, (_, name) in enumerate(segments) if name == _DOCUMENT_TEXT_FIELD
+    ]
+    if len(positions) != 1:
+        msg = "Prompt template must contain {document_text} exactly once"
+        raise ValueError(msg)
+    i = positions[0]
+    head = segments[:i] + ((segments[i][0], None),)
+    return head, segments[i + 1 :]
+
+
+def _fill(segments: _Segments, values: dict[str, object]) -> str:
+    """Join compiled segments with their placeholder values.
+
+    Raises:
+        KeyError: If a placeholder has no value (as ``str.format`` would).
+    """
+    parts: list[str] = []
+    for literal, name in segments:
+        parts.append(literal)
+        if name is not None:
+            parts.append(str(values[name]))
+    return "".join(parts)
+
+
+def get_json_schema_description() -> str:
+    """Return a human-readable JSON schema description for Claude.
+
+    The description matches the AnalysisOutput Pydantic model fields
+    exactly, including CER-specific taxonomy, entity types, and role
+    options.  Formatted as a readable JSON example with inline comments
+    rather than formal JSON Schema spec -- optimised for LLM consumption.
+
+    Returns:
+        Multi-line string describing the expected JSON output structure.
+    """
+    return _JSON_SCHEMA_DESCRIPTION
+
+
+def build_prompt_parts(
+    template: str,
+    filing_id: str,
+    filing_date: str | None,
+    applicant: str | None,
+    filing_type: str | None,
+    num_documents: int,
+    num_missing: int,
+    json_schema_description: str,
+    analysis_date: str,
+) -> tuple[str, str]:
+    """Fill every template placeholder except ``{document_text}``.
+
+    Returns the prompt text before and after the document text so callers
+    can stream ``prefix``, the (potentially multi-MB) document text, and
+    ``suffix`` to the Claude CLI without building the full prompt string.
+
+    Args:
+        template: Raw template string with ``{variable}`` placeholders.
+        filing_id: CER filing identifier (e.g. ``"C12345"``).
+        filing_date: Filing date string, or None/empty for "Unknown".
+        applicant: Applicant name, or None/empty for "Unknown".
+        filing_type: Filing type label, or None/empty for "Unknown".
+        num_documents: Total number of documents in the filing.
+        num_missing: Number of documents unavailable for analysis.
+        json_schema_description: Output from :func:`get_json_schema_description`.
+        analysis_date: Today's date in ISO 8601 format (e.g. ``"2026-02-16"``).
+                       Used by the LLM to determine temporal_status of
+                       extracted dates (past/upcoming/today).
+
+    Returns:
+        Tuple of (prefix, suffix) surrounding the document text.
+
+    Raises:
+        ValueError: If ``{document_text}`` does not appear exactly once.
+    """
+    head, tail = _split_template(template)
+    values = {
+        "filing_id": filing_id,
+        "filing_date": filing_date or "Unknown",
+        "applicant": applicant or "Unknown",
+        "filing_type": filing_type or "Unknown",
+        "num_documents": num_documents,
+        "num_missing": num_missing,
+        "json_schema_description": json_schema_description,
+        "analysis_date": analysis_date,
+    }
+    return _fill(head, values), _fill(tail, values)
+
+
 def build_prompt(
     template: str,
     filing_id: str,
@@ -133,6 +297,9 @@ def build_prompt(
 ) -> str:
     """Fill template placeholders with filing data and document text.
 
+    Convenience wrapper over :func:`build_prompt_parts` for callers that
+    need the prompt as a single string.
+
     Args:
         template: Raw template string with ``{variable}`` placeholders.
         filing_id: CER filing identifier (e.g. ``"C12345"``).
@@ -150,14 +317,15 @@ def build_prompt(
     Returns:
         The fully populated prompt string ready for Claude CLI.
     """
-    return template.format(
+    prefix, suffix = build_prompt_parts(
+        template=template,
         filing_id=filing_id,
-        filing_date=filing_date or "Unknown",
-        applicant=applicant or "Unknown",
-        filing_type=filing_type or "Unknown",
-        document_text=document_text,
+        filing_date=filing_date,
+        applicant=applicant,
+        filing_type=filing_type,
         num_documents=num_documents,
         num_missing=num_missing,
         json_schema_description=json_schema_description,
         analysis_date=analysis_date,
     )
+    return f"{prefix}{document_text}{suffix}"
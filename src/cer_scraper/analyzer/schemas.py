@@ -6,10 +6,47 @@ All analysis JSON must validate against AnalysisOutput before being
 accepted and persisted.
 """
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Closed vocabularies from the prompt's schema description.  Literal fields
+# enforce them and validate with a set-membership check in pydantic-core.
+EntityType = Literal["company", "facility", "location", "regulatory_reference"]
+DocumentType = Literal[
+    "Application",
+    "Order",
+    "Decision",
+    "Compliance Filing",
+    "Correspondence",
+    "Notice",
+    "Conditions Compliance",
+    "Financial Submission",
+    "Safety Report",
+    "Environmental Assessment",
+]
+DateType = Literal[
+    "deadline", "hearing", "comment_period", "effective", "filing", "other"
+]
+TemporalStatus = Literal["past", "upcoming", "today"]
+SentimentCategory = Literal[
+    "routine", "notable", "urgent", "adversarial", "cooperative"
+]
+
+
+class _AnalysisModel(BaseModel):
+    """Base for analysis output models.
+
+    Validated output is read-only once accepted, and fields Claude adds
+    beyond the schema are dropped during validation rather than stored.
+    Core schemas are built on first use rather than at import, so
+    processes that never analyze a filing skip that cost.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
 
 
-class EntityRef(BaseModel):
+class EntityRef(_AnalysisModel):
     """A named entity extracted from filing text.
 
     Attributes:
@@ -22,11 +59,11 @@ class EntityRef(BaseModel):
     """
 
     name: str
-    type: str  # "company", "facility", "location", "regulatory_reference"
+    type: EntityType
     role: str | None = None  # "applicant", "intervener", "regulator", "contractor", etc.
 
 
-class Relationship(BaseModel):
+class Relationship(_AnalysisModel):
     """A structured relationship between entities.
 
     Represents a subject-predicate-object triple extracted from filing text,
@@ -45,7 +82,7 @@ class Relationship(BaseModel):
     context: str | None = None
 
 
-class Classification(BaseModel):
+class Classification(_AnalysisModel):
     """Document classification with CER-specific taxonomy.
 
     Attributes:
@@ -56,13 +93,13 @@ class Classification(BaseModel):
                        classification was chosen.
     """
 
-    primary_type: str
-    tags: list[str] = Field(default_factory=list)
+    primary_type: DocumentType
+    tags: list[str] = []
     confidence: int = Field(ge=0, le=100)
     justification: str
 
 
-class RegulatoryImplications(BaseModel):
+class RegulatoryImplications(_AnalysisModel):
     """Regulatory impact assessment for a CER filing.
 
     Describes the real-world regulatory significance of a filing:
@@ -77,10 +114,10 @@ class RegulatoryImplications(BaseModel):
     """
 
     summary: str
-    affected_parties: list[str] = Field(default_factory=list)
+    affected_parties: list[str] = []
 
 
-class ExtractedDate(BaseModel):
+class ExtractedDate(_AnalysisModel):
     """A date or temporal reference extracted from filing text.
 
     Uses str for the date field rather than datetime.date because CER
@@ -98,12 +135,12 @@ class ExtractedDate(BaseModel):
     """
 
     date: str
-    type: str  # "deadline", "hearing", "comment_period", "effective", "filing", "other"
+    type: DateType
     description: str
-    temporal_status: str  # "past", "upcoming", "today"
+    temporal_status: TemporalStatus
 
 
-class SentimentAssessment(BaseModel):
+class SentimentAssessment(_AnalysisModel):
     """Tone and urgency assessment of a CER filing.
 
     Captures both a categorical classification and a free-form nuance
@@ -116,11 +153,11 @@ class SentimentAssessment(BaseModel):
                 with procedural concerns".
     """
 
-    category: str  # "routine", "notable", "urgent", "adversarial", "cooperative"
+    category: SentimentCategory
     nuance: str
 
 
-class RepresentativeQuote(BaseModel):
+class RepresentativeQuote(_AnalysisModel):
     """A notable quote extracted from filing text.
 
     Selected quotes that capture key points, positions, or decisions
@@ -136,7 +173,7 @@ class RepresentativeQuote(BaseModel):
     source_location: str | None = None
 
 
-class ImpactScore(BaseModel):
+class ImpactScore(_AnalysisModel):
     """Significance rating for a CER filing.
 
     A 1-5 score indicating how much attention this filing warrants,
@@ -158,7 +195,7 @@ class ImpactScore(BaseModel):
     justification: str
 
 
-class AnalysisOutput(BaseModel):
+class AnalysisOutput(_AnalysisModel):
     """Complete analysis output for a CER REGDOCS filing.
 
     This is the top-level schema that Claude's analysis JSON must validate
@@ -206,7 +243,7 @@ class AnalysisOutput(BaseModel):
 
     # Phase 6 fields (all have defaults for backward compatibility with Phase 5 data)
     regulatory_implications: RegulatoryImplications | None = None
-    dates: list[ExtractedDate] = Field(default_factory=list)
+    dates: list[ExtractedDate] = []
     sentiment: SentimentAssessment | None = None
-    quotes: list[RepresentativeQuote] = Field(default_factory=list)
+    quotes: list[RepresentativeQuote] = []
     impact: ImpactScore | None = None
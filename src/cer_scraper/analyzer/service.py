@@ -9,18 +9,22 @@ returns an AnalysisResult with full metadata.
 from __future__ import annotations
 
 import datetime
-import json
+import functools
 import logging
 import os
-import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Callable, Sequence
+from typing import IO
 
+import orjson
 from pydantic import ValidationError
 
 from cer_scraper.analyzer.prompt import (
-    build_prompt,
+    build_prompt_parts,
     get_json_schema_description,
     load_prompt_template,
 )
@@ -30,10 +34,42 @@ from cer_scraper.config.settings import AnalysisSettings, PROJECT_ROOT
 
 logger = logging.getLogger(__name__)
 
-_CODE_FENCE_RE = re.compile(
-    r"^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$", re.DOTALL
+_FENCE = "```"
+
+# Claude CLI arguments after the executable; ``--model <alias>`` is
+# inserted after index 3
+_CLAUDE_ARGS = (
+    "-p",
+    "--output-format", "json",
+    "--max-turns", "1",
+    "--no-session-persistence",
+    "--tools", "",
+)
+
+# Windows-specific process creation flags (0 is a no-op elsewhere)
+_CREATION_FLAGS = (
+    subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == "win32" else 0
 )
 
+# Validation errors included in the logged/stored failure summary
+_MAX_REPORTED_ERRORS = 3
+
+# Slice size for writing large prompt parts to the CLI's stdin, bounding
+# the transient encoded copy instead of encoding a whole document at once
+_STDIN_CHUNK_CHARS = 1 << 20
+
+
+@functools.cache
+def _analysis_validator() -> Callable[[object], object]:
+    """Return the AnalysisOutput JSON validator, building it on first use.
+
+    The schemas use ``defer_build``, so this first access is what builds
+    them -- importing the analyzer alone does not.  The bound method is
+    cached, skipping the ``model_validate_json()`` classmethod dispatch on
+    every filing.
+    """
+    return AnalysisOutput.__pydantic_validator__.validate_json
+
 
 def strip_code_fences(text: str) -> str:
     """Remove markdown code fences wrapping JSON content.
@@ -49,17 +85,93 @@ def strip_code_fences(text: str) -> str:
         The unwrapped content.
     """
     text = text.strip()
-    match = _CODE_FENCE_RE.match(text)
-    return match.group(1).strip() if match else text
+    # Fences can only sit at the very ends, so check those instead of
+    # scanning the whole (possibly many-KB) body with a regex.
+    if (
+        len(text) < 2 * len(_FENCE)
+        or not text.startswith(_FENCE)
+        or not text.endswith(_FENCE)
+    ):
+        return text
+    inner = text[len(_FENCE) : -len(_FENCE)]
+    if inner.startswith("json"):
+        inner = inner[len("json") :]
+    return inner.strip()
+
+
+def _summarize_validation_error(
+    exc: ValidationError, limit: int = _MAX_REPORTED_ERRORS
+) -> str:
+    """Summarize a ValidationError as ``loc: message`` pairs on one line.
+
+    Reads the structured ``errors()`` list instead of ``str(exc)``, which
+    formats a multi-line report (with input values and doc URLs) for every
+    error only for most of it to be discarded.
+
+    Args:
+        exc: The validation error raised for Claude's output.
+        limit: Maximum number of errors to include.
+
+    Returns:
+        e.g. ``"3 errors: summary: Field required; impact.score: ..."``.
+    """
+    errors = exc.errors(include_url=False, include_input=False)
+    parts = []
+    for err in errors[:limit]:
+        loc = ".".join(str(part) for part in err["loc"])
+        parts.append(f"{loc}: {err['msg']}" if loc else err["msg"])
+    if len(errors) > limit:
+        parts.append(f"... {len(errors) - limit} more")
+    noun = "error" if len(errors) == 1 else "errors"
+    return f"{len(errors)} {noun}: " + "; ".join(parts)
+
+
+@functools.cache
+def _claude_executable() -> str:
+    """Resolve the ``claude`` executable on PATH once per process.
+
+    Every filing launches a fresh CLI process; resolving the path up front
+    spares each launch the PATH search.  Falls back to the bare name so a
+    missing CLI still fails at launch with the usual error.
+    """
+    return shutil.which("claude") or "claude"
+
+
+def _write_prompt(stdin: IO[bytes], prompt_parts: Sequence[str]) -> None:
+    """Stream prompt parts to the subprocess stdin, then close it.
+
+    Runs on a helper thread so the caller can enforce the timeout while
+    reading stdout/stderr.  Text is UTF-8 encoded one slice at a time.  A
+    broken pipe means the process exited or was killed; that outcome is
+    reported through its return code instead.
+
+    Args:
+        stdin: Binary stdin pipe of the Claude CLI process.
+        prompt_parts: Prompt fragments written in order.
+    """
+    try:
+        for part in prompt_parts:
+            for i in range(0, len(part), _STDIN_CHUNK_CHARS):
+                stdin.write(part[i : i + _STDIN_CHUNK_CHARS].encode("utf-8"))
+    except OSError:
+        logger.debug("Claude CLI stdin closed before prompt was fully written")
+    finally:
+        try:
+            stdin.close()
+        except OSError:
+            pass
 
 
 def _invoke_claude_cli(
-    prompt_text: str, model: str, timeout: int
+    prompt_parts: Sequence[str], model: str, timeout: int
 ) -> dict:
     """Invoke Claude CLI as a subprocess and return the JSON envelope.
 
+    The prompt is streamed to stdin part by part (e.g. prefix, document
+    text, suffix), so the full prompt is never built as one string.
+
     Args:
-        prompt_text: The fully built prompt to send via stdin.
+        prompt_parts: Prompt fragments whose concatenation is the prompt.
         model: Claude model alias (e.g. ``"sonnet"``, ``"opus"``).
         timeout: Maximum seconds to wait for the subprocess.
 
@@ -69,51 +181,74 @@ def _invoke_claude_cli(
     Raises:
         subprocess.TimeoutExpired: If the process exceeds *timeout*.
         RuntimeError: If the process exits with a non-zero code.
-        json.JSONDecodeError: If stdout is not valid JSON.
+        orjson.JSONDecodeError: If stdout is not valid JSON.
     """
     cmd = [
-        "claude",
-        "-p",
-        "--output-format", "json",
-        "--model", model,
-        "--max-turns", "1",
-        "--no-session-persistence",
-        "--tools", "",
+        _claude_executable(),
+        *_CLAUDE_ARGS[:3],
+        "--model",
+        model,
+        *_CLAUDE_ARGS[3:],
     ]
 
     # Strip CLAUDECODE to prevent nested session errors
-    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
-
-    # Windows-specific process creation flags
-    kwargs: dict = {
-        "stdin": subprocess.PIPE,
-        "stdout": subprocess.PIPE,
-        "stderr": subprocess.PIPE,
-        "text": True,
-        "encoding": "utf-8",
-        "env": env,
-    }
-    if sys.platform == "win32":
-        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    env = os.environ.copy()
+    env.pop("CLAUDECODE", None)
 
     logger.info("Invoking Claude CLI: model=%s, timeout=%ds", model, timeout)
-    proc = subprocess.Popen(cmd, **kwargs)
+    # Binary pipes: stdout is handed to orjson as bytes, never decoded to
+    # an intermediate str.
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        creationflags=_CREATION_FLAGS,
+    )
+
+    # Hand stdin to a writer thread; detaching it from proc keeps
+    # communicate() from closing it while the prompt is still being written.
+    stdin, proc.stdin = proc.stdin, None
+    writer = threading.Thread(
+        target=_write_prompt, args=(stdin, prompt_parts), daemon=True
+    )
+    writer.start()
 
     try:
-        stdout, stderr = proc.communicate(input=prompt_text, timeout=timeout)
+        stdout, stderr = proc.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
         logger.error("Claude CLI timed out after %ds, killing process", timeout)
         proc.kill()
         proc.communicate()  # Clean up zombie process
         raise
+    finally:
+        writer.join()
 
     if proc.returncode != 0:
-        msg = f"Claude CLI exited with code {proc.returncode}: {stderr.strip()}"
+        error_text = stderr.decode("utf-8", errors="replace").strip()
+        msg = f"Claude CLI exited with code {proc.returncode}: {error_text}"
         logger.error(msg)
         raise RuntimeError(msg)
 
-    logger.debug("Claude CLI stdout length: %d chars", len(stdout))
-    return json.loads(stdout)
+    logger.debug("Claude CLI stdout length: %d bytes", len(stdout))
+    return orjson.loads(stdout)
+
+
+def get_prompt_version(settings: AnalysisSettings) -> str:
+    """Return the version hash of the configured prompt template.
+
+    Args:
+        settings: Analysis configuration (provides ``template_path``).
+
+    Returns:
+        12-hex-character BLAKE2b digest of the template content.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+    """
+    _, version_hash = load_prompt_template(PROJECT_ROOT / settings.template_path)
+    return version_hash
 
 
 def analyze_filing_text(
@@ -162,13 +297,12 @@ def analyze_filing_text(
 
     # --- Build the prompt ---
     json_schema_description = get_json_schema_description()
-    prompt = build_prompt(
+    prompt_prefix, prompt_suffix = build_prompt_parts(
         template=template,
         filing_id=filing_id,
         filing_date=filing_date,
         applicant=applicant,
         filing_type=filing_type,
-        document_text=document_text,
         num_documents=num_documents,
         num_missing=num_missing,
         json_schema_description=json_schema_description,
@@ -176,9 +310,13 @@ def analyze_filing_text(
     )
 
     # --- Invoke Claude CLI ---
-    start = time.monotonic()
+    start = time.perf_counter_ns()
     try:
-        envelope = _invoke_claude_cli(prompt, settings.model, settings.timeout_seconds)
+        envelope = _invoke_claude_cli(
+            (prompt_prefix, document_text, prompt_suffix),
+            settings.model,
+            settings.timeout_seconds,
+        )
     except subprocess.TimeoutExpired:
         return AnalysisResult(
             success=False,
@@ -192,13 +330,13 @@ def analyze_filing_text(
             error=str(e),
             prompt_version=version_hash,
         )
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return AnalysisResult(
             success=False,
             error="invalid_cli_json",
             prompt_version=version_hash,
         )
-    processing_time = time.monotonic() - start
+    processing_time = (time.perf_counter_ns() - start) / 1e9
 
     # --- Check for CLI-level error ---
     if envelope.get("is_error"):
@@ -215,15 +353,16 @@ def analyze_filing_text(
     raw_result = envelope["result"]
     cleaned = strip_code_fences(raw_result)
 
+    # Parse and validate in one pydantic-core pass; the model itself is
+    # returned and only serialized where it is stored.
     try:
-        validated_output = AnalysisOutput.model_validate_json(cleaned)
-    except (ValidationError, json.JSONDecodeError) as e:
-        logger.error(
-            "Filing %s: validation error: %s", filing_id, str(e)[:200]
-        )
+        analysis = _analysis_validator()(cleaned)
+    except ValidationError as e:
+        summary = _summarize_validation_error(e)
+        logger.error("Filing %s: validation error: %s", filing_id, summary)
         return AnalysisResult(
             success=False,
-            error=f"validation_error: {e}",
+            error=f"validation_error: {summary}",
             raw_response=raw_result,
             prompt_version=version_hash,
             processing_time_seconds=processing_time,
@@ -245,7 +384,7 @@ def analyze_filing_text(
 
     return AnalysisResult(
         success=True,
-        analysis_json=validated_output.model_dump(),
+        analysis=analysis,
         raw_response=raw_result,
         model=settings.model,
         prompt_version=version_hash,
@@ -253,5 +392,7 @@ def analyze_filing_text(
         cost_usd=envelope.get("total_cost_usd"),
         input_tokens=input_tokens,
         output_tokens=output_tokens,
-        timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="seconds"
+        ),
     )
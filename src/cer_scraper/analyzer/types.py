@@ -4,19 +4,27 @@ Defines AnalysisResult used across the analysis service, prompt builder,
 and orchestration modules.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cer_scraper.analyzer.schemas import AnalysisOutput
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class AnalysisResult:
     """Result of analyzing a single filing via Claude Code CLI.
 
     Attributes:
         success: Whether analysis produced valid, validated JSON output.
-        analysis_json: The validated analysis output as a dict (None on failure).
+        analysis: The validated analysis output model (None on failure).
+                  Callers serialize it only where needed, e.g. with
+                  ``model_dump_json()`` for storage.
         raw_response: Raw text response from Claude CLI (for debugging).
         model: Claude model alias used (e.g. "sonnet", "opus", "haiku").
-        prompt_version: SHA-256 hash prefix of the prompt template file.
+        prompt_version: 12-char BLAKE2b hash of the prompt template file.
         processing_time_seconds: Wall-clock time for the analysis call.
         cost_usd: API cost reported by Claude CLI (None if unavailable).
         input_tokens: Input token count (None if unavailable).
@@ -27,7 +35,7 @@ class AnalysisResult:
     """
 
     success: bool
-    analysis_json: dict | None = field(default=None)
+    analysis: AnalysisOutput | None = field(default=None)
     raw_response: str = ""
     model: str = ""
     prompt_version: str = ""
@@ -1,6 +1,18 @@
-"""Configuration package -- typed, validated settings from YAML + .env."""
+"""Configuration package -- typed, validated settings from YAML + .env.
 
-from .settings import EmailSettings, PipelineSettings, ScraperSettings
+The settings classes are imported lazily (PEP 562) so that importing this
+package, or a sibling subpackage, does not load pydantic-settings until a
+settings class is actually used.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings import EmailSettings, PipelineSettings, ScraperSettings
 
 __all__ = [
     "EmailSettings",
@@ -9,11 +21,34 @@ __all__ = [
     "load_all_settings",
 ]
 
+# Public name -> submodule defining it, imported on first access
+_LAZY_ATTRS = {
+    "EmailSettings": ".settings",
+    "PipelineSettings": ".settings",
+    "ScraperSettings": ".settings",
+}
+
 
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+@functools.cache
 def load_all_settings() -> tuple[ScraperSettings, EmailSettings, PipelineSettings]:
     """Load and return all configuration objects.
 
     Returns a tuple of (ScraperSettings, EmailSettings, PipelineSettings),
     each populated from its own YAML file with environment variable overrides.
+
+    The files are read once per process; later calls return the same
+    objects.  Long-lived processes can pick up edited configuration with
+    ``load_all_settings.cache_clear()``.
     """
+    from .settings import EmailSettings, PipelineSettings, ScraperSettings
+
     return ScraperSettings(), EmailSettings(), PipelineSettings()
@@ -129,11 +129,17 @@ class PipelineSettings(BaseSettings):
     analysis_timeout_seconds: int = 300
     max_retry_count: int = 3
 
+    # Database connection pool
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_busy_timeout_seconds: float = 30.0
+
     # Phase 3: download settings
     filings_dir: str = "data/filings"
     max_pdf_size_bytes: int = 104_857_600  # 100MB
-    download_chunk_size: int = 65_536  # 64KB
+    download_chunk_size: int = 262_144  # 256KB
     download_timeout_seconds: int = 120
+    max_concurrent_downloads: int = 4
 
     model_config = SettingsConfigDict(
         yaml_file=str(_CONFIG_DIR / "pipeline.yaml"),
@@ -168,6 +174,7 @@ class AnalysisSettings(BaseSettings):
     timeout_seconds: int = 300
     min_text_length: int = 100
     template_path: str = "config/prompts/filing_analysis.txt"
+    max_workers: int = 2
 
     model_config = SettingsConfigDict(
         yaml_file=str(_CONFIG_DIR / "analysis.yaml"),
@@ -211,10 +218,26 @@ class ExtractionSettings(BaseSettings):
     tesseract_cmd: str = "tesseract"
     ocr_language: str = "eng"
     ocr_dpi: int = 300
+    # Lower DPI tried first, rerun at ocr_dpi on quality failure (0 = off)
+    ocr_first_pass_dpi: int = 0
+    # Pages with this much clean embedded text skip OCR (0 = OCR every page)
+    min_native_chars_per_page: int = 0
+    # Pages OCR'd concurrently within one PDF (each runs its own tesseract)
+    ocr_workers: int = 1
 
     # Table extraction strategy for pymupdf4llm
     table_strategy: str = "lines_strict"
 
+    # Worker processes for concurrent filing extraction (None = one per CPU)
+    max_workers: int | None = None
+
+    # Worker processes sharing one PDF's pages (1 = pages extracted serially)
+    page_workers: int = 1
+
+    # Content-addressed cache of extraction results ("" disables)
+    cache_dir: str = "data/extraction_cache"
+    cache_max_bytes: int = 17_179_869_184  # 16GB
+
     model_config = SettingsConfigDict(
         yaml_file=str(_CONFIG_DIR / "extraction.yaml"),
         env_prefix="EXTRACTION_",
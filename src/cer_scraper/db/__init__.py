@@ -1,15 +1,27 @@
-"""Database layer -- ORM models, engine factory, session management, and state store."""
-
-from .engine import get_engine, get_session_factory, init_db
-from .models import Analysis, Base, Document, Filing, RunHistory
-from .state import (
-    create_filing,
-    filing_exists,
-    get_filing_by_id,
-    get_filings_for_download,
-    get_unprocessed_filings,
-    mark_step_complete,
-)
+"""Database layer -- ORM models, engine factory, session management, and state store.
+
+Public names are imported lazily (PEP 562): importing this package does not
+load SQLAlchemy until one of them is first accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .compression import compress_analysis_json, decompress_analysis
+    from .engine import get_engine, get_session_factory, init_db
+    from .models import Analysis, Base, Document, Filing, RunHistory, Status
+    from .state import (
+        count_unprocessed_filings,
+        create_filing,
+        filing_exists,
+        get_filing_by_id,
+        get_filings_for_download,
+        get_unprocessed_filings,
+        mark_step_complete,
+    )
 
 __all__ = [
     "Analysis",
@@ -17,7 +29,11 @@ __all__ = [
     "Document",
     "Filing",
     "RunHistory",
+    "Status",
+    "compress_analysis_json",
+    "count_unprocessed_filings",
     "create_filing",
+    "decompress_analysis",
     "filing_exists",
     "get_engine",
     "get_filing_by_id",
@@ -27,3 +43,34 @@ __all__ = [
     "init_db",
     "mark_step_complete",
 ]
+
+# Public name -> submodule defining it, imported on first access
+_LAZY_ATTRS = {
+    "Analysis": ".models",
+    "Base": ".models",
+    "Document": ".models",
+    "Filing": ".models",
+    "RunHistory": ".models",
+    "Status": ".models",
+    "compress_analysis_json": ".compression",
+    "count_unprocessed_filings": ".state",
+    "create_filing": ".state",
+    "decompress_analysis": ".compression",
+    "filing_exists": ".state",
+    "get_engine": ".engine",
+    "get_filing_by_id": ".state",
+    "get_filings_for_download": ".state",
+    "get_session_factory": ".engine",
+    "get_unprocessed_filings": ".state",
+    "init_db": ".engine",
+    "mark_step_complete": ".state",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
@@ -0,0 +1,48 @@
+"""Compression codec for the Filing.analysis_json column.
+
+Analysis output is stored as zstd-compressed UTF-8 JSON bytes rather than
+TEXT, shrinking filing rows several-fold.  Writers call
+:func:`compress_analysis_json`; readers call :func:`decompress_analysis`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import zstandard
+
+if TYPE_CHECKING:
+    from .models import Filing
+
+# Fast level: analysis blobs are small, so higher levels buy little
+ANALYSIS_ZSTD_LEVEL = 3
+
+
+def compress_analysis_json(analysis_bytes: bytes) -> bytes:
+    """Compress serialized analysis JSON for storage in the database.
+
+    Args:
+        analysis_bytes: UTF-8 JSON bytes of the validated analysis output.
+
+    Returns:
+        A zstd frame (with content size recorded) holding the JSON.
+    """
+    return zstandard.ZstdCompressor(level=ANALYSIS_ZSTD_LEVEL).compress(
+        analysis_bytes
+    )
+
+
+def decompress_analysis(filing: Filing) -> str | None:
+    """Return a filing's analysis output as a JSON string.
+
+    Args:
+        filing: Filing ORM object.
+
+    Returns:
+        The decompressed JSON text, or None if the filing has no analysis.
+    """
+    if filing.analysis_json is None:
+        return None
+    return (
+        zstandard.ZstdDecompressor().decompress(filing.analysis_json).decode()
+    )
@@ -2,8 +2,9 @@
 
 This module provides the core database infrastructure:
     get_engine -- Create a SQLAlchemy engine for the SQLite database.
-    init_db -- Create all tables idempotently using Base.metadata.create_all().
+    init_db -- Create all tables idempotently and migrate legacy column data.
     get_session_factory -- Create a session factory bound to the engine.
+    expire_on_commit_disabled -- Keep loaded objects fresh across commits in a batch.
 
 Usage:
     engine = get_engine("data/state.db")
@@ -13,39 +14,91 @@ Usage:
         ...
 """
 
+import contextlib
 import logging
-from pathlib import Path
+import os
+from collections.abc import Iterator
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from .models import Base
+from .compression import compress_analysis_json
+from .models import STATUS_MAP, Base
 
 logger = logging.getLogger(__name__)
 
-
-def get_engine(db_path: str = "data/state.db") -> Engine:
+# Applied to every new connection.  WAL with synchronous=NORMAL turns each
+# commit into a single log append instead of several fsyncs; the cache,
+# temp-store and mmap settings keep hot pages in memory.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a freshly opened SQLite connection (``connect`` event)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def get_engine(
+    db_path: str = "data/state.db",
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    busy_timeout_seconds: float = 30.0,
+) -> Engine:
     """Create SQLAlchemy engine for SQLite database.
 
     Ensures the parent directory exists before creating the engine
     to avoid 'unable to open database file' errors.
 
+    The connection pool is configured explicitly rather than relying on
+    dialect defaults.  ``check_same_thread`` is disabled so pooled
+    connections can be handed to whichever thread checks them out, and
+    ``busy_timeout_seconds`` makes a writer wait for a competing lock
+    instead of failing immediately with "database is locked".  Each new
+    connection is switched to WAL journaling with ``synchronous=NORMAL``
+    and a larger page cache (see ``_SQLITE_PRAGMAS``).
+
     Args:
         db_path: Path to the SQLite database file.
+        pool_size: Number of connections kept open in the pool.
+        max_overflow: Extra connections allowed beyond ``pool_size``.
+        busy_timeout_seconds: Seconds to wait on a locked database.
 
     Returns:
         A SQLAlchemy Engine instance.
     """
-    # Resolve to absolute path to avoid issues with working directory changes
-    resolved_path = Path(db_path).resolve()
+    # Absolute path avoids issues with working directory changes; plain
+    # os.path skips pathlib objects and resolve()'s per-component symlink
+    # syscalls.
+    resolved_path = os.path.abspath(db_path)
 
     # Ensure parent directory exists (SQLite creates the file but not directories)
-    resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
 
     engine = create_engine(
         f"sqlite:///{resolved_path}",
         echo=False,  # Set True for SQL debugging
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": busy_timeout_seconds,
+        },
     )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
     return engine
 
 
@@ -59,16 +112,127 @@ def init_db(engine: Engine) -> None:
         engine: SQLAlchemy Engine to create tables on.
     """
     Base.metadata.create_all(engine)
+    _create_missing_indexes(engine)
+    _encode_legacy_status_columns(engine)
+    _compress_legacy_analysis_json(engine)
     logger.info("Database tables initialized")
 
 
+def _create_missing_indexes(engine: Engine) -> None:
+    """Create model indexes that are missing from existing tables.
+
+    ``create_all()`` only emits CREATE INDEX alongside CREATE TABLE, so
+    indexes added to a model later never reach an existing database.  Each
+    index is checked individually and created if absent.
+
+    Args:
+        engine: SQLAlchemy Engine for the state database.
+    """
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def _encode_legacy_status_columns(engine: Engine) -> None:
+    """Convert ``filings.status_*`` values stored as strings to Status codes.
+
+    Databases created before the status columns became SMALLINT codes hold
+    ``"pending"``/``"success"``/... text.  The values are rewritten in place;
+    the legacy VARCHAR columns then hold single-digit codes, which the
+    StatusCode type reads back transparently.  Once migrated the updates
+    match nothing.
+
+    Args:
+        engine: SQLAlchemy Engine for the state database.
+    """
+    whens = " ".join(
+        f"WHEN '{name}' THEN {code:d}" for name, code in STATUS_MAP.items()
+    )
+    names = ", ".join(f"'{name}'" for name in STATUS_MAP)
+    migrated = 0
+    with engine.begin() as conn:
+        for step in ("scraped", "downloaded", "extracted", "analyzed", "emailed"):
+            column = f"status_{step}"
+            migrated += conn.execute(
+                text(
+                    f"UPDATE filings SET {column} = CASE {column} {whens} END "
+                    f"WHERE {column} IN ({names})"
+                )
+            ).rowcount
+    if migrated:
+        logger.info("Encoded %d legacy filing status values", migrated)
+
+
+def _compress_legacy_analysis_json(engine: Engine) -> None:
+    """Compress ``filings.analysis_json`` values stored as plain TEXT.
+
+    Databases created before the column became zstd-compressed bytes still
+    hold JSON strings.  SQLite keeps the stored type per value, so those
+    rows are found with ``typeof()`` and rewritten in place.  Once migrated
+    the query matches nothing, so this is cheap on every startup.
+
+    Args:
+        engine: SQLAlchemy Engine for the state database.
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT id, analysis_json FROM filings "
+                "WHERE typeof(analysis_json) = 'text'"
+            )
+        ).all()
+        if not rows:
+            return
+        conn.execute(
+            text("UPDATE filings SET analysis_json = :blob WHERE id = :id"),
+            [
+                {"id": row_id, "blob": compress_analysis_json(value.encode())}
+                for row_id, value in rows
+            ],
+        )
+    logger.info("Compressed analysis_json for %d existing filings", len(rows))
+
+
 def get_session_factory(engine: Engine) -> sessionmaker[Session]:
     """Create a session factory bound to the engine.
 
+    Sessions keep loaded objects usable after ``commit()``
+    (``expire_on_commit=False``) instead of re-SELECTing every attribute on
+    next access, and do not flush before each query (``autoflush=False``);
+    pending changes are written at ``commit()`` or an explicit ``flush()``.
+    Callers that need database-side values changed after a commit must call
+    ``session.refresh(obj)``.
+
     Args:
         engine: SQLAlchemy Engine to bind sessions to.
 
     Returns:
         A sessionmaker instance that produces Session objects.
     """
-    return sessionmaker(bind=engine)
+    return sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+
+@contextlib.contextmanager
+def expire_on_commit_disabled(session: Session) -> Iterator[Session]:
+    """Temporarily stop ``session.commit()`` from expiring loaded objects.
+
+    Batch loops that eagerly load their rows up front and commit per item
+    would otherwise have every commit expire the whole identity map, so the
+    next item's attributes and relationships are lazily re-SELECTed (an
+    N+1 pattern).  Sessions from :func:`get_session_factory` already have
+    expiry disabled; this guards batch loops given any other session.  The
+    previous setting is restored on exit.
+
+    Args:
+        session: Active SQLAlchemy session.
+
+    Yields:
+        The same session.
+    """
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = previous
@@ -8,10 +8,73 @@ Models:
 """
 
 import datetime
+import enum
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+
+
+class Status(enum.IntEnum):
+    """Stored code for a filing's per-step pipeline status."""
+
+    PENDING = 0
+    SUCCESS = 1
+    FAILED = 2
+    SKIPPED = 3
+
+
+# Status string used throughout the pipeline -> stored code
+STATUS_MAP: dict[str, Status] = {status.name.lower(): status for status in Status}
+
+
+class StatusCode(TypeDecorator[str]):
+    """Pipeline status stored as a SMALLINT code, exposed as its string.
+
+    Python code keeps reading and writing ``"pending"``, ``"success"``, etc.
+    (including in query filters); only the stored value is narrowed, which
+    keeps rows and the status indexes small.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: str | int | None, dialect: Dialect
+    ) -> int | None:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                return STATUS_MAP[value]
+            except KeyError:
+                raise ValueError(f"Unknown pipeline status {value!r}") from None
+        return int(Status(value))
+
+    def process_literal_param(
+        self, value: str | int | None, dialect: Dialect
+    ) -> str:
+        code = self.process_bind_param(value, dialect)
+        return "NULL" if code is None else str(code)
+
+    def process_result_value(
+        self, value: int | str | None, dialect: Dialect
+    ) -> str | None:
+        if value is None:
+            return None
+        # int() also accepts codes read back from a legacy VARCHAR column
+        return Status(int(value)).name.lower()
 
 
 class Base(DeclarativeBase):
@@ -20,17 +83,52 @@ class Base(DeclarativeBase):
     pass
 
 
+def _open_queue_index(name: str, step_column: str, *columns: str) -> Index:
+    """Partial index on *columns* over filings whose *step_column* is not done.
+
+    Queue queries repeat the ``step_column != success`` predicate, which
+    lets the planner use the index.
+    """
+    where = text(f"{step_column} != {Status.SUCCESS:d}")
+    return Index(name, *columns, sqlite_where=where, postgresql_where=where)
+
+
 class Filing(Base):
     """A CER REGDOCS filing with per-step pipeline status tracking.
 
     Phase 5 adds the analysis_json column for storing the full LLM analysis
-    output as a serialized JSON string. Since the project uses
+    output as zstd-compressed JSON bytes (see ``db.compression``). Since the project uses
     Base.metadata.create_all() (not Alembic), this column is created
     automatically for new databases. Existing databases may need ALTER TABLE
     statements or can be recreated by deleting data/state.db.
     """
 
     __tablename__ = "filings"
+    __table_args__ = (
+        # Work-queue indexes for the get_filings_for_* / get_unprocessed_filings
+        # queries.  Each is partial on the step not yet being done, so a row
+        # leaves the index once it is processed and a queue query only
+        # touches queued rows, however large the table grows.
+        _open_queue_index(
+            "ix_filings_download_pending",
+            "status_downloaded",
+            "status_scraped",
+            "retry_count",
+        ),
+        _open_queue_index(
+            "ix_filings_extract_pending",
+            "status_extracted",
+            "status_downloaded",
+            "retry_count",
+        ),
+        _open_queue_index(
+            "ix_filings_analysis_pending",
+            "status_analyzed",
+            "status_extracted",
+            "retry_count",
+        ),
+        _open_queue_index("ix_filings_pipeline_open", "status_emailed", "retry_count"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     filing_id: Mapped[str] = mapped_column(String(100), unique=True, index=True)
@@ -43,15 +141,28 @@ class Filing(Base):
     title: Mapped[Optional[str]] = mapped_column(String(1000), default=None)
     url: Mapped[Optional[str]] = mapped_column(String(2000), default=None)
 
-    # Phase 5: LLM analysis output (JSON string)
-    analysis_json: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    # Phase 5: LLM analysis output (zstd-compressed JSON bytes)
+    analysis_json: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, default=None
+    )
 
-    # Per-step status tracking -- each pipeline stage tracked independently
-    status_scraped: Mapped[str] = mapped_column(String(20), default="pending")
-    status_downloaded: Mapped[str] = mapped_column(String(20), default="pending")
-    status_extracted: Mapped[str] = mapped_column(String(20), default="pending")
-    status_analyzed: Mapped[str] = mapped_column(String(20), default="pending")
-    status_emailed: Mapped[str] = mapped_column(String(20), default="pending")
+    # Per-step status tracking -- each pipeline stage tracked independently.
+    # Stored as Status codes (SMALLINT); read and written as status strings.
+    status_scraped: Mapped[str] = mapped_column(
+        StatusCode, default="pending", server_default="0"
+    )
+    status_downloaded: Mapped[str] = mapped_column(
+        StatusCode, default="pending", server_default="0"
+    )
+    status_extracted: Mapped[str] = mapped_column(
+        StatusCode, default="pending", server_default="0"
+    )
+    status_analyzed: Mapped[str] = mapped_column(
+        StatusCode, default="pending", server_default="0"
+    )
+    status_emailed: Mapped[str] = mapped_column(
+        StatusCode, default="pending", server_default="0"
+    )
 
     # Failure tracking -- enables smart retry logic (skip after N failures)
     error_message: Mapped[Optional[str]] = mapped_column(Text, default=None)
@@ -90,7 +201,9 @@ class Document(Base):
     __tablename__ = "documents"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    filing_id: Mapped[int] = mapped_column(ForeignKey("filings.id"))
+    # Indexed: the analysis queue's EXISTS check and selectinload of
+    # Filing.documents both look documents up by filing
+    filing_id: Mapped[int] = mapped_column(ForeignKey("filings.id"), index=True)
     document_url: Mapped[str] = mapped_column(String(2000))
     filename: Mapped[Optional[str]] = mapped_column(String(500), default=None)
     local_path: Mapped[Optional[str]] = mapped_column(String(1000), default=None)
@@ -108,6 +221,8 @@ class Document(Base):
     extraction_error: Mapped[Optional[str]] = mapped_column(
         String(500), default=None
     )  # "encrypted", "too_many_pages", "all_methods_failed"
+    # No longer written: extracted text is stored only in the .md file next
+    # to the PDF.  Kept so rows from older databases stay readable.
     extracted_text: Mapped[Optional[str]] = mapped_column(Text, default=None)
     char_count: Mapped[Optional[int]] = mapped_column(default=None)
     page_count: Mapped[Optional[int]] = mapped_column(default=None)
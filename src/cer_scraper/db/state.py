@@ -2,9 +2,12 @@
 
 Provides functions for the pipeline to track progress through each stage:
     get_unprocessed_filings -- Filings that need processing (not emailed, under retry limit).
+    count_unprocessed_filings -- Number of filings get_unprocessed_filings would yield.
     get_filings_for_download -- Filings that need PDF downloads (scraped, not downloaded).
     get_filings_for_extraction -- Filings that need text extraction (downloaded, not extracted).
+    skip_extracted_filings -- Mark extraction-pending filings with every document extracted as done.
     get_filings_for_analysis -- Filings that need LLM analysis (extracted, not analyzed).
+    skip_filings_without_text -- Mark analysis-pending filings with no extracted text as done.
     get_filing_by_id -- Look up a filing by its REGDOCS filing_id.
     mark_step_complete -- Update a specific pipeline step's status.
     create_filing -- Insert a new filing record from scraper output.
@@ -15,20 +18,160 @@ when the session closes, so changes would be silently lost without it.
 """
 
 import logging
+from collections.abc import Iterator
 
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, func, insert, select, update
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.util import identity_key
 
-from .models import Filing
+from .models import Document, Filing
 
 logger = logging.getLogger(__name__)
 
 VALID_STEPS = ("scraped", "downloaded", "extracted", "analyzed", "emailed")
 
+# Filings loaded per query by the get_filings_for_* / get_unprocessed_filings
+# iterators; bounds the ORM state held in memory at once.
+FILING_CHUNK_SIZE = 100
+
+# session.info key for the filing_id -> primary key lookup cache
+_FILING_PK_CACHE_KEY = "filing_pk_by_filing_id"
+
+# EXISTS predicate: the filing has at least one document with usable text.
+# The text itself lives in the document's .md sidecar; char_count is
+# recorded alongside it by the extractor.
+_HAS_EXTRACTED_TEXT = Filing.documents.any(
+    (Document.extraction_status == "success") & (Document.char_count > 0)
+)
+
+# EXISTS predicate: a downloaded document has no successful extraction yet
+_HAS_UNEXTRACTED_DOCUMENT = Filing.documents.any(
+    (Document.download_status == "success")
+    & Document.extraction_status.is_distinct_from("success")
+)
+
+# Hot statements are built once at import; callers pass their values as
+# parameters, so each call skips rebuilding the expression tree and goes
+# straight to the engine's compiled-statement cache.
+_MAX_RETRIES = bindparam("max_retries")
+
+_UNPROCESSED_WHERE = (
+    Filing.status_emailed != "success",
+    Filing.retry_count < _MAX_RETRIES,
+)
+
+
+def _paged(stmt: Select) -> Select:
+    """Add keyset paging (``id > :after_id``, ``LIMIT :limit``) to a query."""
+    return (
+        stmt.where(Filing.id > bindparam("after_id"))
+        .order_by(Filing.id)
+        .limit(bindparam("limit"))
+    )
+
+
+_UNPROCESSED_STMT = _paged(select(Filing).where(*_UNPROCESSED_WHERE))
+
+_COUNT_UNPROCESSED_STMT = (
+    select(func.count()).select_from(Filing).where(*_UNPROCESSED_WHERE)
+)
+
+_DOWNLOAD_QUEUE_STMT = _paged(
+    select(Filing)
+    .where(
+        Filing.status_scraped == "success",
+        Filing.status_downloaded != "success",
+        Filing.retry_count < _MAX_RETRIES,
+    )
+    .options(selectinload(Filing.documents))
+)
+
+_EXTRACTION_QUEUE_STMT = _paged(
+    select(Filing)
+    .where(
+        Filing.status_downloaded == "success",
+        Filing.status_extracted != "success",
+        Filing.retry_count < _MAX_RETRIES,
+    )
+    .options(selectinload(Filing.documents))
+)
+
+_ANALYSIS_QUEUE_STMT = _paged(
+    select(Filing)
+    .where(
+        Filing.status_extracted == "success",
+        Filing.status_analyzed != "success",
+        Filing.retry_count < _MAX_RETRIES,
+        _HAS_EXTRACTED_TEXT,
+    )
+    .options(selectinload(Filing.documents))
+)
+
+_SKIP_WITHOUT_TEXT_STMT = (
+    update(Filing)
+    .where(
+        Filing.status_extracted == "success",
+        Filing.status_analyzed != "success",
+        Filing.retry_count < _MAX_RETRIES,
+        ~_HAS_EXTRACTED_TEXT,
+    )
+    .values(status_analyzed="success")
+    .execution_options(synchronize_session="fetch")
+)
+
+# Every downloaded document already extracted (or no documents at all):
+# the same outcome the extractor would reach without parsing anything
+_SKIP_EXTRACTED_STMT = (
+    update(Filing)
+    .where(
+        Filing.status_downloaded == "success",
+        Filing.status_extracted != "success",
+        Filing.retry_count < _MAX_RETRIES,
+        ~_HAS_UNEXTRACTED_DOCUMENT,
+        Filing.documents.any(Document.extraction_status == "success")
+        | ~Filing.documents.any(),
+    )
+    .values(status_extracted="success")
+    .execution_options(synchronize_session="fetch")
+)
+
+_FILING_BY_ID_STMT = select(Filing).where(Filing.filing_id == bindparam("filing_id"))
+
+# Existence probe: answered from the unique filing_id index alone (it
+# carries the rowid), stopping at the single match.  Returning the id rather
+# than an EXISTS boolean lets filing_exists prime the per-session PK cache.
+_FILING_PK_BY_ID_STMT = (
+    select(Filing.id).where(Filing.filing_id == bindparam("filing_id")).limit(1)
+)
+
+
+def _iter_filings(
+    session: Session, stmt: Select, max_retries: int, chunk_size: int
+) -> Iterator[Filing]:
+    """Yield the filings matched by a paged statement, one chunk at a time.
+
+    Uses keyset pagination (``id > last id``) rather than a server-side
+    cursor: each chunk is a separate short query, so callers may commit or
+    roll back the session between filings, and only ``chunk_size`` filings
+    (plus their eagerly loaded documents) are held by the iterator at once.
+    Filings whose status changes while iterating are not revisited.
+    """
+    params = {"max_retries": max_retries, "after_id": 0, "limit": chunk_size}
+    while True:
+        chunk = session.scalars(stmt, params).all()
+        if not chunk:
+            return
+        params["after_id"] = chunk[-1].id
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+
 
 def get_unprocessed_filings(
-    session: Session, max_retries: int = 3
-) -> list[Filing]:
+    session: Session,
+    max_retries: int = 3,
+    chunk_size: int = FILING_CHUNK_SIZE,
+) -> Iterator[Filing]:
     """Return filings that have not completed the full pipeline.
 
     A filing is considered unprocessed if:
@@ -38,20 +181,33 @@ def get_unprocessed_filings(
     Args:
         session: Active SQLAlchemy session.
         max_retries: Maximum retry count before excluding a filing.
+        chunk_size: Filings loaded per query.
 
     Returns:
-        List of Filing objects needing processing.
+        Iterator of Filing objects needing processing, in id order.
     """
-    stmt = select(Filing).where(
-        Filing.status_emailed != "success",
-        Filing.retry_count < max_retries,
-    )
-    return list(session.scalars(stmt).all())
+    return _iter_filings(session, _UNPROCESSED_STMT, max_retries, chunk_size)
+
+
+def count_unprocessed_filings(session: Session, max_retries: int = 3) -> int:
+    """Count the filings :func:`get_unprocessed_filings` would return.
+
+    Args:
+        session: Active SQLAlchemy session.
+        max_retries: Maximum retry count before excluding a filing.
+
+    Returns:
+        Number of filings needing processing.
+    """
+    params = {"max_retries": max_retries}
+    return session.scalar(_COUNT_UNPROCESSED_STMT, params)
 
 
 def get_filings_for_download(
-    session: Session, max_retries: int = 3
-) -> list[Filing]:
+    session: Session,
+    max_retries: int = 3,
+    chunk_size: int = FILING_CHUNK_SIZE,
+) -> Iterator[Filing]:
     """Return filings that need PDF downloads.
 
     A filing needs download if:
@@ -60,30 +216,26 @@ def get_filings_for_download(
         - retry_count < max_retries (not exhausted)
 
     Eagerly loads the documents relationship so callers can iterate
-    documents without additional queries.
+    documents without additional queries.  Filings are loaded lazily in
+    chunks (see :func:`_iter_filings`).
 
     Args:
         session: Active SQLAlchemy session.
         max_retries: Maximum retry count before excluding a filing.
+        chunk_size: Filings (with their documents) loaded per query.
 
     Returns:
-        List of Filing objects with eagerly loaded documents.
+        Iterator of Filing objects with eagerly loaded documents, in id
+        order.
     """
-    stmt = (
-        select(Filing)
-        .where(
-            Filing.status_scraped == "success",
-            Filing.status_downloaded != "success",
-            Filing.retry_count < max_retries,
-        )
-        .options(selectinload(Filing.documents))
-    )
-    return list(session.scalars(stmt).all())
+    return _iter_filings(session, _DOWNLOAD_QUEUE_STMT, max_retries, chunk_size)
 
 
 def get_filings_for_extraction(
-    session: Session, max_retries: int = 3
-) -> list[Filing]:
+    session: Session,
+    max_retries: int = 3,
+    chunk_size: int = FILING_CHUNK_SIZE,
+) -> Iterator[Filing]:
     """Return filings that need PDF text extraction.
 
     A filing needs extraction if:
@@ -91,63 +243,132 @@ def get_filings_for_extraction(
         - status_extracted != "success" (not yet extracted), AND
         - retry_count < max_retries (not exhausted)
 
+    Filings whose documents are all extracted already are yielded too;
+    call :func:`skip_extracted_filings` first to mark them as done.
+
     Eagerly loads the documents relationship so callers can iterate
-    documents without additional queries.
+    documents without additional queries.  Filings are loaded lazily in
+    chunks (see :func:`_iter_filings`).
 
     Args:
         session: Active SQLAlchemy session.
         max_retries: Maximum retry count before excluding a filing.
+        chunk_size: Filings (with their documents) loaded per query.
 
     Returns:
-        List of Filing objects with eagerly loaded documents.
+        Iterator of Filing objects with eagerly loaded documents, in id
+        order.
     """
-    stmt = (
-        select(Filing)
-        .where(
-            Filing.status_downloaded == "success",
-            Filing.status_extracted != "success",
-            Filing.retry_count < max_retries,
-        )
-        .options(selectinload(Filing.documents))
-    )
-    return list(session.scalars(stmt).all())
+    return _iter_filings(session, _EXTRACTION_QUEUE_STMT, max_retries, chunk_size)
+
+
+def skip_extracted_filings(session: Session, max_retries: int = 3) -> int:
+    """Mark extraction-pending filings whose documents are all extracted.
+
+    Covers re-runs after a filing's documents were extracted but its step
+    was not recorded, and filings with no documents.  A single UPDATE
+    replaces loading each one and checking its markdown files on disk.
+
+    Args:
+        session: Active SQLAlchemy session.
+        max_retries: Maximum retry count before excluding a filing.
+
+    Returns:
+        Number of filings marked as extracted.
+    """
+    params = {"max_retries": max_retries}
+    count = session.execute(_SKIP_EXTRACTED_STMT, params).rowcount
+    session.commit()
+    logger.debug("Marked %d already-extracted filings as extracted", count)
+    return count
 
 
 def get_filings_for_analysis(
-    session: Session, max_retries: int = 3
-) -> list[Filing]:
+    session: Session,
+    max_retries: int = 3,
+    chunk_size: int = FILING_CHUNK_SIZE,
+) -> Iterator[Filing]:
     """Return filings that need LLM analysis.
 
     A filing needs analysis if:
         - status_extracted == "success" (text extraction completed), AND
         - status_analyzed != "success" (not yet analyzed), AND
-        - retry_count < max_retries (not exhausted)
+        - retry_count < max_retries (not exhausted), AND
+        - at least one document has successfully extracted, non-empty text
+
+    Filings without any extracted text are filtered out in SQL; use
+    :func:`skip_filings_without_text` to mark them as done.
 
     Eagerly loads the documents relationship so callers can assemble
-    the filing text from individual document extractions.
+    the filing text from individual document extractions.  Filings are
+    loaded lazily in chunks (see :func:`_iter_filings`).
 
     Args:
         session: Active SQLAlchemy session.
         max_retries: Maximum retry count before excluding a filing.
+        chunk_size: Filings (with their documents) loaded per query.
 
     Returns:
-        List of Filing objects with eagerly loaded documents.
+        Iterator of Filing objects with eagerly loaded documents, in id
+        order.
     """
-    stmt = (
-        select(Filing)
-        .where(
-            Filing.status_extracted == "success",
-            Filing.status_analyzed != "success",
-            Filing.retry_count < max_retries,
-        )
-        .options(selectinload(Filing.documents))
-    )
-    return list(session.scalars(stmt).all())
+    return _iter_filings(session, _ANALYSIS_QUEUE_STMT, max_retries, chunk_size)
+
+
+def skip_filings_without_text(session: Session, max_retries: int = 3) -> int:
+    """Mark analysis-pending filings that have no extracted text as analyzed.
+
+    These filings have nothing to send to the LLM, so they are a vacuous
+    success.  A single UPDATE replaces loading each one, walking its
+    documents in Python, and committing it individually.
+
+    Args:
+        session: Active SQLAlchemy session.
+        max_retries: Maximum retry count before excluding a filing.
+
+    Returns:
+        Number of filings marked as analyzed.
+    """
+    params = {"max_retries": max_retries}
+    count = session.execute(_SKIP_WITHOUT_TEXT_STMT, params).rowcount
+    session.commit()
+    logger.debug("Marked %d filings without extracted text as analyzed", count)
+    return count
+
+
+def _filing_pk_cache(session: Session) -> dict[str, int]:
+    """Return the session's filing_id -> primary key map.
+
+    Lives in ``session.info`` so it shares the session's lifetime.  Only
+    primary keys are stored; objects are fetched with ``session.get()``,
+    which is an identity-map lookup (no SQL) while the filing is loaded.
+    """
+    return session.info.setdefault(_FILING_PK_CACHE_KEY, {})
+
+
+def _get_cached_filing(session: Session, filing_id: str) -> Filing | None:
+    """Return the filing for *filing_id* via the PK cache, or None on a miss.
+
+    Entries are verified on use, so a key left stale by a rollback (or a
+    deleted row) is dropped instead of returning the wrong filing.
+    """
+    cache = _filing_pk_cache(session)
+    pk = cache.get(filing_id)
+    if pk is None:
+        return None
+    filing = session.get(Filing, pk)
+    if filing is None or filing.filing_id != filing_id:
+        del cache[filing_id]
+        return None
+    return filing
 
 
 def get_filing_by_id(session: Session, filing_id: str) -> Filing | None:
     """Look up a filing by its REGDOCS filing_id.
 
+    Filings already seen in this session are served from a per-session
+    filing_id -> primary key cache and the identity map, skipping the query.
+
     Args:
         session: Active SQLAlchemy session.
         filing_id: The REGDOCS filing identifier (not the database PK).
@@ -155,8 +376,15 @@ def get_filing_by_id(session: Session, filing_id: str) -> Filing | None:
     Returns:
         The Filing object, or None if not found.
     """
-    stmt = select(Filing).where(Filing.filing_id == filing_id)
-    return session.scalars(stmt).first()
+    filing = _get_cached_filing(session, filing_id)
+    if filing is not None:
+        return filing
+
+    params = {"filing_id": filing_id}
+    filing = session.scalars(_FILING_BY_ID_STMT, params).first()
+    if filing is not None:
+        _filing_pk_cache(session)[filing_id] = filing.id
+    return filing
 
 
 def mark_step_complete(
@@ -165,49 +393,105 @@ def mark_step_complete(
     step: str,
     status: str = "success",
     error: str | None = None,
+    commit: bool = True,
+    filing: Filing | None = None,
 ) -> None:
     """Update the status of a specific pipeline step for a filing.
 
+    Without a loaded ``filing``, the update is a single
+    ``UPDATE ... RETURNING`` by filing_id (no preceding SELECT), with
+    ``retry_count`` incremented in SQL.  With one, the loaded object is
+    modified and a call that would not change anything (status already set,
+    no error to record) returns without touching the session.
+
     Args:
         session: Active SQLAlchemy session.
         filing_id: The REGDOCS filing identifier.
         step: Pipeline step name (scraped, downloaded, extracted, analyzed, emailed).
         status: Status value to set (e.g., "success", "failed").
         error: Optional error message; if provided, also increments retry_count.
+        commit: Commit immediately (default).  Batch callers pass False and
+            commit once for many filings.
+        filing: The already-loaded Filing for ``filing_id``, if the caller
+            has it; the change is then written at the next flush.
 
     Raises:
-        ValueError: If step is not in VALID_STEPS.
+        ValueError: If step is not in VALID_STEPS, or no filing has
+            ``filing_id``.
     """
     if step not in VALID_STEPS:
         raise ValueError(
             f"Invalid step {step!r}. Must be one of: {VALID_STEPS}"
         )
 
-    filing = get_filing_by_id(session, filing_id)
+    attr = f"status_{step}"  # Safe: step was checked against VALID_STEPS
+
     if filing is None:
-        raise ValueError(f"Filing {filing_id!r} not found")
+        values: dict[str, object] = {attr: status}
+        if error is not None:
+            values["error_message"] = error
+            values["retry_count"] = Filing.retry_count + 1
+        stmt = (
+            update(Filing)
+            .where(Filing.filing_id == filing_id)
+            .values(values)
+            .returning(Filing.id)
+        )
+        pk = session.execute(stmt).scalar_one_or_none()
+        if pk is None:
+            raise ValueError(f"Filing {filing_id!r} not found")
+        # The ORM syncs loaded attributes of an in-session copy; one that
+        # never loaded error_message would otherwise keep reading None.
+        loaded = session.identity_map.get(identity_key(Filing, pk))
+        if loaded is not None and error is not None:
+            session.expire(loaded, ["error_message"])
+        if commit:
+            session.commit()
+        logger.debug(
+            "Updated filing %s: status_%s = %s", filing_id, step, status
+        )
+        return
 
-    setattr(filing, f"status_{step}", status)
+    if error is None and getattr(filing, attr) == status:
+        logger.debug(
+            "Filing %s: status_%s already %s", filing_id, step, status
+        )
+        return
+
+    setattr(filing, attr, status)
 
     if error is not None:
         filing.error_message = error
         filing.retry_count += 1
 
-    session.commit()
+    if commit:
+        session.commit()
     logger.debug(
         "Updated filing %s: status_%s = %s", filing_id, step, status
     )
 
 
-def create_filing(session: Session, filing_id: str, **kwargs) -> Filing:
-    """Create a new Filing record.
+def create_filing(
+    session: Session,
+    filing_id: str,
+    documents: list[dict] | None = None,
+    **kwargs,
+) -> Filing:
+    """Create a new Filing record, optionally with its Document rows.
 
     Sets status_scraped to "success" since the filing was just discovered
     by the scraper. All other status fields default to "pending".
 
+    Documents are written with a single Core ``INSERT`` (executemany)
+    instead of one ORM unit-of-work insert each, and committed together
+    with the filing.
+
     Args:
         session: Active SQLAlchemy session.
         filing_id: The REGDOCS filing identifier.
+        documents: Optional Document column values (document_url, filename,
+            content_type, ...), one dict per document; ``filing_id`` is
+            filled in.
         **kwargs: Additional Filing fields (applicant, filing_type, etc.).
 
     Returns:
@@ -215,7 +499,15 @@ def create_filing(session: Session, filing_id: str, **kwargs) -> Filing:
     """
     filing = Filing(filing_id=filing_id, status_scraped="success", **kwargs)
     session.add(filing)
+    if documents:
+        session.flush()  # Assigns filing.id
+        session.execute(
+            insert(Document), [{**doc, "filing_id": filing.id} for doc in documents]
+        )
+        # Rows bypassed the ORM; load the collection fresh if it is accessed
+        session.expire(filing, ["documents"])
     session.commit()
+    _filing_pk_cache(session)[filing_id] = filing.id
     logger.info("Created filing %s", filing_id)
     return filing
 
@@ -223,7 +515,9 @@ def create_filing(session: Session, filing_id: str, **kwargs) -> Filing:
 def filing_exists(session: Session, filing_id: str) -> bool:
     """Check whether a filing with the given filing_id exists.
 
-    Uses a lightweight query selecting only the primary key.
+    Filings already seen in this session are answered from the per-session
+    primary key cache; otherwise a lightweight query selects only the
+    primary key (and caches it).
 
     Args:
         session: Active SQLAlchemy session.
@@ -232,5 +526,12 @@ def filing_exists(session: Session, filing_id: str) -> bool:
     Returns:
         True if the filing exists, False otherwise.
     """
-    stmt = select(Filing.id).where(Filing.filing_id == filing_id)
-    return session.scalars(stmt).first() is not None
+    if _get_cached_filing(session, filing_id) is not None:
+        return True
+
+    params = {"filing_id": filing_id}
+    pk = session.scalar(_FILING_PK_BY_ID_STMT, params)
+    if pk is None:
+        return False
+    _filing_pk_cache(session)[filing_id] = pk
+    return True
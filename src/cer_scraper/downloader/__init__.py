@@ -1,7 +1,8 @@
 """Filing-level download orchestrator with all-or-nothing semantics.
 
-Iterates over filings that need PDF downloads, downloads all their documents
-sequentially using the download service, and updates database state.  If ANY
+Iterates over filings that need PDF downloads, downloads each filing's
+documents concurrently on a small thread pool using the download service,
+and updates database state.  If ANY
 document in a filing fails, the entire filing directory is cleaned up and all
 documents are reset (all-or-nothing).  One filing's failure does not block
 others -- the orchestrator continues to the next filing.
@@ -13,9 +14,14 @@ Public API:
 
 from __future__ import annotations
 
+import atexit
+import functools
+import itertools
 import logging
+import os
 import shutil
 import ssl
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -26,15 +32,19 @@ from cer_scraper.config.settings import (
     PROJECT_ROOT,
     ScraperSettings,
 )
-from cer_scraper.db.models import Filing
+from cer_scraper.db.engine import expire_on_commit_disabled
+from cer_scraper.db.models import Document, Filing
 from cer_scraper.db.state import get_filings_for_download, mark_step_complete
-from cer_scraper.downloader.service import download_pdf
+from cer_scraper.downloader.service import DownloadResult, download_pdf
 from cer_scraper.scraper.rate_limiter import wait_between_requests
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["download_filings", "DownloadBatchResult"]
 
+# Number of filings whose status updates share a single commit
+COMMIT_BATCH_SIZE = 10
+
 
 @dataclass
 class DownloadBatchResult:
@@ -49,6 +59,49 @@ class DownloadBatchResult:
     errors: list[str] = field(default_factory=list)
 
 
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Return the shared TLS context for REGDOCS downloads.
+
+    REGDOCS requires SECLEVEL=1 cipher compatibility on Windows.  Building
+    the context loads the certificate store, so it is created once on first
+    use and reused by every batch.
+    """
+    ssl_ctx = ssl.create_default_context()
+    ssl_ctx.set_ciphers("DEFAULT@SECLEVEL=1")
+    return ssl_ctx
+
+
+@functools.cache
+def _http_client(timeout_seconds: float) -> httpx.Client:
+    """Return the process-wide HTTP client for REGDOCS downloads.
+
+    Shared across ``download_filings`` calls so pooled keep-alive
+    connections (and their TLS sessions) outlive a single batch, and
+    HTTP/2-capable so concurrent document fetches multiplex over one
+    connection.  Closed at interpreter exit.
+    """
+    client = httpx.Client(
+        http2=True,
+        timeout=timeout_seconds,
+        verify=_ssl_context(),
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _expunge_filings(session, filings: list[Filing]) -> None:
+    """Detach committed filings (and, by cascade, their documents).
+
+    Keeps the session's identity map from holding every filing of a long
+    batch; call only after the filings' changes have been committed.
+    """
+    for filing in filings:
+        session.expunge(filing)
+
+
 def _build_filing_dir(filing: Filing, base_dir: Path) -> Path:
     """Build the directory path for a filing's downloaded documents.
 
@@ -63,21 +116,81 @@ def _build_filing_dir(filing: Filing, base_dir: Path) -> Path:
     return base_dir / f"{date_prefix}_Filing-{filing.filing_id}" / "documents"
 
 
+def _remove_tree(path: Path) -> None:
+    """Delete a filing directory tree of plain files.
+
+    A filing directory only holds ``documents/`` with ``.pdf`` and
+    ``.pdf.tmp`` files, so a direct ``os.scandir`` walk (using the entry's
+    cached type) replaces ``shutil.rmtree``.  Errors propagate instead of
+    being ignored.
+
+    Raises:
+        FileNotFoundError: If *path* does not exist.
+        OSError: If an entry or directory cannot be removed.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _has_failed(future: Future[DownloadResult]) -> bool:
+    """Return True if *future* has already finished unsuccessfully."""
+    if not future.done():
+        return False
+    return future.exception() is not None or not future.result().success
+
+
+def _reuse_download(
+    source: Path, size: int, dest_path: Path
+) -> Future[DownloadResult] | None:
+    """Place an already-downloaded PDF at *dest_path* without fetching it.
+
+    Hard-links *source* (falling back to a copy, e.g. across devices) and
+    returns a completed future shaped like a download.  Returns None if the
+    file cannot be reused -- for instance because the filing that owned it
+    was cleaned up -- so the caller downloads it instead.
+    """
+    try:
+        os.link(source, dest_path)
+    except OSError:
+        try:
+            shutil.copyfile(source, dest_path)
+        except OSError:
+            return None
+    future: Future[DownloadResult] = Future()
+    future.set_result(DownloadResult(success=True, bytes_downloaded=size))
+    return future
+
+
 def _download_filing(
     filing: Filing,
+    base_dir: Path,
     pipeline_settings: PipelineSettings,
     scraper_settings: ScraperSettings,
     http_client: httpx.Client,
+    executor: ThreadPoolExecutor,
+    url_cache: dict[str, tuple[Path, int]],
 ) -> tuple[bool, str | None, int, int]:
     """Download all documents for a single filing.
 
+    Documents are submitted to *executor* one at a time, with the rate
+    limiter's delay between request starts, so transfers overlap while the
+    request rate stays the same.  Submission stops early once a download
+    has failed, since the filing is then discarded anyway.  *base_dir* is
+    the resolved filings directory, computed once per batch.
+
+    *url_cache* maps document URLs downloaded earlier in the batch to their
+    ``(path, size)``; such documents are hard-linked instead of fetched
+    again, and this filing's downloads are added once it succeeds.
+
     Returns:
         A tuple of (success, error_message, pdf_count, total_bytes).
         On failure, partial files are cleaned up and document records reset.
     """
-    base_dir = (PROJECT_ROOT / pipeline_settings.filings_dir).resolve()
-    filing_dir = _build_filing_dir(filing, base_dir)
-
     documents = filing.documents
     if not documents:
         logger.info(
@@ -85,32 +198,76 @@ def _download_filing(
             filing.filing_id,
         )
         return (True, None, 0, 0)
+    num_documents = len(documents)
 
-    pdf_count = 0
-    total_bytes = 0
+    # Created once here; download_pdf expects the directory to exist
+    filing_dir = _build_filing_dir(filing, base_dir)
+    filing_dir.mkdir(parents=True, exist_ok=True)
 
+    submitted: list[tuple[int, Document, Path, Future[DownloadResult]]] = []
+    requested = False
     for idx, doc in enumerate(documents, start=1):
-        filename = f"doc_{idx:03d}.pdf"
-        dest_path = filing_dir / filename
+        dest_path = filing_dir / f"doc_{idx:03d}.pdf"
+
+        cached = url_cache.get(doc.document_url)
+        if cached is not None:
+            reused = _reuse_download(*cached, dest_path)
+            if reused is not None:
+                logger.info(
+                    "Reusing %s from %s", doc.document_url, cached[0]
+                )
+                submitted.append((idx, doc, dest_path, reused))
+                continue
 
-        result = download_pdf(
+        if requested:
+            # Rate limit between download starts
+            wait_between_requests(
+                scraper_settings.delay_min_seconds,
+                scraper_settings.delay_max_seconds,
+            )
+            if any(_has_failed(future) for *_, future in submitted):
+                break
+        requested = True
+
+        future = executor.submit(
+            download_pdf,
             doc.document_url,
             dest_path,
             pipeline_settings,
             http_client,
         )
+        submitted.append((idx, doc, dest_path, future))
+
+    # Let every started download finish (or clean up its .tmp) before
+    # inspecting results, so none is still writing during cleanup below.
+    wait([future for *_, future in submitted])
+
+    pdf_count = 0
+    total_bytes = 0
+
+    for idx, doc, dest_path, future in submitted:
+        result = future.result()
 
         if not result.success:
             error_msg = (
-                f"Filing {filing.filing_id}: document {idx}/{len(documents)} "
+                f"Filing {filing.filing_id}: document {idx}/{num_documents} "
                 f"failed ({doc.document_url}): {result.error}"
             )
             logger.error(error_msg)
 
             # All-or-nothing: clean up entire filing directory
             parent_dir = filing_dir.parent
-            if parent_dir.exists():
-                shutil.rmtree(parent_dir, ignore_errors=True)
+            try:
+                _remove_tree(parent_dir)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.warning(
+                    "Failed to clean up filing directory %s",
+                    parent_dir,
+                    exc_info=True,
+                )
+            else:
                 logger.info(
                     "Cleaned up filing directory %s after failure",
                     parent_dir,
@@ -130,12 +287,8 @@ def _download_filing(
         pdf_count += 1
         total_bytes += result.bytes_downloaded
 
-        # Rate limit between downloads (skip after the last one)
-        if idx < len(documents):
-            wait_between_requests(
-                scraper_settings.delay_min_seconds,
-                scraper_settings.delay_max_seconds,
-            )
+    for _, doc, dest_path, future in submitted:
+        url_cache[doc.document_url] = (dest_path, future.result().bytes_downloaded)
 
     return (True, None, pdf_count, total_bytes)
 
@@ -148,9 +301,13 @@ def download_filings(
     """Download PDFs for all pending filings.
 
     Iterates over filings returned by ``get_filings_for_download()``,
-    downloads each filing's documents sequentially, and updates database
-    state.  Each filing is committed independently so one failure does not
-    affect others.
+    downloads each filing's documents (up to
+    ``pipeline_settings.max_concurrent_downloads`` at a time), and updates
+    database state.  Each filing's writes run inside a savepoint so one
+    failure does not affect others; status updates are committed every
+    ``COMMIT_BATCH_SIZE`` filings and once more at the end.  Filings are
+    loaded in chunks and expunged from the session once committed, so
+    memory stays flat regardless of batch size.
 
     Parameters
     ----------
@@ -173,22 +330,33 @@ def download_filings(
             session, pipeline_settings.max_retry_count
         )
 
-        if not filings:
+        # Filings are streamed in chunks; peek so an empty queue returns
+        # before any client or worker is set up.
+        first = next(filings, None)
+        if first is None:
             logger.info("No filings pending download")
             return batch
-
-        logger.info("Found %d filings pending download", len(filings))
-
-        # REGDOCS requires SECLEVEL=1 cipher compatibility on Windows.
-        ssl_ctx = ssl.create_default_context()
-        ssl_ctx.set_ciphers("DEFAULT@SECLEVEL=1")
-
-        with httpx.Client(
-            timeout=pipeline_settings.download_timeout_seconds,
-            verify=ssl_ctx,
-            follow_redirects=True,
-        ) as http_client:
-            for filing in filings:
+        filings = itertools.chain((first,), filings)
+
+        # Resolved once per batch rather than once per filing
+        base_dir = (PROJECT_ROOT / pipeline_settings.filings_dir).resolve()
+
+        # Document URL -> (path, size) of PDFs downloaded in this batch
+        url_cache: dict[str, tuple[Path, int]] = {}
+
+        # Documents were eagerly loaded above; keep them loaded across the
+        # batch commits instead of lazily re-querying each filing.
+        http_client = _http_client(pipeline_settings.download_timeout_seconds)
+        with (
+            expire_on_commit_disabled(session),
+            ThreadPoolExecutor(
+                max_workers=max(1, pipeline_settings.max_concurrent_downloads),
+                thread_name_prefix="downloader",
+            ) as executor,
+        ):
+            uncommitted: list[Filing] = []
+            for idx, filing in enumerate(filings, start=1):
+                uncommitted.append(filing)
                 batch.filings_attempted += 1
                 logger.info(
                     "Downloading filing %s (%d documents)",
@@ -197,23 +365,42 @@ def download_filings(
                 )
 
                 try:
-                    success, error_msg, pdf_count, total_bytes = (
-                        _download_filing(
-                            filing,
-                            pipeline_settings,
-                            scraper_settings,
-                            http_client,
+                    # Savepoint per filing: an exception rolls back only this
+                    # filing's writes, not the rest of the uncommitted batch.
+                    with session.begin_nested():
+                        success, error_msg, pdf_count, total_bytes = (
+                            _download_filing(
+                                filing,
+                                base_dir,
+                                pipeline_settings,
+                                scraper_settings,
+                                http_client,
+                                executor,
+                                url_cache,
+                            )
                         )
-                    )
+
+                        if success:
+                            mark_step_complete(
+                                session,
+                                filing.filing_id,
+                                "downloaded",
+                                "success",
+                                commit=False,
+                                filing=filing,
+                            )
+                        else:
+                            mark_step_complete(
+                                session,
+                                filing.filing_id,
+                                "downloaded",
+                                "failed",
+                                error=error_msg,
+                                commit=False,
+                                filing=filing,
+                            )
 
                     if success:
-                        mark_step_complete(
-                            session,
-                            filing.filing_id,
-                            "downloaded",
-                            "success",
-                        )
-                        session.commit()
                         batch.filings_succeeded += 1
                         batch.total_pdfs_downloaded += pdf_count
                         batch.total_bytes += total_bytes
@@ -224,14 +411,6 @@ def download_filings(
                             total_bytes,
                         )
                     else:
-                        mark_step_complete(
-                            session,
-                            filing.filing_id,
-                            "downloaded",
-                            "failed",
-                            error=error_msg,
-                        )
-                        session.commit()
                         batch.filings_failed += 1
                         batch.errors.append(error_msg or "Unknown error")
                         logger.error(
@@ -246,13 +425,14 @@ def download_filings(
                         filing.filing_id,
                     )
                     try:
-                        session.rollback()
                         mark_step_complete(
                             session,
                             filing.filing_id,
                             "downloaded",
                             "failed",
                             error="Unexpected error during download",
+                            commit=False,
+                            filing=filing,
                         )
                     except Exception:
                         logger.exception(
@@ -264,6 +444,14 @@ def download_filings(
                         f"Filing {filing.filing_id}: unexpected error"
                     )
 
+                # Amortize commit/fsync cost over several filings
+                if idx % COMMIT_BATCH_SIZE == 0:
+                    session.commit()
+                    _expunge_filings(session, uncommitted)
+                    uncommitted.clear()
+
+            session.commit()
+
     except Exception:
         logger.exception("Fatal error in download orchestrator")
         batch.errors.append("Fatal error in download orchestrator")
@@ -13,6 +13,8 @@ only on transient HTTP and transport errors.
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -39,6 +41,87 @@ class DownloadResult:
     error: str | None = None
 
 
+# Streaming write batching: flush buffered chunks in one vectored write
+# once either limit is reached
+_WRITE_BATCH_CHUNKS = 16
+_WRITE_BATCH_BYTES = 1 << 20
+
+# Content types that mean we got a web page rather than the PDF
+_HTML_MEDIA_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# O_BINARY only exists (and matters) on Windows
+_TMP_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)
+
+# os.writev is POSIX-only; elsewhere buffers are written one by one
+_writev = getattr(os, "writev", None)
+
+
+def _write_all(fd: int, buffers: list[bytes], total: int) -> None:
+    """Write *buffers* (``total`` bytes in all) to *fd*, retrying short writes.
+
+    Uses a single ``writev`` call where available; a short write falls back
+    to plain ``os.write`` for the remainder.
+    """
+    if _writev is not None:
+        written = _writev(fd, buffers)
+        if written == total:
+            return
+        buffers = [b"".join(buffers)[written:]]
+
+    for buf in buffers:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+def _validate_response_headers(
+    response: httpx.Response, max_size: int
+) -> str | None:
+    """Check a response's headers before streaming its body.
+
+    Rejects HTML pages (REGDOCS serves an HTML viewer or error page instead
+    of the PDF in some cases) and bodies whose declared Content-Length is
+    over *max_size*.  A missing or malformed Content-Length passes; the
+    streaming loop enforces the limit on the actual bytes.
+
+    Returns:
+        An error message, or None if the headers are acceptable.
+    """
+    headers = response.headers
+    media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if media_type in _HTML_MEDIA_TYPES:
+        return "Response is HTML, not a PDF binary"
+
+    content_length = headers.get("content-length", "")
+    if content_length.isdigit():
+        declared_size = int(content_length)
+        if declared_size > max_size:
+            return (
+                f"PDF exceeds max size limit "
+                f"({declared_size} bytes > {max_size} bytes)"
+            )
+    return None
+
+
+def _iter_body(response: httpx.Response, chunk_size: int) -> Iterator[bytes]:
+    """Iterate over the response body in *chunk_size* pieces.
+
+    PDFs are normally served without a ``Content-Encoding``; the raw stream
+    is then used directly, skipping httpx's content decoder.  Encoded
+    responses, and bodies already read into memory (e.g. from a mock
+    transport), go through ``iter_bytes``.
+    """
+    encoding = response.headers.get("content-encoding", "identity")
+    if not response.is_stream_consumed and encoding.strip().lower() in (
+        "",
+        "identity",
+    ):
+        return response.iter_raw(chunk_size=chunk_size)
+    return response.iter_bytes(chunk_size=chunk_size)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=30),
@@ -71,41 +154,27 @@ def _download_with_retry(
         ) as response:
             response.raise_for_status()
 
-            # --- Content-Type check ---
-            content_type = response.headers.get("content-type", "")
-            if "text/html" in content_type.lower():
+            # --- Content-Type / Content-Length pre-checks ---
+            header_error = _validate_response_headers(
+                response, settings.max_pdf_size_bytes
+            )
+            if header_error is not None:
                 return DownloadResult(
-                    success=False,
-                    bytes_downloaded=0,
-                    error="Response is HTML, not a PDF binary",
+                    success=False, bytes_downloaded=0, error=header_error
                 )
 
-            # --- Content-Length pre-check ---
-            content_length = response.headers.get("content-length")
-            if content_length is not None:
-                try:
-                    declared_size = int(content_length)
-                except ValueError:
-                    declared_size = 0
-                if declared_size > settings.max_pdf_size_bytes:
-                    return DownloadResult(
-                        success=False,
-                        bytes_downloaded=0,
-                        error=(
-                            f"PDF exceeds max size limit "
-                            f"({declared_size} bytes > "
-                            f"{settings.max_pdf_size_bytes} bytes)"
-                        ),
-                    )
-
             # --- Streaming write ---
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
             bytes_written = 0
 
-            with open(tmp_path, "wb") as f:
-                for chunk in response.iter_bytes(
-                    chunk_size=settings.download_chunk_size,
-                ):
+            # Chunks are written straight from httpx's bytes objects through
+            # a raw fd, several per syscall, rather than per chunk through a
+            # buffered file object.  The .tmp file is removed in the outer
+            # finally on any early return.
+            fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o644)
+            try:
+                pending: list[bytes] = []
+                pending_size = 0
+                for chunk in _iter_body(response, settings.download_chunk_size):
                     bytes_written += len(chunk)
 
                     # Runtime size guard
@@ -117,10 +186,6 @@ def _download_with_retry(
                             bytes_written,
                             settings.max_pdf_size_bytes,
                         )
-                        # Clean up tmp inside this block, then return failure
-                        f.close()
-                        if tmp_path.exists():
-                            tmp_path.unlink()
                         return DownloadResult(
                             success=False,
                             bytes_downloaded=bytes_written,
@@ -131,12 +196,27 @@ def _download_with_retry(
                             ),
                         )
 
-                    f.write(chunk)
-                    logger.debug(
-                        "Downloaded %d bytes so far for %s",
-                        bytes_written,
-                        dest_path.name,
-                    )
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if (
+                        len(pending) >= _WRITE_BATCH_CHUNKS
+                        or pending_size >= _WRITE_BATCH_BYTES
+                    ):
+                        _write_all(fd, pending, pending_size)
+                        pending.clear()
+                        pending_size = 0
+                        # Progress once per write batch, not per chunk
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Downloaded %d bytes so far for %s",
+                                bytes_written,
+                                dest_path.name,
+                            )
+
+                if pending:
+                    _write_all(fd, pending, pending_size)
+            finally:
+                os.close(fd)
 
         # --- Success: rename .tmp -> .pdf ---
         tmp_path.rename(dest_path)
@@ -185,6 +265,7 @@ def download_pdf(
         Direct PDF URL or REGDOCS ``/Item/View/{ID}`` viewer URL.
     dest_path:
         Local filesystem path where the final ``.pdf`` should be saved.
+        Its parent directory must already exist.
     settings:
         Pipeline configuration (provides size limits, chunk size, timeout).
     http_client:
@@ -7,6 +7,11 @@ tolerates individual document failures -- a filing is marked "success" if at
 least one document is successfully extracted.  One filing's failure does not
 block others -- the orchestrator continues to the next filing.
 
+Extraction is CPU-bound, so filings are processed in a pool of worker
+processes.  Workers only see plain-data snapshots of their filing and never
+touch the database; results are applied to the session on the calling
+process.
+
 Public API:
     extract_filings(session, extraction_settings)
         -> ExtractionBatchResult
@@ -14,15 +19,42 @@ Public API:
 
 from __future__ import annotations
 
+import datetime
+import itertools
 import logging
+import logging.handlers
+import multiprocessing
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from sqlalchemy import update
+
 from cer_scraper.config.settings import ExtractionSettings
-from cer_scraper.db.models import Filing
-from cer_scraper.db.state import get_filings_for_extraction, mark_step_complete
-from cer_scraper.extractor.markdown import should_extract, write_markdown_file
+from cer_scraper.db.engine import expire_on_commit_disabled
+from cer_scraper.db.models import Document, Filing
+from cer_scraper.db.state import (
+    get_filings_for_extraction,
+    mark_step_complete,
+    skip_extracted_filings,
+)
+from cer_scraper.extractor.cache import (
+    get_cache_root,
+    load_cached_extraction,
+    pdf_digest,
+    prune_extraction_cache,
+    store_cached_extraction,
+)
+from cer_scraper.extractor.markdown import list_extracted, write_markdown_file
 from cer_scraper.extractor.service import extract_document
+from cer_scraper.extractor.types import ExtractionResult
 
 logger = logging.getLogger(__name__)
 
@@ -42,41 +74,53 @@ class ExtractionBatchResult:
     errors: list[str] = field(default_factory=list)
 
 
-def _extract_filing_documents(
-    session,
-    filing: Filing,
-    settings: ExtractionSettings,
-) -> tuple[bool, str | None, int, int]:
-    """Extract text from all downloaded documents in a single filing.
+@dataclass(frozen=True)
+class _FilingSnapshot:
+    """Plain-data copy of everything a worker needs to extract a filing.
+
+    Built on the calling process so workers never touch ORM objects.
+    ``documents`` holds ``(document_id, position, local_path)`` for each
+    downloaded document; ``document_count`` includes the rest.
+    """
 
-    Iterates over the filing's documents, skipping those not downloaded or
-    already extracted.  For each eligible document, runs the tiered extraction
-    service, writes a markdown file alongside the PDF, and updates the
-    Document record in the database.
+    filing_id: str
+    document_count: int
+    documents: tuple[tuple[int, int, str], ...]
 
-    Unlike the downloader, individual document failures do NOT fail the
-    entire filing.  A filing is considered successful if at least one
-    document was extracted.
+
+# Document columns a worker's updates may set
+_EXTRACTION_FIELDS = (
+    "extraction_status",
+    "extraction_method",
+    "extraction_error",
+    "char_count",
+    "page_count",
+)
+
+
+@dataclass
+class _FilingOutcome:
+    """Result of extracting one filing, ready to be persisted."""
+
+    has_any_success: bool
+    error: str | None = None
+    success_count: int = 0
+    fail_count: int = 0
+    # Document rows keyed by "id" plus the _EXTRACTION_FIELDS to set
+    updates: list[dict[str, object]] = field(default_factory=list)
+
+
+def _snapshot_filing(filing: Filing) -> _FilingSnapshot:
+    """Copy a filing's downloaded document paths out of the ORM objects.
 
     Args:
-        session: Active SQLAlchemy session (for Document attribute updates).
         filing: Filing object with eagerly loaded documents.
-        settings: Extraction configuration (thresholds, OCR settings).
 
     Returns:
-        Tuple of (has_any_success, error_summary, success_count, fail_count).
+        Detached, picklable snapshot.
     """
-    success_count = 0
-    fail_count = 0
-    error_messages: list[str] = []
-
     documents = filing.documents
-    if not documents:
-        logger.info(
-            "Filing %s has no documents to extract, skipping", filing.filing_id
-        )
-        return (True, None, 0, 0)
-
+    eligible: list[tuple[int, int, str]] = []
     for idx, doc in enumerate(documents, start=1):
         # Skip documents that were not successfully downloaded
         if doc.download_status != "success":
@@ -88,76 +132,272 @@ def _extract_filing_documents(
                 doc.download_status,
             )
             continue
+        eligible.append((doc.id, idx, doc.local_path))
 
-        # Build paths
-        pdf_path = Path(doc.local_path)
-        md_path = pdf_path.with_suffix(".md")
+    return _FilingSnapshot(
+        filing_id=filing.filing_id,
+        document_count=len(documents),
+        documents=tuple(eligible),
+    )
 
-        # Idempotency: skip if markdown already exists with content
-        if not should_extract(md_path):
-            logger.info(
-                "Skipping document %d/%d for filing %s: already extracted (%s)",
-                idx,
-                len(documents),
-                filing.filing_id,
-                md_path.name,
-            )
-            success_count += 1
-            continue
 
-        # Run tiered extraction
-        result = extract_document(pdf_path, settings)
-
-        if result.success:
-            # Write markdown file alongside the PDF
-            write_markdown_file(
-                md_path,
-                result.markdown,
-                result.method.value,
-                result.page_count,
-                result.char_count,
-                pdf_path.name,
-            )
+def _extract_or_load_cached(
+    pdf_path: Path, settings: ExtractionSettings
+) -> ExtractionResult:
+    """Extract a PDF, serving it from the content-addressed cache if possible.
 
-            # Update Document record in database
-            doc.extraction_status = "success"
-            doc.extraction_method = result.method.value
-            doc.extracted_text = result.markdown
-            doc.char_count = result.char_count
-            doc.page_count = result.page_count
+    Only successful results are cached, so failures are retried on re-runs.
+    """
+    cache_root = get_cache_root(settings)
+    if cache_root is None:
+        return extract_document(pdf_path, settings)
 
-            success_count += 1
-            logger.info(
-                "Extracted document %d/%d for filing %s: %s (%d chars, %d pages)",
-                idx,
-                len(documents),
-                filing.filing_id,
-                result.method.value,
-                result.char_count,
-                result.page_count,
-            )
-        else:
-            # Mark individual document as failed but continue
-            doc.extraction_status = "failed"
-            doc.extraction_error = result.error
-
-            fail_count += 1
-            error_msg = (
-                f"Document {idx}/{len(documents)} failed: {result.error}"
-            )
-            error_messages.append(error_msg)
+    try:
+        digest = pdf_digest(pdf_path)
+    except OSError:
+        # Let the extraction service report the unreadable file
+        return extract_document(pdf_path, settings)
+
+    result = load_cached_extraction(cache_root, digest, settings)
+    if result is not None:
+        logger.info(
+            "Extraction cache hit for %s (%s)", pdf_path.name, digest[:12]
+        )
+        return result
+
+    result = extract_document(pdf_path, settings)
+    if result.success:
+        try:
+            store_cached_extraction(cache_root, digest, settings, result)
+        except OSError as e:
             logger.warning(
-                "Failed to extract document %d/%d for filing %s: %s",
-                idx,
-                len(documents),
-                filing.filing_id,
-                result.error,
+                "Could not cache extraction for %s: %s", pdf_path.name, e
             )
+    return result
 
-    has_any_success = success_count > 0
-    error_summary = "; ".join(error_messages) if error_messages else None
 
-    return (has_any_success, error_summary, success_count, fail_count)
+def _extract_filing_documents(
+    snapshot: _FilingSnapshot,
+    settings: ExtractionSettings,
+    extraction_date: str,
+) -> _FilingOutcome:
+    """Extract text from all downloaded documents in a single filing.
+
+    Runs in a worker process.  For each downloaded document not already
+    extracted, runs the tiered extraction service and writes a markdown
+    file alongside the PDF.  The Document field updates are returned rather
+    than applied, so the caller can persist them with its own session.
+
+    Unlike the downloader, individual document failures do NOT fail the
+    entire filing.  A filing is considered successful if at least one
+    document was extracted.
+
+    Args:
+        snapshot: Filing snapshot from :func:`_snapshot_filing`.
+        settings: Extraction configuration (thresholds, OCR settings).
+        extraction_date: Batch timestamp recorded in each markdown file.
+
+    Returns:
+        _FilingOutcome with per-document updates and counts.
+    """
+    outcome = _FilingOutcome(has_any_success=False)
+    error_messages: list[str] = []
+    total = snapshot.document_count
+    filing_id = snapshot.filing_id
+
+    if not total:
+        logger.info("Filing %s has no documents to extract, skipping", filing_id)
+        outcome.has_any_success = True
+        return outcome
+
+    # Non-empty markdown files per directory, scanned once per filing
+    extracted: dict[Path, frozenset[str]] = {}
+
+    # Markdown writes run on a thread (file I/O releases the GIL) while
+    # the next document is extracted; leaving the block waits for them
+    writes: list[Future[None]] = []
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for document_id, idx, local_path in snapshot.documents:
+            # Build paths
+            pdf_path = Path(local_path)
+            md_path = pdf_path.with_suffix(".md")
+
+            # Idempotency: skip if markdown already exists with content
+            existing = extracted.get(md_path.parent)
+            if existing is None:
+                existing = extracted[md_path.parent] = list_extracted(md_path.parent)
+            if md_path.name in existing:
+                logger.info(
+                    "Skipping document %d/%d for filing %s: already extracted (%s)",
+                    idx,
+                    total,
+                    filing_id,
+                    md_path.name,
+                )
+                outcome.success_count += 1
+                continue
+
+            # Reuse the result for identical PDF bytes, else run tiered extraction
+            result = _extract_or_load_cached(pdf_path, settings)
+
+            if result.success:
+                # Write markdown file alongside the PDF, in the background
+                writes.append(
+                    writer.submit(
+                        write_markdown_file,
+                        md_path,
+                        result.markdown,
+                        result.method.value,
+                        result.page_count,
+                        result.char_count,
+                        pdf_path.name,
+                        extraction_date,
+                    )
+                )
+
+                outcome.updates.append(
+                    {
+                        "id": document_id,
+                        "extraction_status": "success",
+                        "extraction_method": result.method.value,
+                        "char_count": result.char_count,
+                        "page_count": result.page_count,
+                    }
+                )
+
+                outcome.success_count += 1
+                logger.info(
+                    "Extracted document %d/%d for filing %s: %s (%d chars, %d pages)",
+                    idx,
+                    total,
+                    filing_id,
+                    result.method.value,
+                    result.char_count,
+                    result.page_count,
+                )
+            else:
+                # Mark individual document as failed but continue
+                outcome.updates.append(
+                    {
+                        "id": document_id,
+                        "extraction_status": "failed",
+                        "extraction_error": result.error,
+                    }
+                )
+
+                outcome.fail_count += 1
+                error_messages.append(f"Document {idx}/{total} failed: {result.error}")
+                logger.warning(
+                    "Failed to extract document %d/%d for filing %s: %s",
+                    idx,
+                    total,
+                    filing_id,
+                    result.error,
+                )
+
+    # Surface any write error before the filing is reported as extracted
+    for write in writes:
+        write.result()
+
+    outcome.has_any_success = outcome.success_count > 0
+    outcome.error = "; ".join(error_messages) if error_messages else None
+    return outcome
+
+
+def _apply_updates(
+    session, filing: Filing, updates: list[dict[str, object]]
+) -> None:
+    """Write a worker's Document updates as a bulk UPDATE by primary key.
+
+    The rows go to the database in one executemany rather than through
+    per-attribute change tracking.  Bulk UPDATE bypasses the identity map,
+    so the filing's loaded Documents are expired afterwards and any later
+    read sees the new values.
+    """
+    if not updates:
+        return
+    session.execute(update(Document), updates)
+    updated_ids = {row["id"] for row in updates}
+    for doc in filing.documents:
+        if doc.id in updated_ids:
+            session.expire(doc, _EXTRACTION_FIELDS)
+
+
+def _record_outcome(
+    session,
+    filing: Filing,
+    outcome: _FilingOutcome,
+    batch: ExtractionBatchResult,
+) -> None:
+    """Persist one filing's outcome and fold it into the batch totals.
+
+    Args:
+        session: Active SQLAlchemy session.
+        filing: Filing ORM object the outcome belongs to.
+        outcome: Result returned by :func:`_extract_filing_documents`.
+        batch: Batch statistics to update.
+    """
+    _apply_updates(session, filing, outcome.updates)
+
+    if outcome.has_any_success:
+        mark_step_complete(
+            session, filing.filing_id, "extracted", "success", filing=filing
+        )
+        batch.filings_succeeded += 1
+        batch.total_docs_extracted += outcome.success_count
+        batch.total_docs_failed += outcome.fail_count
+        logger.info(
+            "Filing %s extraction complete: %d docs OK, %d failed",
+            filing.filing_id,
+            outcome.success_count,
+            outcome.fail_count,
+        )
+    else:
+        error = outcome.error or "No documents successfully extracted"
+        mark_step_complete(
+            session,
+            filing.filing_id,
+            "extracted",
+            "failed",
+            error=error,
+            filing=filing,
+        )
+        batch.filings_failed += 1
+        batch.total_docs_failed += outcome.fail_count
+        batch.errors.append(f"Filing {filing.filing_id}: {error}")
+        logger.warning(
+            "Filing %s extraction failed: %s",
+            filing.filing_id,
+            error,
+        )
+
+
+def _get_max_workers(settings: ExtractionSettings) -> int:
+    """Return the worker process count: configured, capped at the CPU count."""
+    cpu_count = os.cpu_count() or 1
+    if settings.max_workers is None:
+        return cpu_count
+    return max(1, min(settings.max_workers, cpu_count))
+
+
+class _ForwardingHandler(logging.Handler):
+    """Re-dispatch records from worker processes to this process's loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(log_queue, level: int) -> None:
+    """Set up a worker process: logging back to the parent, OCR threads.
+
+    Log records go to the parent's handlers over *log_queue*.  Tesseract
+    is limited to one OpenMP thread per process (unless configured
+    otherwise), since the workers already occupy every CPU.
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 
 def extract_filings(
@@ -167,7 +407,10 @@ def extract_filings(
     """Extract text from PDFs for all filings pending extraction.
 
     Queries filings that have been downloaded but not yet extracted, then
-    processes each one independently.  Per-filing error isolation ensures
+    processes each one independently.  Filings are extracted concurrently
+    in up to ``extraction_settings.max_workers`` processes (one per CPU by
+    default); the session is only used on the calling process, where each
+    result is committed as it arrives.  Per-filing error isolation ensures
     one filing failure does not block others.
 
     Args:
@@ -181,85 +424,116 @@ def extract_filings(
     max_retries = 3
 
     try:
-        filings = get_filings_for_extraction(session, max_retries)
+        # Filings whose documents are all extracted need no parsing -- mark
+        # them in one UPDATE rather than loading each and checking its files.
+        skipped = skip_extracted_filings(session, max_retries)
+        if skipped:
+            batch.filings_attempted += skipped
+            batch.filings_skipped += skipped
+            logger.info(
+                "Skipped %d filings with every document already extracted",
+                skipped,
+            )
 
-        if not filings:
+        # Filings are streamed in chunks; peek so an empty queue returns
+        # before any worker process is started.
+        pending_filings = get_filings_for_extraction(session, max_retries)
+        first = next(pending_filings, None)
+        if first is None:
             logger.info("No filings pending extraction")
             return batch
-
-        logger.info("Found %d filings pending extraction", len(filings))
-
-        for filing in filings:
-            batch.filings_attempted += 1
-
-            try:
-                logger.info(
-                    "Extracting filing %s (%d documents)",
-                    filing.filing_id,
-                    len(filing.documents),
-                )
-
-                has_success, error_msg, doc_ok, doc_fail = (
-                    _extract_filing_documents(session, filing, extraction_settings)
-                )
-
-                if has_success:
-                    mark_step_complete(
-                        session, filing.filing_id, "extracted", "success"
-                    )
-                    session.commit()
-                    batch.filings_succeeded += 1
-                    batch.total_docs_extracted += doc_ok
-                    batch.total_docs_failed += doc_fail
-                    logger.info(
-                        "Filing %s extraction complete: %d docs OK, %d failed",
-                        filing.filing_id,
-                        doc_ok,
-                        doc_fail,
-                    )
-                else:
-                    error = error_msg or "No documents successfully extracted"
-                    mark_step_complete(
-                        session,
-                        filing.filing_id,
-                        "extracted",
-                        "failed",
-                        error=error,
-                    )
-                    session.commit()
-                    batch.filings_failed += 1
-                    batch.total_docs_failed += doc_fail
-                    batch.errors.append(
-                        f"Filing {filing.filing_id}: {error}"
-                    )
-                    logger.warning(
-                        "Filing %s extraction failed: %s",
-                        filing.filing_id,
-                        error,
-                    )
-
-            except Exception:
-                logger.exception(
-                    "Unexpected error processing filing %s", filing.filing_id
-                )
-                try:
-                    session.rollback()
-                    mark_step_complete(
-                        session,
-                        filing.filing_id,
-                        "extracted",
-                        "failed",
-                        error="Unexpected error",
-                    )
-                except Exception:
-                    logger.exception(
-                        "Failed to update status for filing %s",
-                        filing.filing_id,
-                    )
-                batch.filings_failed += 1
-                batch.errors.append(
-                    f"Filing {filing.filing_id}: unexpected error"
-                )
+        pending_filings = itertools.chain((first,), pending_filings)
+
+        # One timestamp for the batch's markdown files rather than one
+        # clock read and format per document.  Use fully qualified
+        # datetime.datetime to avoid Pydantic v2 shadowing bug
+        extraction_date = datetime.datetime.now(datetime.UTC).isoformat()
+
+        max_workers = _get_max_workers(extraction_settings)
+        in_flight: dict[Future[_FilingOutcome], Filing] = {}
+
+        # Spawned (not forked) workers do not inherit the parent's logging
+        # or database threads; their records come back over a queue.
+        mp_context = multiprocessing.get_context("spawn")
+        log_queue = mp_context.Queue()
+        log_listener = logging.handlers.QueueListener(
+            log_queue, _ForwardingHandler()
+        )
+        log_listener.start()
+
+        try:
+            with (
+                expire_on_commit_disabled(session),
+                ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=mp_context,
+                    initializer=_init_worker,
+                    initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+                ) as executor,
+            ):
+
+                def submit_next() -> None:
+                    for filing in pending_filings:
+                        batch.filings_attempted += 1
+                        logger.info(
+                            "Extracting filing %s (%d documents)",
+                            filing.filing_id,
+                            len(filing.documents),
+                        )
+                        future = executor.submit(
+                            _extract_filing_documents,
+                            _snapshot_filing(filing),
+                            extraction_settings,
+                            extraction_date,
+                        )
+                        in_flight[future] = filing
+                        return
+
+                # Keep a small backlog queued so workers never sit idle
+                # while the parent records a result.
+                for _ in range(2 * max_workers):
+                    submit_next()
+
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        filing = in_flight.pop(future)
+                        submit_next()
+
+                        try:
+                            _record_outcome(
+                                session, filing, future.result(), batch
+                            )
+                        except Exception:
+                            logger.exception(
+                                "Unexpected error processing filing %s",
+                                filing.filing_id,
+                            )
+                            try:
+                                session.rollback()
+                                mark_step_complete(
+                                    session,
+                                    filing.filing_id,
+                                    "extracted",
+                                    "failed",
+                                    error="Unexpected error",
+                                )
+                            except Exception:
+                                logger.exception(
+                                    "Failed to update status for filing %s",
+                                    filing.filing_id,
+                                )
+                            batch.filings_failed += 1
+                            batch.errors.append(
+                                f"Filing {filing.filing_id}: unexpected error"
+                            )
+        finally:
+            log_listener.stop()
+            log_queue.close()
+
+        cache_root = get_cache_root(extraction_settings)
+        if cache_root is not None:
+            prune_extraction_cache(cache_root, extraction_settings.cache_max_bytes)
 
     except Exception:
         logger.exception("Fatal error in extraction orchestrator")
@@ -267,10 +541,11 @@ def extract_filings(
 
     logger.info(
         "Extraction batch complete: %d attempted, %d succeeded, %d failed, "
-        "%d docs extracted, %d docs failed",
+        "%d skipped, %d docs extracted, %d docs failed",
         batch.filings_attempted,
         batch.filings_succeeded,
         batch.filings_failed,
+        batch.filings_skipped,
         batch.total_docs_extracted,
         batch.total_docs_failed,
     )
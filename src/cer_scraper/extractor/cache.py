@@ -0,0 +1,189 @@
+"""Content-addressed cache of PDF extraction results.
+
+Extraction output depends only on the PDF bytes and the extraction
+settings, so successful results are stored under a key derived from both.
+A re-downloaded or renamed PDF, or the same attachment filed under several
+filings, is then served from the cache instead of being parsed again.
+
+Entries are zstd-compressed JSON files laid out as
+``<cache_dir>/<key[:2]>/<key>.json.zst``.  A hit refreshes the entry's
+mtime, and :func:`prune_extraction_cache` evicts least recently used
+entries once the cache exceeds its size cap.
+
+Public API:
+    pdf_digest(pdf_path)  -> str
+    load_cached_extraction(...)  -> ExtractionResult | None
+    store_cached_extraction(...)  -> None
+    prune_extraction_cache(cache_root, max_bytes)  -> int
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import orjson
+import zstandard
+
+from cer_scraper.config.settings import PROJECT_ROOT, ExtractionSettings
+from cer_scraper.extractor.types import ExtractionMethod, ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Markdown compresses well; a fast level keeps writes cheap
+_CACHE_ZSTD_LEVEL = 3
+
+_CACHE_SUFFIX = ".json.zst"
+
+# Settings that change how work is scheduled, not what is extracted
+_NON_OUTPUT_SETTINGS = frozenset(
+    {"max_workers", "page_workers", "ocr_workers", "cache_dir", "cache_max_bytes"}
+)
+
+
+def get_cache_root(settings: ExtractionSettings) -> Path | None:
+    """Return the cache directory, or None if caching is disabled."""
+    if not settings.cache_dir:
+        return None
+    return PROJECT_ROOT / settings.cache_dir
+
+
+def pdf_digest(pdf_path: Path) -> str:
+    """Return the SHA-256 hex digest of a PDF's contents."""
+    with open(pdf_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _cache_path(
+    cache_root: Path, digest: str, settings: ExtractionSettings
+) -> Path:
+    """Map a PDF digest and the output-affecting settings to a cache file."""
+    h = hashlib.blake2b(digest.encode(), digest_size=16)
+    h.update(
+        orjson.dumps(
+            settings.model_dump(exclude=_NON_OUTPUT_SETTINGS),
+            option=orjson.OPT_SORT_KEYS,
+        )
+    )
+    key = h.hexdigest()
+    return cache_root / key[:2] / f"{key}{_CACHE_SUFFIX}"
+
+
+def load_cached_extraction(
+    cache_root: Path, digest: str, settings: ExtractionSettings
+) -> ExtractionResult | None:
+    """Return a previously stored extraction for this PDF, if present.
+
+    Args:
+        cache_root: Cache directory from :func:`get_cache_root`.
+        digest: Digest from :func:`pdf_digest`.
+        settings: Extraction configuration the result must match.
+
+    Returns:
+        The cached successful ExtractionResult, or None on a miss or an
+        unreadable entry.
+    """
+    path = _cache_path(cache_root, digest, settings)
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(zstandard.ZstdDecompressor().decompress(f.read()))
+        os.utime(path)  # Mark as recently used
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, zstandard.ZstdError) as e:
+        logger.warning("Ignoring unreadable extraction cache entry %s: %s", path, e)
+        return None
+
+    return ExtractionResult(
+        success=True,
+        markdown=data["markdown"],
+        method=ExtractionMethod(data["method"]),
+        page_count=data["page_count"],
+        char_count=data["char_count"],
+    )
+
+
+def store_cached_extraction(
+    cache_root: Path,
+    digest: str,
+    settings: ExtractionSettings,
+    result: ExtractionResult,
+) -> None:
+    """Store a successful extraction result under the PDF's digest.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent workers storing the same PDF never leave a partial entry.
+
+    Args:
+        cache_root: Cache directory from :func:`get_cache_root`.
+        digest: Digest from :func:`pdf_digest`.
+        settings: Extraction configuration that produced the result.
+        result: Successful extraction result.
+    """
+    path = _cache_path(cache_root, digest, settings)
+    blob = zstandard.ZstdCompressor(level=_CACHE_ZSTD_LEVEL).compress(
+        orjson.dumps(
+            {
+                "markdown": result.markdown,
+                "method": result.method.value,
+                "page_count": result.page_count,
+                "char_count": result.char_count,
+            }
+        )
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def prune_extraction_cache(cache_root: Path, max_bytes: int) -> int:
+    """Evict least recently used entries until the cache fits ``max_bytes``.
+
+    Args:
+        cache_root: Cache directory from :func:`get_cache_root`.
+        max_bytes: Maximum total size of the cache entries.
+
+    Returns:
+        Number of entries removed.
+    """
+    entries: list[tuple[float, int, str]] = []
+    total = 0
+    try:
+        shards = [e for e in os.scandir(cache_root) if e.is_dir()]
+    except FileNotFoundError:
+        return 0
+    for shard in shards:
+        for entry in os.scandir(shard.path):
+            if entry.name.endswith(_CACHE_SUFFIX):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+    if total <= max_bytes:
+        return 0
+
+    entries.sort()
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+
+    logger.info(
+        "Pruned %d extraction cache entries (%d bytes remain)", removed, total
+    )
+    return removed
@@ -7,19 +7,47 @@ already exists and has content, the document is skipped on re-run.
 
 Public API:
     should_extract(md_path)  -> bool
+    list_extracted(directory)  -> frozenset[str]
     write_markdown_file(...)  -> None
 """
 
 from __future__ import annotations
 
 import datetime
+import json
 import logging
+import os
+import re
 from pathlib import Path
 
-import frontmatter
-
 logger = logging.getLogger(__name__)
 
+# Body slice (and write buffer) size for streaming markdown to disk
+_WRITE_CHUNK_CHARS = 1 << 20
+
+# Strings YAML reads back unchanged without quoting: no indicator
+# characters, and not starting with a digit (so never a number or date)
+_YAML_PLAIN = re.compile(r"[A-Za-z_][A-Za-z0-9_.\-]*")
+
+# Plain scalars YAML 1.1 would resolve to a bool or null instead
+_YAML_KEYWORDS = frozenset(
+    {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+)
+
+
+def _yaml_str(value: str) -> str:
+    """Render a string as a YAML scalar, quoting only when needed.
+
+    Matches PyYAML's choice of style for the values written here: plain
+    where that round-trips, otherwise single-quoted, and double-quoted
+    (JSON escapes) for strings with control or line-break characters.
+    """
+    if _YAML_PLAIN.fullmatch(value) and value.lower() not in _YAML_KEYWORDS:
+        return value
+    if value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+    return json.dumps(value)
+
 
 def should_extract(md_path: Path) -> bool:
     """Check whether a markdown extraction file needs to be created.
@@ -41,6 +69,30 @@ def should_extract(md_path: Path) -> bool:
     return True
 
 
+def list_extracted(directory: Path) -> frozenset[str]:
+    """Return the names of the non-empty markdown files in *directory*.
+
+    Batch form of :func:`should_extract`: one directory scan answers the
+    check for every document of a filing, instead of an ``exists()`` and a
+    ``stat()`` per document.
+
+    Args:
+        directory: Directory holding the PDFs and their markdown files.
+
+    Returns:
+        File names (not paths) of markdown files that have content.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".md") and entry.stat().st_size > 0
+            )
+    except FileNotFoundError:
+        return frozenset()
+
+
 def write_markdown_file(
     md_path: Path,
     markdown_content: str,
@@ -48,6 +100,7 @@ def write_markdown_file(
     page_count: int,
     char_count: int,
     pdf_filename: str,
+    extraction_date: str | None = None,
 ) -> None:
     """Write extracted markdown to disk with YAML frontmatter metadata.
 
@@ -67,23 +120,46 @@ def write_markdown_file(
         page_count: Number of pages in the source PDF.
         char_count: Meaningful character count.
         pdf_filename: Source PDF filename (not full path).
+        extraction_date: UTC ISO-8601 timestamp to record, e.g. the start
+            of the batch; defaults to now.
     """
-    # Build frontmatter post with metadata
-    post = frontmatter.Post(markdown_content)
-    post.metadata["source_pdf"] = pdf_filename
-    post.metadata["extraction_method"] = method
-    # Use fully qualified datetime.datetime to avoid Pydantic v2 shadowing bug
-    post.metadata["extraction_date"] = (
-        datetime.datetime.now(datetime.UTC).isoformat()
+    if extraction_date is None:
+        # Use fully qualified datetime.datetime to avoid Pydantic v2 shadowing bug
+        extraction_date = datetime.datetime.now(datetime.UTC).isoformat()
+
+    # The metadata schema is fixed, so the header is formatted directly
+    # rather than through a YAML dumper.  Keys are in sorted order, as
+    # python-frontmatter wrote them.
+    header = (
+        "---\n"
+        f"char_count: {char_count}\n"
+        f"extraction_date: '{extraction_date}'\n"
+        f"extraction_method: {_yaml_str(method)}\n"
+        f"page_count: {page_count}\n"
+        f"source_pdf: {_yaml_str(pdf_filename)}\n"
+        "---"
     )
-    post.metadata["page_count"] = page_count
-    post.metadata["char_count"] = char_count
 
     # Ensure parent directory exists
     md_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
+    # The body is stripped of trailing whitespace and streamed in slices
+    # instead of being concatenated with the header as one more
+    # full-size copy.
+    end = len(markdown_content)
+    while end and markdown_content[end - 1].isspace():
+        end -= 1
+
+    with open(
+        md_path, "w", encoding="utf-8", buffering=_WRITE_CHUNK_CHARS
+    ) as f:
+        f.write(header)
+        if end:
+            f.write("\n\n")
+            for start in range(0, end, _WRITE_CHUNK_CHARS):
+                f.write(
+                    markdown_content[start : min(start + _WRITE_CHUNK_CHARS, end)]
+                )
 
     logger.info(
         "Wrote extraction to %s (%d chars, %d pages)",
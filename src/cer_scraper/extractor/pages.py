@@ -0,0 +1,74 @@
+"""Page-range splitting for extracting one large PDF across processes.
+
+Filings are already extracted in parallel, one per worker process, so a
+single PDF is only split when ``ExtractionSettings.page_workers`` is raised
+above 1.  Each worker opens the PDF itself (parser objects are not
+picklable) and returns markdown strings for a contiguous block of pages;
+blocks are several pages long so the per-process open cost is amortized.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from cer_scraper.config.settings import ExtractionSettings
+
+# Smallest block of pages handed to one worker
+MIN_PAGE_BLOCK = 4
+
+# (pdf_path, start, end, settings) -> markdown for pages [start, end)
+PageRangeExtractor = Callable[[str, int, int, ExtractionSettings], list[str]]
+
+
+def page_blocks(page_count: int, workers: int) -> list[tuple[int, int]]:
+    """Split ``range(page_count)`` into contiguous ``(start, end)`` blocks.
+
+    Aims for two blocks per worker so a slow block does not leave the
+    others idle, but never fewer than ``MIN_PAGE_BLOCK`` pages per block.
+
+    Args:
+        page_count: Number of pages in the PDF.
+        workers: Number of worker processes available.
+
+    Returns:
+        Non-overlapping blocks in page order (one block when not splitting).
+    """
+    if workers <= 1 or page_count <= MIN_PAGE_BLOCK:
+        return [(0, page_count)]
+    block = max(MIN_PAGE_BLOCK, -(-page_count // (workers * 2)))
+    return [
+        (start, min(start + block, page_count))
+        for start in range(0, page_count, block)
+    ]
+
+
+def extract_page_ranges(
+    extract_range: PageRangeExtractor,
+    pdf_path: str,
+    blocks: list[tuple[int, int]],
+    settings: ExtractionSettings,
+) -> list[str]:
+    """Run a page-range extractor over each block in worker processes.
+
+    Args:
+        extract_range: Module-level (picklable) function extracting the
+            pages ``[start, end)`` of ``pdf_path``.
+        pdf_path: Path to the PDF file.
+        blocks: Page blocks from :func:`page_blocks`.
+        settings: Extraction configuration (``page_workers``).
+
+    Returns:
+        Markdown strings from every block, in page order.
+    """
+    starts, ends = zip(*blocks)
+    with ProcessPoolExecutor(
+        max_workers=min(settings.page_workers, len(blocks)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        results = executor.map(
+            extract_range, repeat(pdf_path), starts, ends, repeat(settings)
+        )
+        return [part for block in results for part in block]
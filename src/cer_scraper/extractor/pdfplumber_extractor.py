@@ -8,21 +8,18 @@ activated when the primary pymupdf4llm extraction fails quality checks.
 from __future__ import annotations
 
 import logging
-import re
 from pathlib import Path
 
-import pandas as pd
 import pdfplumber
 from pdfplumber.utils import get_bbox_overlap, obj_to_bbox
 
 from cer_scraper.config.settings import ExtractionSettings
+from cer_scraper.extractor.pages import extract_page_ranges, page_blocks
+from cer_scraper.extractor.quality import count_meaningful_chars
 from cer_scraper.extractor.types import ExtractionMethod, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
-# Pattern to strip markdown syntax and whitespace for meaningful char count
-_SYNTAX_PATTERN = re.compile(r"[#|*_\-\s\n]")
-
 
 def _clamp_bbox(
     bbox: tuple[float, float, float, float],
@@ -43,17 +40,30 @@ def _clamp_bbox(
         Clamped bounding box within page boundaries.
     """
     x0, top, x1, bottom = bbox
+    # Conditional expressions rather than max()/min() calls: same result,
+    # without four builtin calls per table
     return (
-        max(0, x0),
-        max(0, top),
-        min(page_width, x1),
-        min(page_height, bottom),
+        0 if x0 < 0 else x0,
+        0 if top < 0 else top,
+        page_width if x1 > page_width else x1,
+        page_height if bottom > page_height else bottom,
     )
 
 
+def _format_cell(cell: object) -> str:
+    """Render a table cell as single-line text safe inside a pipe table."""
+    if cell is None:
+        return ""
+    return str(cell).replace("|", "\\|").replace("\n", " ")
+
+
 def _table_to_markdown(table_data: list[list[str | None]]) -> str | None:
     """Convert pdfplumber table data to pipe-delimited markdown table.
 
+    Cells are written as-is (no numeric reformatting); pipes are escaped
+    and line breaks flattened so every row stays on one line.  Rows are
+    padded or truncated to the header's width.
+
     Args:
         table_data: List of rows, where the first row is the header.
 
@@ -63,21 +73,93 @@ def _table_to_markdown(table_data: list[list[str | None]]) -> str | None:
     if not table_data or len(table_data) < 2:
         return None
 
-    header = table_data[0]
-    rows = table_data[1:]
+    header = [_format_cell(cell) for cell in table_data[0]]
+    ncols = len(header)
+    if not ncols:
+        return None
 
-    # Replace None cells with empty strings
-    header = [str(cell) if cell is not None else "" for cell in header]
-    cleaned_rows = [
-        [str(cell) if cell is not None else "" for cell in row] for row in rows
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join(["---"] * ncols) + "|",
     ]
+    for row in table_data[1:]:
+        cells = [_format_cell(cell) for cell in row[:ncols]]
+        cells.extend([""] * (ncols - len(cells)))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
 
-    try:
-        df = pd.DataFrame(cleaned_rows, columns=header)
-        return df.to_markdown(index=False)
-    except Exception:
-        # Fallback: if DataFrame creation fails (mismatched columns, etc.)
-        return None
+
+def _page_to_markdown(page) -> str | None:
+    """Extract one pdfplumber page as text plus markdown tables.
+
+    Tables are extracted as pipe-delimited markdown and their regions are
+    filtered from the page text to avoid duplication.
+
+    Returns:
+        The page's markdown, or None if the page has no text.
+    """
+    page_parts: list[str] = []
+
+    tables = page.find_tables()
+
+    if tables:
+        # Clamp table bounding boxes to page boundaries
+        # to avoid ValueError during filtering
+        clamped_bboxes = [
+            _clamp_bbox(table.bbox, page.width, page.height) for table in tables
+        ]
+
+        # Filter out text within table regions -- one pass over the page's
+        # objects, however many tables it has
+        def outside_tables(obj) -> bool:
+            obj_bbox = obj_to_bbox(obj)
+            return all(
+                get_bbox_overlap(obj_bbox, bbox) is None for bbox in clamped_bboxes
+            )
+
+        filtered_page = page.filter(outside_tables)
+
+        # Extract non-table text with layout preservation
+        text = filtered_page.extract_text(layout=True)
+        if text and text.strip():
+            page_parts.append(text.strip())
+
+        # Extract each table as a markdown table
+        for table in tables:
+            table_data = table.extract()
+            md_table = _table_to_markdown(table_data)
+            if md_table:
+                page_parts.append(md_table)
+    else:
+        # No tables on this page -- extract full text
+        text = page.extract_text(layout=True)
+        if text and text.strip():
+            page_parts.append(text.strip())
+
+    return "\n\n".join(page_parts) if page_parts else None
+
+
+def _pages_to_markdown(pages) -> list[str]:
+    """Extract pages in order, skipping pages with no text.
+
+    Each page's parsed objects are released once it has been extracted, so
+    memory does not grow with the page count of large PDFs.
+    """
+    all_pages_md: list[str] = []
+    for page in pages:
+        md = _page_to_markdown(page)
+        page.close()
+        if md:
+            all_pages_md.append(md)
+    return all_pages_md
+
+
+def _markdown_for_pages(
+    pdf_path: str, start: int, end: int, settings: ExtractionSettings
+) -> list[str]:
+    """Extract pages ``[start, end)`` of a PDF, skipping pages with no text."""
+    with pdfplumber.open(pdf_path, pages=range(start + 1, end + 1)) as pdf:
+        return _pages_to_markdown(pdf.pages)
 
 
 def try_pdfplumber(pdf_path: Path, settings: ExtractionSettings) -> ExtractionResult:
@@ -85,7 +167,9 @@ def try_pdfplumber(pdf_path: Path, settings: ExtractionSettings) -> ExtractionRe
 
     For each page, finds tables and extracts them as pipe-delimited markdown.
     Non-table text is extracted with layout preservation. Tables are filtered
-    from the text region to avoid duplication.
+    from the text region to avoid duplication.  With
+    ``settings.page_workers > 1`` the pages are extracted in blocks across
+    worker processes.
 
     Args:
         pdf_path: Path to the PDF file.
@@ -96,61 +180,23 @@ def try_pdfplumber(pdf_path: Path, settings: ExtractionSettings) -> ExtractionRe
         success=False and error message on failure.
     """
     try:
-        all_pages_md: list[str] = []
-
         with pdfplumber.open(str(pdf_path)) as pdf:
             page_count = len(pdf.pages)
+            blocks = page_blocks(page_count, settings.page_workers)
+            if len(blocks) == 1:
+                all_pages_md = _pages_to_markdown(pdf.pages)
 
-            for page_num, page in enumerate(pdf.pages):
-                page_parts: list[str] = []
-
-                tables = page.find_tables()
-
-                if tables:
-                    # Clamp table bounding boxes to page boundaries
-                    # to avoid ValueError during filtering
-                    clamped_bboxes = [
-                        _clamp_bbox(
-                            table.bbox, page.width, page.height
-                        )
-                        for table in tables
-                    ]
-
-                    # Filter out text within table regions
-                    filtered_page = page
-                    for clamped_bbox in clamped_bboxes:
-                        filtered_page = filtered_page.filter(
-                            lambda obj, bbox=clamped_bbox: get_bbox_overlap(
-                                obj_to_bbox(obj), bbox
-                            )
-                            is None
-                        )
-
-                    # Extract non-table text with layout preservation
-                    text = filtered_page.extract_text(layout=True)
-                    if text and text.strip():
-                        page_parts.append(text.strip())
-
-                    # Extract each table as a markdown table
-                    for table in tables:
-                        table_data = table.extract()
-                        md_table = _table_to_markdown(table_data)
-                        if md_table:
-                            page_parts.append(md_table)
-                else:
-                    # No tables on this page -- extract full text
-                    text = page.extract_text(layout=True)
-                    if text and text.strip():
-                        page_parts.append(text.strip())
-
-                if page_parts:
-                    all_pages_md.append("\n\n".join(page_parts))
+        if len(blocks) > 1:
+            all_pages_md = extract_page_ranges(
+                _markdown_for_pages, str(pdf_path), blocks, settings
+            )
 
         md_text = "\n\n---\n\n".join(all_pages_md)
+        # Release the per-page strings before counting makes its own copy
+        del all_pages_md
 
         # Count meaningful characters (strip markdown syntax and whitespace)
-        clean_text = _SYNTAX_PATTERN.sub("", md_text)
-        char_count = len(clean_text)
+        char_count = count_meaningful_chars(md_text)
 
         logger.info(
             "pdfplumber extracted %d chars from %d pages: %s",
@@ -8,57 +8,87 @@ in the extraction fallback chain.
 from __future__ import annotations
 
 import logging
-import re
 from pathlib import Path
 
 import pymupdf
 import pymupdf4llm
 
 from cer_scraper.config.settings import ExtractionSettings
+from cer_scraper.extractor.pages import extract_page_ranges, page_blocks
+from cer_scraper.extractor.quality import count_meaningful_chars
 from cer_scraper.extractor.types import ExtractionMethod, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
-# Pattern to strip markdown syntax and whitespace for meaningful char count
-_SYNTAX_PATTERN = re.compile(r"[#|*_\-\s\n]")
 
+def _markdown_for_pages(
+    pdf: str | pymupdf.Document,
+    start: int,
+    end: int,
+    settings: ExtractionSettings,
+) -> list[str]:
+    """Convert pages ``[start, end)`` of a PDF (path or open document)."""
+    return [
+        pymupdf4llm.to_markdown(
+            pdf,
+            pages=list(range(start, end)),
+            table_strategy=settings.table_strategy,
+            page_chunks=False,
+            page_separators=True,
+            show_progress=False,
+            embed_images=False,
+            write_images=False,
+            force_text=True,
+        )
+    ]
 
-def try_pymupdf4llm(pdf_path: Path, settings: ExtractionSettings) -> ExtractionResult:
+
+def try_pymupdf4llm(
+    pdf_path: Path,
+    settings: ExtractionSettings,
+    doc: pymupdf.Document | None = None,
+) -> ExtractionResult:
     """Extract text from a PDF using pymupdf4llm markdown conversion.
 
     Uses pymupdf4llm.to_markdown() which handles machine-generated text,
     tables, and headers in a single call. The ``force_text=True`` parameter
-    extracts text even from areas overlapping images.
+    extracts text even from areas overlapping images.  With
+    ``settings.page_workers > 1`` the pages are converted in blocks across
+    worker processes; each block ends with its page separators, so the
+    blocks concatenate to the same markdown as a single call.
 
     Args:
         pdf_path: Path to the PDF file.
         settings: Extraction configuration (table_strategy, etc.).
+        doc: The PDF already open in PyMuPDF, if the caller has it (left
+            open); otherwise the file is opened and closed here.  Either
+            way the PDF is parsed once for both the page count and the
+            conversion.
 
     Returns:
         ExtractionResult with markdown text and character count on success,
         or with success=False and error message on failure.
     """
+    owns_doc = doc is None
     try:
-        md_text = pymupdf4llm.to_markdown(
-            str(pdf_path),
-            pages=None,
-            table_strategy=settings.table_strategy,
-            page_chunks=False,
-            page_separators=True,
-            show_progress=False,
-            embed_images=False,
-            write_images=False,
-            force_text=True,
-        )
+        if owns_doc:
+            doc = pymupdf.open(str(pdf_path), filetype="pdf")
+        page_count = doc.page_count
+
+        blocks = page_blocks(page_count, settings.page_workers)
+        if len(blocks) == 1:
+            parts = _markdown_for_pages(doc, 0, page_count, settings)
+        else:
+            # Workers cannot share the open document; each opens the file
+            parts = extract_page_ranges(
+                _markdown_for_pages, str(pdf_path), blocks, settings
+            )
+        md_text = "".join(parts)
+        # Release the per-block strings before counting makes its own copy
+        del parts
 
         # Count meaningful characters (strip markdown syntax and whitespace)
-        clean_text = _SYNTAX_PATTERN.sub("", md_text)
-        char_count = len(clean_text)
-
-        # Get page count from the PDF
-        doc = pymupdf.open(str(pdf_path))
-        page_count = len(doc)
-        doc.close()
+        char_count = count_meaningful_chars(md_text)
 
         logger.info(
             "pymupdf4llm extracted %d chars from %d pages: %s",
@@ -78,3 +108,7 @@ def try_pymupdf4llm(pdf_path: Path, settings: ExtractionSettings) -> ExtractionR
     except Exception as e:
         logger.warning("pymupdf4llm extraction failed for %s: %s", pdf_path.name, e)
         return ExtractionResult(success=False, error=str(e))
+
+    finally:
+        if owns_doc and doc is not None:
+            doc.close()
@@ -6,6 +6,8 @@ tried. Two validation levels:
 
 - ``passes_quality_check``: Strict checks for pymupdf4llm and pdfplumber output.
 - ``passes_ocr_quality_check``: Looser thresholds appropriate for Tesseract OCR.
+- ``has_usable_page_text``: Whether one page's own text layer can stand in
+  for OCR of that page.
 
 Quality heuristics:
 1. Minimum content: enough characters relative to page count.
@@ -17,15 +19,107 @@ from __future__ import annotations
 
 import logging
 import re
-from collections import Counter
+
+import numpy as np
 
 from cer_scraper.config.settings import ExtractionSettings
 from cer_scraper.extractor.types import ExtractionResult
 
 logger = logging.getLogger(__name__)
 
-# Matches Unicode replacement char, NULL, and non-printable control chars
-_GARBLE_PATTERN = re.compile(r"[\ufffd\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Unicode replacement char, NULL, and non-printable control chars
+_GARBLE_CHARS = "\ufffd" + "".join(
+    chr(c) for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)
+)
+_GARBLE_TABLE = str.maketrans("", "", _GARBLE_CHARS)
+
+# Markdown syntax plus every character ``\s`` matches (``str.isspace``),
+# excluded from the meaningful character count
+_NON_CONTENT_CHARS = "#|*_-" + "".join(
+    chr(c) for c in range(0x3001) if chr(c).isspace()
+)
+_NON_CONTENT_TABLE = str.maketrans("", "", _NON_CONTENT_CHARS)
+
+
+def _count_garble_chars(text: str) -> int:
+    """Count replacement and control characters without collecting matches.
+
+    Uses the same ASCII/non-ASCII split as :func:`count_meaningful_chars`.
+    """
+    if text.isascii():
+        return len(text) - len(text.translate(_GARBLE_TABLE))
+    return sum(map(text.count, _GARBLE_CHARS))
+
+
+def count_meaningful_chars(text: str) -> int:
+    """Count characters excluding markdown syntax and whitespace.
+
+    ASCII text takes ``str.translate``'s ASCII fast path; other text
+    subtracts per-character counts, which avoids translate's slow
+    non-ASCII path.  Both are C loops with no regex engine involved.
+
+    Args:
+        text: Extracted markdown.
+
+    Returns:
+        Number of characters other than ``#|*_-`` and whitespace.
+    """
+    if text.isascii():
+        return len(text.translate(_NON_CONTENT_TABLE))
+    return len(text) - sum(map(text.count, _NON_CONTENT_CHARS))
+
+
+def _most_common_trigrams(sample: str, n: int) -> list[tuple[str, int]]:
+    """Return the ``n`` most frequent 3-character sequences in ``sample``.
+
+    Each position's three code points are packed into one uint64 (21 bits
+    apiece) and counted with ``np.unique``, rather than slicing and hashing
+    a Python string per position.
+
+    Args:
+        sample: Text to scan (at least 3 characters).
+        n: Number of trigrams to return.
+
+    Returns:
+        ``(trigram, count)`` pairs, most frequent first.
+    """
+    code_points = np.frombuffer(
+        sample.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    ).astype(np.uint64)
+    packed = (
+        code_points[:-2] | (code_points[1:-1] << 21) | (code_points[2:] << 42)
+    )
+    values, counts = np.unique(packed, return_counts=True)
+    top = np.argsort(-counts, kind="stable")[:n]
+    return [
+        (
+            chr(v & 0x1FFFFF) + chr((v >> 21) & 0x1FFFFF) + chr(v >> 42),
+            int(counts[i]),
+        )
+        for i, v in zip(top, values[top].tolist())
+    ]
+
+
+def has_usable_page_text(text: str, settings: ExtractionSettings) -> bool:
+    """Check whether a page's embedded text can be used instead of OCR.
+
+    The page needs at least ``min_native_chars_per_page`` meaningful
+    characters and a garble ratio within ``garble_ratio_threshold`` (the
+    native-text threshold), so a page whose text layer is broken is still
+    OCR'd.
+
+    Args:
+        text: The page's plain text layer.
+        settings: Extraction settings with threshold configuration.
+
+    Returns:
+        True if the text can be used as the page's OCR output.
+    """
+    if not settings.min_native_chars_per_page:
+        return False
+    if count_meaningful_chars(text) < settings.min_native_chars_per_page:
+        return False
+    return _count_garble_chars(text) <= len(text) * settings.garble_ratio_threshold
 
 
 def passes_quality_check(
@@ -76,7 +170,7 @@ def passes_quality_check(
         return False
 
     # Check 2: Garble ratio
-    garble_chars = len(_GARBLE_PATTERN.findall(result.markdown))
+    garble_chars = _count_garble_chars(result.markdown)
     total_chars = len(result.markdown)
     if total_chars > 0:
         garble_ratio = garble_chars / total_chars
@@ -96,12 +190,14 @@ def passes_quality_check(
     # repeating hundreds of times. Natural English text has common trigrams
     # like "the" at ~70 per 10K chars, so the threshold must be well above
     # that. Only non-whitespace-containing trigrams are checked since space-
-    # containing trigrams are ubiquitous in all text.
+    # containing trigrams are ubiquitous in all text.  A sample with no more
+    # than 200 trigram positions cannot exceed the threshold, so it is not
+    # scanned.  Clean-looking output is still scanned: font-mapping garbage
+    # is printable, so neither the garble ratio nor the character count
+    # rules it out.
     sample = result.markdown[:10_000]
-    if len(sample) >= 3:
-        trigrams = [sample[i : i + 3] for i in range(len(sample) - 2)]
-        trigram_counts = Counter(trigrams)
-        for trigram, count in trigram_counts.most_common(10):
+    if len(sample) - 2 > 200:
+        for trigram, count in _most_common_trigrams(sample, 10):
             if count > 200 and re.search(r"\S", trigram):
                 logger.warning(
                     "Quality check failed (excessive repetition): "
@@ -158,7 +254,7 @@ def passes_ocr_quality_check(
         return False
 
     # Check 2: Garble ratio (looser threshold)
-    garble_chars = len(_GARBLE_PATTERN.findall(result.markdown))
+    garble_chars = _count_garble_chars(result.markdown)
     total_chars = len(result.markdown)
     if total_chars > 0:
         garble_ratio = garble_chars / total_chars
@@ -13,21 +13,42 @@ Edge cases handled:
 - Encrypted PDFs: detected and returned as extraction_failed with "encrypted".
 - Oversized PDFs: page_count > max_pages_for_extraction skipped.
 - OCR guard: page_count > max_pages_for_ocr skips Tesseract.
+- Scanned PDFs: no text layer goes straight to Tesseract.
 """
 
 from __future__ import annotations
 
-import io
+import functools
 import logging
-import re
+import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import pymupdf
 
+# OCR backends are optional: resolved once here rather than on every
+# Tesseract call (a failed import searches sys.path each time).  tesserocr
+# is the exception, see _tesserocr_api_class.
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
 from cer_scraper.config.settings import ExtractionSettings
 from cer_scraper.extractor.pdfplumber_extractor import try_pdfplumber
 from cer_scraper.extractor.pymupdf_extractor import try_pymupdf4llm
-from cer_scraper.extractor.quality import passes_ocr_quality_check, passes_quality_check
+from cer_scraper.extractor.quality import (
+    count_meaningful_chars,
+    has_usable_page_text,
+    passes_ocr_quality_check,
+    passes_quality_check,
+)
 from cer_scraper.extractor.types import ExtractionMethod, ExtractionResult
 
 logger = logging.getLogger(__name__)
@@ -39,9 +60,6 @@ __all__ = [
     "extract_document",
 ]
 
-# Pattern to strip markdown syntax and whitespace for meaningful char count
-_SYNTAX_PATTERN = re.compile(r"[#|*_\-\s\n]")
-
 
 def extract_document(
     pdf_path: Path,
@@ -63,7 +81,7 @@ def extract_document(
     # --- Pre-checks: encryption and page count ---
 
     try:
-        doc = pymupdf.open(str(pdf_path))
+        doc = pymupdf.open(str(pdf_path), filetype="pdf")
     except Exception as e:
         logger.error("Cannot open PDF %s: %s", pdf_path.name, e)
         return ExtractionResult(success=False, error=f"cannot_open: {e}")
@@ -77,10 +95,10 @@ def extract_document(
             error="encrypted",
         )
 
-    page_count = len(doc)
-    doc.close()
+    page_count = doc.page_count
 
     if page_count > settings.max_pages_for_extraction:
+        doc.close()
         logger.warning(
             "Oversized PDF skipped (%d pages > %d max): %s",
             page_count,
@@ -94,10 +112,150 @@ def extract_document(
             error=f"too_many_pages ({page_count})",
         )
 
+    # The PyMuPDF tiers reuse the pre-check's open document rather than
+    # parsing the PDF again
+    try:
+        return _extract_with_fallback(pdf_path, doc, page_count, settings)
+    finally:
+        doc.close()
+
+
+def _extract_with_fallback(
+    pdf_path: Path,
+    doc: pymupdf.Document,
+    page_count: int,
+    settings: ExtractionSettings,
+) -> ExtractionResult:
+    """Run the extraction tiers on a PDF that passed the pre-checks.
+
+    A PDF without a text layer (a scan) goes straight to OCR instead of
+    through the two text-layer tiers, which would only fail their quality
+    checks.
+
+    Args:
+        pdf_path: Path to the PDF file on disk.
+        doc: The PDF, already open in PyMuPDF (owned by the caller).
+        page_count: Number of pages in the PDF.
+        settings: Extraction configuration (thresholds, OCR settings).
+
+    Returns:
+        The first ExtractionResult that passes its quality check, or a
+        failed result.
+    """
+    if _has_text_layer(doc, settings.min_chars_per_page):
+        result = _try_text_tiers(pdf_path, doc, page_count, settings)
+        if result is not None:
+            return result
+    else:
+        logger.info("No text layer in %s, skipping to OCR", pdf_path.name)
+
+    # --- Tier 3: Tesseract OCR (last resort) ---
+
+    if page_count > settings.max_pages_for_ocr:
+        logger.warning(
+            "Skipping OCR for %d-page document (max %d): %s",
+            page_count,
+            settings.max_pages_for_ocr,
+            pdf_path.name,
+        )
+    else:
+        # Optionally OCR at a lower resolution first (much less to render
+        # and scan); full ocr_dpi is only needed if that fails the check
+        dpis = [settings.ocr_dpi]
+        if 0 < settings.ocr_first_pass_dpi < settings.ocr_dpi:
+            dpis.insert(0, settings.ocr_first_pass_dpi)
+
+        for dpi in dpis:
+            logger.info(
+                "Tier 3 (Tesseract): attempting OCR extraction at %d DPI for %s",
+                dpi,
+                pdf_path.name,
+            )
+            result = try_tesseract_direct(pdf_path, settings, doc=doc, dpi=dpi)
+            result.page_count = page_count
+
+            if result.success and passes_ocr_quality_check(
+                result, page_count, settings
+            ):
+                logger.info(
+                    "Extraction succeeded via Tesseract OCR: %s (%d chars, %d pages)",
+                    pdf_path.name,
+                    result.char_count,
+                    page_count,
+                )
+                return result
+
+            if not result.success:
+                logger.warning(
+                    "Tesseract OCR failed for %s: %s", pdf_path.name, result.error
+                )
+                break
+            logger.warning(
+                "Tesseract OCR quality check failed for %s at %d DPI",
+                pdf_path.name,
+                dpi,
+            )
+
+    # --- All methods failed ---
+
+    logger.error(
+        "All extraction methods failed for %s (%d pages)", pdf_path.name, page_count
+    )
+    return ExtractionResult(
+        success=False,
+        method=ExtractionMethod.FAILED,
+        page_count=page_count,
+        error="all_methods_failed",
+    )
+
+
+def _has_text_layer(doc: pymupdf.Document, min_chars: int) -> bool:
+    """Check cheaply whether a PDF has enough embedded text to extract.
+
+    Reads the plain text layer page by page, stopping as soon as
+    *min_chars* meaningful characters are found, so a text PDF usually
+    costs one page.  A scanned PDF below that total cannot pass the
+    minimum-content check through pymupdf4llm or pdfplumber, which both
+    read the same text layer.
+
+    Args:
+        doc: The PDF, open in PyMuPDF.
+        min_chars: Meaningful characters (whole document) that count as
+            a text layer.
+
+    Returns:
+        True if the text layer has at least *min_chars* meaningful chars.
+    """
+    found = 0
+    for page in doc:
+        found += count_meaningful_chars(page.get_text("text"))
+        if found >= min_chars:
+            return True
+    return False
+
+
+def _try_text_tiers(
+    pdf_path: Path,
+    doc: pymupdf.Document,
+    page_count: int,
+    settings: ExtractionSettings,
+) -> ExtractionResult | None:
+    """Run the text-layer tiers: pymupdf4llm, then pdfplumber.
+
+    Args:
+        pdf_path: Path to the PDF file on disk.
+        doc: The PDF, already open in PyMuPDF (owned by the caller).
+        page_count: Number of pages in the PDF.
+        settings: Extraction configuration (thresholds, table strategy).
+
+    Returns:
+        The first result that passes its quality check, or None if both
+        tiers fail (OCR is next).
+    """
     # --- Tier 1: pymupdf4llm (primary) ---
 
     logger.info("Tier 1 (pymupdf4llm): attempting extraction for %s", pdf_path.name)
-    result = try_pymupdf4llm(pdf_path, settings)
+    result = try_pymupdf4llm(pdf_path, settings, doc=doc)
     result.page_count = page_count
 
     if result.success and passes_quality_check(result, page_count, settings):
@@ -148,102 +306,177 @@ def extract_document(
             result.error,
         )
 
-    # --- Tier 3: Tesseract OCR (last resort) ---
+    return None
 
-    if page_count > settings.max_pages_for_ocr:
-        logger.warning(
-            "Skipping OCR for %d-page document (max %d): %s",
-            page_count,
-            settings.max_pages_for_ocr,
-            pdf_path.name,
-        )
-    else:
-        logger.info(
-            "Tier 3 (Tesseract): attempting OCR extraction for %s", pdf_path.name
-        )
-        result = try_tesseract_direct(pdf_path, settings)
-        result.page_count = page_count
 
-        if result.success and passes_ocr_quality_check(result, page_count, settings):
-            logger.info(
-                "Extraction succeeded via Tesseract OCR: %s (%d chars, %d pages)",
-                pdf_path.name,
-                result.char_count,
-                page_count,
-            )
-            return result
+@functools.cache
+def _tesserocr_api_class():
+    """Return tesserocr's ``PyTessBaseAPI``, or None if it is not installed.
 
-        if result.success:
-            logger.warning(
-                "Tesseract OCR quality check failed for %s", pdf_path.name
-            )
-        else:
-            logger.warning(
-                "Tesseract OCR failed for %s: %s", pdf_path.name, result.error
-            )
+    Imported on first use rather than with this module: loading tesserocr
+    loads libtesseract and its OpenMP runtime, which reads
+    ``OMP_THREAD_LIMIT`` once.  Extraction worker processes import this
+    module before their initializer sets that limit.  The result is
+    cached, so a missing package is only looked up once.
+    """
+    try:
+        from tesserocr import PyTessBaseAPI
+    except ImportError:
+        return None
+    return PyTessBaseAPI
 
-    # --- All methods failed ---
 
-    logger.error(
-        "All extraction methods failed for %s (%d pages)", pdf_path.name, page_count
-    )
-    return ExtractionResult(
-        success=False,
-        method=ExtractionMethod.FAILED,
-        page_count=page_count,
-        error="all_methods_failed",
-    )
+class _TesserocrEngines:
+    """In-process Tesseract engines shared by the pages of one document.
+
+    Initializing Tesseract (loading the language model) is a large part of
+    OCR'ing a page, so an engine is created only when no idle one is
+    available -- at most one per concurrent OCR thread -- and reused for
+    later pages.  Requires tesserocr.
+    """
+
+    def __init__(self, lang: str) -> None:
+        self._api_class = _tesserocr_api_class()
+        self._lang = lang
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+        self._engines: list = []
+
+    def image_to_string(self, img) -> str:
+        """OCR one page image with an idle engine (thread-safe)."""
+        try:
+            api = self._idle.get_nowait()
+        except queue.Empty:
+            api = self._api_class(lang=self._lang)
+            self._engines.append(api)
+        try:
+            api.SetImage(img)
+            return api.GetUTF8Text()
+        finally:
+            self._idle.put(api)
+
+    def close(self) -> None:
+        """Release every engine; call once no page is being OCR'd."""
+        for api in self._engines:
+            api.End()
 
 
 def try_tesseract_direct(
     pdf_path: Path,
     settings: ExtractionSettings,
+    doc: pymupdf.Document | None = None,
+    dpi: int | None = None,
 ) -> ExtractionResult:
     """Last-resort OCR extraction using PyMuPDF pixmap rendering + pytesseract.
 
-    Renders each PDF page to a high-DPI PNG image using PyMuPDF, then runs
-    Tesseract OCR on each image. Pages are joined with markdown page separators.
+    Renders each PDF page to a high-DPI image using PyMuPDF, then runs
+    Tesseract OCR on each image, up to ``settings.ocr_workers`` pages at a
+    time. Pages are joined with markdown page separators in page order.
+
+    With ``settings.min_native_chars_per_page`` set, a page whose own text
+    layer is long enough and not garbled is used as-is instead of being
+    rendered and OCR'd.
+
+    When tesserocr is installed, Tesseract runs in-process and its engines
+    are reused across pages; otherwise pytesseract runs the tesseract
+    binary once per page.
 
     Args:
         pdf_path: Path to the PDF file.
         settings: Extraction configuration (ocr_dpi, ocr_language, tesseract_cmd).
+        doc: The PDF already open in PyMuPDF, if the caller has it (left
+            open); otherwise the file is opened and closed here.
+        dpi: Rendering resolution; defaults to ``settings.ocr_dpi``.
 
     Returns:
         ExtractionResult with OCR text on success, or with success=False
         and error message on failure.
     """
+    api_class = _tesserocr_api_class()
+    if Image is None or (api_class is None and pytesseract is None):
+        logger.warning(
+            "Tesseract extraction unavailable for %s: OCR packages not installed",
+            pdf_path.name,
+        )
+        return ExtractionResult(success=False, error="ocr_unavailable")
+
     try:
-        import pytesseract
-        from PIL import Image
+        if api_class is not None:
+            engines = _TesserocrEngines(settings.ocr_language)
+            ocr_image = engines.image_to_string
+        else:
+            engines = None
 
-        # Configure tesseract executable path if non-default
-        if settings.tesseract_cmd != "tesseract":
-            pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+            # Configure tesseract executable path if non-default
+            if settings.tesseract_cmd != "tesseract":
+                pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
 
-        doc = pymupdf.open(str(pdf_path))
-        all_pages_text: list[str] = []
+            def ocr_image(img: Image.Image) -> str:
+                return pytesseract.image_to_string(img, lang=settings.ocr_language)
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            # Render at configured DPI (default 300) for OCR quality
-            pix = page.get_pixmap(dpi=settings.ocr_dpi)
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
+        owns_doc = doc is None
+        if owns_doc:
+            doc = pymupdf.open(str(pdf_path), filetype="pdf")
+        all_pages_text: list[str] = []
+        # Meaningful characters, counted page by page as pages come in (the
+        # separators add none) instead of rescanning the joined document
+        char_count = 0
 
-            text = pytesseract.image_to_string(img, lang=settings.ocr_language)
+        def collect(item: Future[str] | str) -> None:
+            nonlocal char_count
+            text = item if isinstance(item, str) else item.result()
             if text and text.strip():
                 all_pages_text.append(text.strip())
-
-        doc.close()
+                char_count += count_meaningful_chars(all_pages_text[-1])
+
+        # Pages are rendered here (PyMuPDF is not thread-safe) and OCR'd on
+        # threads, each waiting on its own tesseract process.  A page is
+        # rendered while earlier ones are OCR'd, and at most ocr_workers
+        # pages are queued so rendered images do not pile up in memory.
+        workers = max(1, settings.ocr_workers)
+        pending: deque[Future[str] | str] = deque()
+        ocr_pages = native_pages = 0
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for page in doc:
+                # A page with a clean text layer of its own is not rendered
+                if settings.min_native_chars_per_page:
+                    native = page.get_text("text")
+                    if has_usable_page_text(native, settings):
+                        pending.append(native)
+                        native_pages += 1
+                        continue
+
+                # Render at configured DPI (default 300) for OCR quality, in
+                # grayscale (what Tesseract works on), and hand the raw
+                # samples to Pillow rather than round-tripping through PNG
+                pix = page.get_pixmap(
+                    dpi=dpi or settings.ocr_dpi,
+                    colorspace=pymupdf.csGRAY,
+                    alpha=False,
+                )
+                img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+                pending.append(pool.submit(ocr_image, img))
+                ocr_pages += 1
+                if len(pending) > workers:
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+        finally:
+            pool.shutdown(cancel_futures=True)
+            if engines is not None:
+                engines.close()
+            if owns_doc:
+                doc.close()
 
         md_text = "\n\n---\n\n".join(all_pages_text)
 
-        # Count meaningful characters (strip markdown syntax and whitespace)
-        clean_text = _SYNTAX_PATTERN.sub("", md_text)
-        char_count = len(clean_text)
-
         logger.info(
-            "Tesseract OCR extracted %d chars from %s", char_count, pdf_path.name
+            "Tesseract OCR extracted %d chars from %s "
+            "(%d pages OCR'd, %d from text layer)",
+            char_count,
+            pdf_path.name,
+            ocr_pages,
+            native_pages,
         )
 
         return ExtractionResult(
@@ -251,6 +484,8 @@ def try_tesseract_direct(
             markdown=md_text,
             method=ExtractionMethod.TESSERACT,
             char_count=char_count,
+            ocr_pages=ocr_pages,
+            native_pages=native_pages,
         )
 
     except Exception as e:
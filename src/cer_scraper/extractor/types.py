@@ -28,6 +28,9 @@ class ExtractionResult:
         page_count: Number of pages in the source PDF.
         char_count: Meaningful character count (excluding whitespace/syntax).
         error: Error description if extraction failed.
+        ocr_pages: Pages run through OCR (Tesseract only).
+        native_pages: Pages whose text layer was used in place of OCR
+            (Tesseract only).
     """
 
     success: bool
@@ -36,3 +39,5 @@ class ExtractionResult:
     page_count: int = 0
     char_count: int = 0
     error: str | None = None
+    ocr_pages: int = 0
+    native_pages: int = 0
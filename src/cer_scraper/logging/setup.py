@@ -4,15 +4,50 @@ This module configures Python's stdlib logging with two handlers:
     1. RotatingFileHandler -- JSON format, DEBUG level, 10MB rotation, 5 backups
     2. StreamHandler -- Text format, INFO level, for developer console
 
+Both handlers sit behind a QueueHandler/QueueListener pair, so calling
+code only enqueues records and the file/console I/O runs on a background
+thread.  The listener is flushed and stopped at interpreter exit.
+
 Call setup_logging() once at application startup, before any other code runs.
 Module code throughout the project should use logging.getLogger(__name__).
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 
-from pythonjsonlogger.json import JsonFormatter
+from pythonjsonlogger.orjson import OrjsonFormatter
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue that keeps ``exc_info`` intact.
+
+    The stock ``prepare()`` folds tracebacks into the message text so records
+    can be pickled; records here never leave the process, so the message is
+    merged with its args (on the calling thread) but exception info is left
+    for the JSON formatter to render as its own field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener feeding the real handlers; replaced on each setup call
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(
@@ -35,9 +70,20 @@ def setup_logging(
         max_bytes: Maximum size per log file before rotation (default 10MB).
         backup_count: Number of rotated backup files to keep (default 5).
     """
+    global _listener
+
     # Ensure log directory exists
     Path(log_dir).mkdir(parents=True, exist_ok=True)
 
+    # Drain and stop a listener left over from a previous call
+    _stop_listener()
+
+    # Neither formatter shows thread or process fields; skip collecting them
+    # for every LogRecord.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture everything; handlers filter
 
@@ -53,7 +99,9 @@ def setup_logging(
     )
     file_handler.setLevel(log_level_file)
 
-    json_formatter = JsonFormatter(
+    # orjson serializes each record about twice as fast as the stdlib json
+    # encoder (compact separators, UTF-8 kept as-is)
+    json_formatter = OrjsonFormatter(
         fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
         rename_fields={
             "asctime": "timestamp",
@@ -74,5 +122,18 @@ def setup_logging(
     )
     console_handler.setFormatter(text_formatter)
 
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Route records through an unbounded queue; the listener thread owns
+    # the real handlers and applies their individual levels.
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+
+
+atexit.register(_stop_listener)
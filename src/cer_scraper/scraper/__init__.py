@@ -31,7 +31,7 @@ from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
 
 from cer_scraper.config.settings import ScraperSettings
-from cer_scraper.db.models import Document, RunHistory
+from cer_scraper.db.models import RunHistory
 from cer_scraper.db.state import create_filing, filing_exists
 from cer_scraper.scraper.api_client import fetch_filings_from_api
 from cer_scraper.scraper.detail_scraper import enrich_filings_with_documents
@@ -240,7 +240,7 @@ def _persist_filing(
     Returns True on success, False on failure.
     """
     try:
-        db_filing = create_filing(
+        create_filing(
             session,
             filing_id=filing.filing_id,
             date=filing.date,
@@ -249,19 +249,16 @@ def _persist_filing(
             proceeding_number=filing.proceeding_number,
             title=filing.title,
             url=filing.url,
+            # Document records for each document URL, inserted in bulk
+            documents=[
+                {
+                    "document_url": doc.url,
+                    "filename": doc.filename,
+                    "content_type": doc.content_type,
+                }
+                for doc in filing.documents
+            ],
         )
-
-        # Create Document records for each document URL.
-        for doc in filing.documents:
-            document = Document(
-                filing_id=db_filing.id,
-                document_url=doc.url,
-                filename=doc.filename,
-                content_type=doc.content_type,
-            )
-            session.add(document)
-
-        session.commit()
         logger.debug(
             "Persisted filing %s with %d document(s)",
             filing.filing_id,
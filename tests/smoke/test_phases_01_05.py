@@ -46,6 +46,7 @@ from cer_scraper.config.settings import (
     ScraperSettings,
 )
 from cer_scraper.db import (
+    decompress_analysis,
     get_engine,
     get_session_factory,
     init_db,
@@ -568,7 +569,9 @@ def _verify_and_collect(session, evidence: SmokeEvidence) -> None:
     if filing.status_analyzed == "success" and filing.analysis_json:
         # Validate against AnalysisOutput schema
         try:
-            parsed = AnalysisOutput.model_validate_json(filing.analysis_json)
+            parsed = AnalysisOutput.model_validate_json(
+                decompress_analysis(filing)
+            )
             evidence.analysis_schema_valid = True
 
             # Extract classification details
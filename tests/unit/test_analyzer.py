@@ -0,0 +1,337 @@
+"""Unit tests for the analyzer package.
+
+Usage:
+    uv run python -m unittest tests.unit.test_analyzer
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from cer_scraper import analyzer
+from cer_scraper.analyzer.prompt import (
+    build_prompt,
+    build_prompt_parts,
+    get_json_schema_description,
+    load_prompt_template,
+)
+from cer_scraper.analyzer.schemas import AnalysisOutput
+from cer_scraper.analyzer.service import strip_code_fences
+from cer_scraper.analyzer.types import AnalysisResult
+from cer_scraper.config.settings import AnalysisSettings
+from cer_scraper.db.engine import get_engine, init_db
+from cer_scraper.db.models import Document, Filing
+
+_TEMPLATE_PATH = (
+    Path(__file__).resolve().parents[2] / "config" / "prompts" / "filing_analysis.txt"
+)
+
+# strip_code_fences as it was implemented before the end-checks rewrite
+_REFERENCE_FENCE_RE = re.compile(
+    r"^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$", re.DOTALL
+)
+
+
+def _reference_strip_code_fences(text: str) -> str:
+    text = text.strip()
+    match = _REFERENCE_FENCE_RE.match(text)
+    return match.group(1).strip() if match else text
+
+
+FILING = {
+    "filing_id": "C12345",
+    "filing_date": "2026-02-01",
+    "applicant": "NOVA Gas Transmission Ltd.",
+    "filing_type": "Application",
+    "num_documents": 3,
+    "num_missing": 1,
+    "json_schema_description": '{"summary": "..."}',
+    "analysis_date": "2026-02-16",
+}
+
+
+_ANALYSIS = AnalysisOutput.model_validate(
+    {
+        "summary": "Routine filing.",
+        "entities": [],
+        "relationships": [],
+        "classification": {
+            "primary_type": "Application",
+            "tags": [],
+            "confidence": 90,
+            "justification": "Requests approval.",
+        },
+        "key_facts": [],
+    }
+)
+
+
+def _success_result(filing_id: str) -> AnalysisResult:
+    return AnalysisResult(success=True, analysis=_ANALYSIS, cost_usd=0.01)
+
+
+class AnalyzeFilingsTests(unittest.TestCase):
+    """analyze_filings runs CLI calls on a pool and records every outcome."""
+
+    FILINGS = 2 * analyzer.COMMIT_BATCH_SIZE + 5
+    MAX_WORKERS = 2
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.engine = get_engine(os.path.join(tmp.name, "state.db"))
+        self.addCleanup(self.engine.dispose)
+        init_db(self.engine)
+        self.session = Session(self.engine)
+        self.addCleanup(self.session.close)
+
+        for i in range(self.FILINGS):
+            filing = Filing(filing_id=f"F{i:03d}", status_extracted="success")
+            filing.documents.append(
+                Document(
+                    document_url=f"https://example.com/{i}.pdf",
+                    filename=f"{i}.pdf",
+                    extraction_status="success",
+                    extracted_text=f"Extracted text of filing {i}",
+                    char_count=27,
+                )
+            )
+            self.session.add(filing)
+        self.session.commit()
+
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        # The first two calls only return once both are running
+        self.barrier = threading.Barrier(self.MAX_WORKERS, timeout=10)
+
+        self.commits = 0
+        event.listen(self.engine, "commit", self._count_commit)
+        self.addCleanup(event.remove, self.engine, "commit", self._count_commit)
+
+    def _count_commit(self, conn) -> None:
+        # Only the commits made while analyzing, not the setup's
+        if self.calls:
+            self.commits += 1
+
+    def _fake_analysis(self, *, filing_id: str, **_: object) -> AnalysisResult:
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if call <= self.MAX_WORKERS:
+                self.barrier.wait()
+            kind = int(filing_id[1:]) % 3
+            if kind == 0:
+                return _success_result(filing_id)
+            if kind == 1:
+                return AnalysisResult(
+                    success=False, error="cli_timeout", cost_usd=0.02
+                )
+            return AnalysisResult(success=False, error="insufficient_text")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def test_every_outcome_is_recorded_and_committed(self) -> None:
+        settings = AnalysisSettings(max_workers=self.MAX_WORKERS)
+        with (
+            mock.patch.object(analyzer, "analyze_filing_text", self._fake_analysis),
+            self.assertLogs(analyzer.logger, "WARNING"),
+        ):
+            batch = analyzer.analyze_filings(self.session, settings)
+
+        kinds = [i % 3 for i in range(self.FILINGS)]
+        self.assertEqual(self.calls, self.FILINGS)
+        self.assertEqual(self.max_active, self.MAX_WORKERS)
+        self.assertEqual(batch.filings_attempted, self.FILINGS)
+        self.assertEqual(batch.filings_succeeded, kinds.count(0))
+        self.assertEqual(batch.filings_failed, kinds.count(1))
+        self.assertEqual(batch.filings_skipped, kinds.count(2))
+        self.assertAlmostEqual(
+            batch.total_cost_usd, 0.01 * kinds.count(0) + 0.02 * kinds.count(1)
+        )
+        self.assertEqual(len(batch.errors), kinds.count(1))
+
+        # Status updates share a commit per COMMIT_BATCH_SIZE filings
+        self.assertEqual(
+            self.commits, self.FILINGS // analyzer.COMMIT_BATCH_SIZE + 1
+        )
+
+        # Read back on a separate session: everything was committed
+        with Session(self.engine) as check:
+            rows = check.execute(
+                select(
+                    Filing.filing_id,
+                    Filing.status_analyzed,
+                    Filing.error_message,
+                    Filing.analysis_json,
+                ).order_by(Filing.id)
+            ).all()
+        self.assertEqual(len(rows), self.FILINGS)
+        for kind, (filing_id, status, error, analysis_json) in zip(kinds, rows):
+            with self.subTest(filing_id=filing_id):
+                if kind == 1:
+                    self.assertEqual((status, error), ("failed", "cli_timeout"))
+                else:
+                    self.assertEqual((status, error), ("success", None))
+                self.assertEqual(analysis_json is not None, kind == 0)
+
+
+class ReadDocumentTextTests(unittest.TestCase):
+    """_read_document_text reads sidecar bodies and skips unusable ones."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.pdf_path = os.path.join(tmp.name, "doc.pdf")
+
+    def _document(self, sidecar: str | None) -> Document:
+        if sidecar is not None:
+            md_path = os.path.splitext(self.pdf_path)[0] + ".md"
+            with open(md_path, "w", encoding="utf-8") as f:
+                f.write(sidecar)
+        return Document(
+            document_url="https://example.com/doc.pdf", local_path=self.pdf_path
+        )
+
+    def test_reads_body_without_frontmatter(self) -> None:
+        doc = self._document("---\nsource: doc.pdf\n---\n# Body\n\nText\n")
+        self.assertEqual(analyzer._read_document_text(doc), "# Body\n\nText")
+
+    def test_extracted_text_column_takes_precedence(self) -> None:
+        doc = self._document("---\nsource: doc.pdf\n---\nSidecar\n")
+        doc.extracted_text = "Stored"
+        self.assertEqual(analyzer._read_document_text(doc), "Stored")
+
+    def test_missing_sidecar_is_skipped(self) -> None:
+        with self.assertLogs(analyzer.logger, "WARNING"):
+            self.assertIsNone(analyzer._read_document_text(self._document(None)))
+
+    def test_malformed_frontmatter_is_skipped(self) -> None:
+        doc = self._document("---\nsource: [doc.pdf\n---\nBody\n")
+        with self.assertLogs(analyzer.logger, "WARNING"):
+            self.assertIsNone(analyzer._read_document_text(doc))
+
+
+class BuildPromptPartsTests(unittest.TestCase):
+    """build_prompt_parts matches str.format around the document text."""
+
+    def assert_matches_format(self, template: str, **overrides: object) -> None:
+        values = {**FILING, **overrides}
+        document_text = "Page 1 of the filing {not a placeholder}"
+        prefix, suffix = build_prompt_parts(template, **values)
+        expected = template.format(document_text=document_text, **values)
+        self.assertEqual(prefix + document_text + suffix, expected)
+
+    def test_simple_template(self) -> None:
+        self.assert_matches_format(
+            "Filing {filing_id} by {applicant}:\n{document_text}\nEnd."
+        )
+
+    def test_escaped_braces_and_repeated_fields(self) -> None:
+        self.assert_matches_format(
+            '{{"id": "{filing_id}"}} {analysis_date} {{{filing_type}}}\n'
+            "{document_text}\n"
+            "before {analysis_date}, after {analysis_date} }}{{"
+        )
+
+    def test_document_text_at_the_edges(self) -> None:
+        prefix, suffix = build_prompt_parts("{document_text}", **FILING)
+        self.assertEqual((prefix, suffix), ("", ""))
+        self.assert_matches_format("{document_text} ({num_documents} docs)")
+        self.assert_matches_format("{num_missing} missing: {document_text}")
+
+    def test_braces_in_values_are_not_interpreted(self) -> None:
+        prefix, _ = build_prompt_parts(
+            "{applicant} / {filing_type}\n{document_text}",
+            **{**FILING, "applicant": "{filing_id}", "filing_type": "{{x}}"},
+        )
+        self.assertEqual(prefix, "{filing_id} / {{x}}\n")
+
+    def test_missing_metadata_defaults_to_unknown(self) -> None:
+        template = "{filing_date}|{applicant}|{filing_type}|{document_text}"
+        missing = {"filing_date": None, "applicant": "", "filing_type": None}
+        prefix, suffix = build_prompt_parts(template, **{**FILING, **missing})
+        self.assertEqual(prefix, "Unknown|Unknown|Unknown|")
+        self.assertEqual(suffix, "")
+
+    def test_document_text_must_appear_exactly_once(self) -> None:
+        for template in ("{filing_id}", "{document_text}{document_text}"):
+            with self.subTest(template=template):
+                with self.assertRaises(ValueError):
+                    build_prompt_parts(template, **FILING)
+
+    def test_unknown_placeholder_raises_key_error(self) -> None:
+        with self.assertRaises(KeyError):
+            build_prompt_parts("{document_text} {proceeding}", **FILING)
+
+    def test_shipped_template(self) -> None:
+        template, version_hash = load_prompt_template(_TEMPLATE_PATH)
+        self.assertRegex(version_hash, r"^[0-9a-f]{12}$")
+        schema = get_json_schema_description()
+        self.assert_matches_format(template, json_schema_description=schema)
+
+        prompt = build_prompt(
+            template,
+            document_text="BODY",
+            **{**FILING, "json_schema_description": schema},
+        )
+        self.assertEqual(prompt.count("BODY"), 1)
+        self.assertIn(schema, prompt)
+
+
+class StripCodeFencesTests(unittest.TestCase):
+    """strip_code_fences agrees with the original regex implementation."""
+
+    CASES = (
+        '{"a": 1}',
+        '  {"a": 1}\n',
+        '```json\n{"a": 1}\n```',
+        '```\n{"a": 1}\n```',
+        '```json{"a": 1}```',
+        '\n\n  ```json\n  {"a": 1}  \n  ```  \n',
+        '```json\n```',
+        "``````",
+        "````",
+        "```",
+        "",
+        "   ",
+        "```\njson\n```",
+        "```jsonx```",
+        "```JSON\n{}\n```",
+        '```json\n{"code": "```inner```"}\n```',
+        '```json\n{"a": 1}\n``` trailing',
+        'leading ```json\n{"a": 1}\n```',
+        '```json\n{"a": 1}',
+        '{"a": 1}\n```',
+        "```python\nprint(1)\n```",
+        '```json\r\n{"a": 1}\r\n```',
+        "```json\n" + '{"k": "' + "x" * 10_000 + '"}' + "\n```",
+    )
+
+    def test_matches_reference_implementation(self) -> None:
+        for text in self.CASES:
+            with self.subTest(text=text[:40]):
+                self.assertEqual(
+                    strip_code_fences(text), _reference_strip_code_fences(text)
+                )
+
+    def test_unwraps_json_fence(self) -> None:
+        self.assertEqual(strip_code_fences('```json\n{"a": 1}\n```\n'), '{"a": 1}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""Unit tests for the state database.
+
+Usage:
+    uv run python -m unittest tests.unit.test_db
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import Session
+
+from cer_scraper.db.engine import (
+    _encode_legacy_status_columns,
+    get_engine,
+    init_db,
+)
+from cer_scraper.db.models import STATUS_MAP, Filing, Status
+from cer_scraper.db.state import (
+    FILING_CHUNK_SIZE,
+    count_unprocessed_filings,
+    get_unprocessed_filings,
+)
+
+STEPS = ("scraped", "downloaded", "extracted", "analyzed", "emailed")
+
+
+class _DatabaseTestCase(unittest.TestCase):
+    """Fresh state database in a temporary directory."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.engine = get_engine(os.path.join(tmp.name, "state.db"))
+        self.addCleanup(self.engine.dispose)
+        init_db(self.engine)
+        self.session = Session(self.engine)
+        self.addCleanup(self.session.close)
+
+    def _raw_status(self, filing_id: str, step: str) -> object:
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text(f"SELECT status_{step} FROM filings WHERE filing_id = :f"),
+                {"f": filing_id},
+            ).scalar_one()
+
+
+class StatusCodeTests(_DatabaseTestCase):
+    """StatusCode stores SMALLINT codes and exposes status strings."""
+
+    def test_round_trip_for_every_status(self) -> None:
+        for name, code in STATUS_MAP.items():
+            filing = Filing(filing_id=f"F-{name}", status_scraped=name)
+            self.session.add(filing)
+            self.session.commit()
+
+            self.assertEqual(self._raw_status(f"F-{name}", "scraped"), int(code))
+            self.session.expire_all()
+            self.assertEqual(filing.status_scraped, name)
+
+    def test_default_is_pending(self) -> None:
+        self.session.add(Filing(filing_id="F1"))
+        self.session.commit()
+
+        self.assertEqual(self._raw_status("F1", "emailed"), Status.PENDING)
+
+    def test_query_filters_take_status_strings(self) -> None:
+        self.session.add_all(
+            [
+                Filing(filing_id="done", status_downloaded="success"),
+                Filing(filing_id="todo", status_downloaded="failed"),
+            ]
+        )
+        self.session.commit()
+
+        ids = self.session.scalars(
+            select(Filing.filing_id).where(Filing.status_downloaded != "success")
+        ).all()
+        self.assertEqual(ids, ["todo"])
+
+    def test_unknown_status_is_rejected(self) -> None:
+        self.session.add(Filing(filing_id="F1", status_scraped="done"))
+        with self.assertRaises(StatementError) as ctx:
+            self.session.commit()
+        self.assertIsInstance(ctx.exception.orig, ValueError)
+
+
+class LegacyStatusMigrationTests(_DatabaseTestCase):
+    """_encode_legacy_status_columns rewrites string statuses in place."""
+
+    def _insert_legacy_row(self, filing_id: str, statuses: dict[str, str]) -> None:
+        columns = ", ".join(f"status_{step}" for step in statuses)
+        params = ", ".join(f":{step}" for step in statuses)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    f"INSERT INTO filings (filing_id, retry_count, {columns}) "
+                    f"VALUES (:filing_id, 0, {params})"
+                ),
+                {"filing_id": filing_id, **statuses},
+            )
+
+    def test_string_statuses_become_codes(self) -> None:
+        statuses = dict(
+            zip(STEPS, ("success", "success", "failed", "skipped", "pending"))
+        )
+        self._insert_legacy_row("legacy", statuses)
+        self.assertEqual(self._raw_status("legacy", "scraped"), "success")
+
+        _encode_legacy_status_columns(self.engine)
+
+        for step, name in statuses.items():
+            self.assertEqual(self._raw_status("legacy", step), int(STATUS_MAP[name]))
+        filing = self.session.scalars(select(Filing)).one()
+        for step, name in statuses.items():
+            self.assertEqual(getattr(filing, f"status_{step}"), name)
+
+    def test_migration_leaves_codes_alone_and_is_repeatable(self) -> None:
+        self.session.add(Filing(filing_id="new", status_scraped="success"))
+        self.session.commit()
+        self._insert_legacy_row("legacy", {"scraped": "failed"})
+
+        _encode_legacy_status_columns(self.engine)
+        _encode_legacy_status_columns(self.engine)
+
+        self.assertEqual(self._raw_status("new", "scraped"), Status.SUCCESS)
+        self.assertEqual(self._raw_status("legacy", "scraped"), Status.FAILED)
+
+
+class FilingPagingTests(_DatabaseTestCase):
+    """get_unprocessed_filings pages through the queue in id order."""
+
+    def _add_filings(self, count: int) -> list[str]:
+        """Add *count* filings, some emailed and some out of retries.
+
+        Returns:
+            filing_ids of the filings still in the queue, in insert order.
+        """
+        queued = []
+        for i in range(count):
+            filing_id = f"F{i:04d}"
+            if i % 3 == 1:
+                filing = Filing(filing_id=filing_id, status_emailed="success")
+            elif i % 5 == 2:
+                filing = Filing(filing_id=filing_id, retry_count=3)
+            else:
+                filing = Filing(filing_id=filing_id)
+                queued.append(filing_id)
+            self.session.add(filing)
+        self.session.commit()
+        return queued
+
+    def _record_selects(self) -> list[str]:
+        """Collect every SELECT the engine runs from now on."""
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", record)
+        self.addCleanup(event.remove, self.engine, "before_cursor_execute", record)
+        return statements
+
+    def test_yields_every_queued_filing_across_chunks(self) -> None:
+        queued = self._add_filings(4 * FILING_CHUNK_SIZE + 50)
+        self.assertGreater(len(queued), 2 * FILING_CHUNK_SIZE)
+        self.assertEqual(count_unprocessed_filings(self.session), len(queued))
+        selects = self._record_selects()
+
+        ids = [f.filing_id for f in get_unprocessed_filings(self.session)]
+
+        self.assertEqual(ids, queued)
+        # One query per full chunk, plus the short (or empty) one that ends it
+        self.assertEqual(len(selects), len(queued) // FILING_CHUNK_SIZE + 1)
+
+    def test_exact_multiple_of_chunk_size(self) -> None:
+        self.session.add_all(
+            Filing(filing_id=f"F{i:04d}") for i in range(2 * FILING_CHUNK_SIZE)
+        )
+        self.session.commit()
+        selects = self._record_selects()
+
+        ids = [f.filing_id for f in get_unprocessed_filings(self.session)]
+
+        self.assertEqual(len(ids), 2 * FILING_CHUNK_SIZE)
+        self.assertEqual(len(set(ids)), len(ids))
+        # Two full chunks, then an empty one
+        self.assertEqual(len(selects), 3)
+
+    def test_small_chunk_size_and_retry_limit(self) -> None:
+        queued = self._add_filings(25)
+
+        ids = [
+            f.filing_id
+            for f in get_unprocessed_filings(
+                self.session, max_retries=3, chunk_size=4
+            )
+        ]
+        self.assertEqual(ids, queued)
+
+        # Raising the retry limit brings back the exhausted filings
+        everything = [
+            f.filing_id
+            for f in get_unprocessed_filings(
+                self.session, max_retries=4, chunk_size=4
+            )
+        ]
+        exhausted = [f"F{i:04d}" for i in range(25) if i % 3 != 1 and i % 5 == 2]
+        self.assertEqual(sorted(everything), sorted(queued + exhausted))
+
+    def test_filings_can_be_updated_while_iterating(self) -> None:
+        self._add_filings(FILING_CHUNK_SIZE + 10)
+
+        seen = []
+        for filing in get_unprocessed_filings(self.session, chunk_size=7):
+            seen.append(filing.filing_id)
+            filing.status_emailed = "success"
+            self.session.commit()
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(count_unprocessed_filings(self.session), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Unit tests for the single-PDF download service's retry behaviour.
+
+Usage:
+    uv run python -m unittest tests.unit.test_downloader_service
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import httpx
+
+from cer_scraper.config.settings import PipelineSettings
+from cer_scraper.downloader import service
+
+PDF_BODY = b"%PDF-1.7\n" + b"x" * 1000
+
+URL = "https://example.test/doc.pdf"
+
+
+def _pdf_response() -> httpx.Response:
+    return httpx.Response(
+        200, headers={"content-type": "application/pdf"}, content=PDF_BODY
+    )
+
+
+class DownloadRetryTests(unittest.TestCase):
+    """download_pdf retries transient failures through _download_with_retry."""
+
+    def setUp(self) -> None:
+        self.settings = PipelineSettings()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dest = Path(tmp.name) / "doc.pdf"
+
+        # Retry immediately instead of backing off
+        patcher = mock.patch.object(
+            service._download_with_retry.retry, "sleep", lambda _: None
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _download(self, handler) -> service.DownloadResult:
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            return service.download_pdf(URL, self.dest, self.settings, client)
+
+    def test_server_error_is_retried_three_times(self) -> None:
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(503)
+
+        result = self._download(handler)
+
+        self.assertEqual(len(attempts), 3)
+        self.assertFalse(result.success)
+        self.assertIn("after retries", result.error)
+        self.assertFalse(self.dest.exists())
+
+    def test_transport_error_is_retried_three_times(self) -> None:
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        result = self._download(handler)
+
+        self.assertEqual(len(attempts), 3)
+        self.assertFalse(result.success)
+
+    def test_success_after_transient_errors(self) -> None:
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) < 3:
+                return httpx.Response(502)
+            return _pdf_response()
+
+        result = self._download(handler)
+
+        self.assertEqual(len(attempts), 3)
+        self.assertTrue(result.success)
+        self.assertEqual(result.bytes_downloaded, len(PDF_BODY))
+        self.assertEqual(self.dest.read_bytes(), PDF_BODY)
+        self.assertFalse(self.dest.with_suffix(".pdf.tmp").exists())
+
+    def test_html_response_is_not_retried(self) -> None:
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html; charset=utf-8"},
+                content=b"<html></html>",
+            )
+
+        result = self._download(handler)
+
+        self.assertEqual(len(attempts), 1)
+        self.assertFalse(result.success)
+        self.assertIn("HTML", result.error)
+        self.assertFalse(self.dest.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Unit tests for the extractor package.
+
+Usage:
+    uv run python -m unittest tests.unit.test_extractor
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from cer_scraper.extractor import _init_worker, service
+from cer_scraper.extractor.pdfplumber_extractor import _table_to_markdown
+from cer_scraper.extractor.quality import _most_common_trigrams
+
+
+class TableToMarkdownTests(unittest.TestCase):
+    """_table_to_markdown renders pdfplumber rows as a pipe table."""
+
+    def test_basic_table(self) -> None:
+        table = [["Name", "Value"], ["a", "1"], ["b", "2"]]
+        self.assertEqual(
+            _table_to_markdown(table),
+            "| Name | Value |\n|---|---|\n| a | 1 |\n| b | 2 |",
+        )
+
+    def test_rows_are_fitted_to_header_width(self) -> None:
+        table = [["A", "B", "C"], ["1"], ["1", "2", "3", "4"]]
+        self.assertEqual(
+            _table_to_markdown(table),
+            "| A | B | C |\n|---|---|---|\n| 1 |  |  |\n| 1 | 2 | 3 |",
+        )
+
+    def test_cells_are_escaped_and_flattened(self) -> None:
+        table = [[None, "a|b"], ["line 1\nline 2", None]]
+        self.assertEqual(
+            _table_to_markdown(table),
+            "|  | a\\|b |\n|---|---|\n| line 1 line 2 |  |",
+        )
+
+    def test_every_row_is_one_line(self) -> None:
+        table = [["h\n1", "h2"], ["x\ny\nz", "|\n|"], ["", ""]]
+        markdown = _table_to_markdown(table)
+        self.assertEqual(len(markdown.splitlines()), len(table) + 1)
+
+    def test_degenerate_tables(self) -> None:
+        for table in ([], [["only", "header"]], [[], ["a", "b"]]):
+            with self.subTest(table=table):
+                self.assertIsNone(_table_to_markdown(table))
+
+
+class MostCommonTrigramsTests(unittest.TestCase):
+    """_most_common_trigrams agrees with a Counter over string slices."""
+
+    @staticmethod
+    def _counter(sample: str) -> Counter[str]:
+        return Counter(sample[i : i + 3] for i in range(len(sample) - 2))
+
+    def assert_matches_counter(self, sample: str, n: int) -> None:
+        counter = self._counter(sample)
+        result = _most_common_trigrams(sample, n)
+
+        # Ties may be ordered differently; counts and membership may not
+        self.assertEqual(
+            [count for _, count in result],
+            [count for _, count in counter.most_common(n)],
+        )
+        for trigram, count in result:
+            self.assertEqual(counter[trigram], count, trigram)
+        self.assertEqual(len({trigram for trigram, _ in result}), len(result))
+
+    def test_ascii_text(self) -> None:
+        sample = "the cat sat on the mat with the hat " * 20
+        self.assert_matches_counter(sample, 5)
+        self.assertEqual(_most_common_trigrams(sample, 1)[0][1], 80)
+
+    def test_shortest_sample(self) -> None:
+        self.assertEqual(_most_common_trigrams("abc", 3), [("abc", 1)])
+
+    def test_n_larger_than_distinct_trigrams(self) -> None:
+        self.assert_matches_counter("abcabcabd", 50)
+
+    def test_non_ascii_and_astral_characters(self) -> None:
+        sample = "Énergie 🛢️ pipeline — 能源 🛢️ — \x00\ufffd " * 7
+        self.assert_matches_counter(sample, 10)
+
+    def test_random_samples(self) -> None:
+        rng = random.Random(0)
+        alphabet = "ab \né中\U0001f600\U0010ffff"
+        for length in (3, 4, 10, 257, 2000):
+            sample = "".join(rng.choice(alphabet) for _ in range(length))
+            with self.subTest(length=length):
+                self.assert_matches_counter(sample, 10)
+
+
+def _tesserocr_thread_limit() -> str | None:
+    """Worker task: load tesserocr as the OCR tier does, report its view."""
+    return service._tesserocr_api_class().omp_thread_limit
+
+
+# Stand-in tesserocr recording the OpenMP limit in effect when it is loaded
+_RECORDING_TESSEROCR = """\
+import os
+
+
+class PyTessBaseAPI:
+    omp_thread_limit = os.environ.get("OMP_THREAD_LIMIT")
+"""
+
+
+class ExtractionWorkerTests(unittest.TestCase):
+    """Extraction worker processes limit OpenMP before Tesseract loads."""
+
+    def test_thread_limit_is_set_before_tesserocr_loads(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with open(os.path.join(tmp.name, "tesserocr.py"), "w") as f:
+            f.write(_RECORDING_TESSEROCR)
+        # Spawned workers start with the parent's sys.path
+        sys.path.insert(0, tmp.name)
+        self.addCleanup(sys.path.remove, tmp.name)
+
+        env = {k: v for k, v in os.environ.items() if k != "OMP_THREAD_LIMIT"}
+        mp_context = multiprocessing.get_context("spawn")
+        with (
+            mock.patch.dict(os.environ, env, clear=True),
+            ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(mp_context.Queue(), logging.WARNING),
+            ) as executor,
+        ):
+            limit = executor.submit(_tesserocr_thread_limit).result(timeout=60)
+
+        self.assertEqual(limit, "1")
+
+
+if __name__ == "__main__":
+    unittest.main()